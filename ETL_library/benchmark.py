@@ -0,0 +1,535 @@
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import openpyxl
+import pandas as pd
+from openpyxl.styles import Border, Side
+
+from extract import apply_dtype_backend, create_extractor, extract_many
+from transform import (
+    ColumnReorderer,
+    DuplicateRestorer,
+    DuplicateSuppressor,
+    EmptyspaceCleaner,
+    FieldMapper,
+    NormalizedKeyIndex,
+    Pipeline,
+    SectionExtractor,
+    StaticFieldAdder,
+    WhitespaceCleaner,
+    normalize_text_prefix
+)
+
+
+def create_sample_workbook(file_path: str, rows: int, cols: int = 20, header_row: int = 12) -> str:
+    """Buat workbook BoQ sintetis (header + data bergaris bawah) untuk benchmark."""
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    thin_bottom = Border(bottom=Side(style="thin"))
+
+    for col in range(1, cols + 1):
+        cell = ws.cell(row=header_row, column=col, value=f"Header {col}")
+        cell.border = thin_bottom
+
+    for row in range(header_row + 1, header_row + rows + 1):
+        for col in range(1, cols + 1):
+            value = f"Item {row}-{col}" if col % 3 else (row * col)
+            cell = ws.cell(row=row, column=col, value=value)
+            cell.border = thin_bottom
+
+    wb.save(file_path)
+    return file_path
+
+
+def create_sample_frame(rows: int, cols: int = 30, blank_ratio: float = 0.3, seed: int = 0) -> pd.DataFrame:
+    """Buat DataFrame campuran (teks, angka, None, string whitespace) seperti hasil ekstraksi BoQ."""
+    rng = np.random.default_rng(seed)
+    data = {}
+    for col in range(cols):
+        values = np.empty(rows, dtype=object)
+        if col % 3 == 0:
+            values[:] = rng.integers(0, 1000, rows)
+        else:
+            values[:] = [f"Item {i}" for i in range(rows)]
+        blanks = rng.random(rows) < blank_ratio
+        values[blanks] = rng.choice(np.array([None, "", "  "], dtype=object), blanks.sum())
+        data[f"Column {col + 1}"] = values
+    return pd.DataFrame(data)
+
+
+def time_call(func, repeat: int) -> float:
+    """Jalankan func sebanyak repeat kali dan kembalikan waktu tercepat (detik)."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def bench_extract(args):
+    """Bandingkan ExcelExtractor per-cell dengan mode streaming dan engine XML."""
+    file_path = args.file_path
+    if not file_path:
+        file_path = os.path.join(tempfile.gettempdir(), f"benchmark_boq_{args.rows}.xlsx")
+        print(f"Creating sample workbook with {args.rows} rows: {file_path}")
+        create_sample_workbook(file_path, rows=args.rows)
+
+    header_row = args.header_row if args.header_row is not None else 12
+    data_start_row = args.data_start_row if args.data_start_row is not None else header_row + 1
+
+    def run(streaming, engine="openpyxl"):
+        extractor = create_extractor(
+            file_path=file_path,
+            sheet_name=args.sheet_name,
+            header_row=header_row,
+            data_start_row=data_start_row,
+            data_end_row=args.data_end_row,
+            auto_detect_range=not args.disable_auto_detect,
+            streaming=streaming,
+            engine=engine
+        )
+        return extractor.extract()
+
+    df_cell, _ = run(False)
+    df_stream, _ = run(True)
+    df_xml, _ = run(False, engine="xml")
+    print(f"Shape per-cell: {df_cell.shape}, streaming: {df_stream.shape}, equal: {df_cell.equals(df_stream)}")
+    print(f"Shape xml: {df_xml.shape}, equal: {df_cell.equals(df_xml)}")
+
+    per_cell = time_call(lambda: run(False), args.repeat)
+    streaming = time_call(lambda: run(True), args.repeat)
+    xml = time_call(lambda: run(False, engine="xml"), args.repeat)
+    print(f"Per-cell : {per_cell:.3f}s")
+    print(f"Streaming: {streaming:.3f}s ({per_cell / streaming:.1f}x)")
+    print(f"XML      : {xml:.3f}s ({per_cell / xml:.1f}x)")
+
+
+def bench_extract_many(args):
+    """Bandingkan ekstraksi beberapa workbook secara serial dengan extract_many (process pool)."""
+    files = []
+    for index in range(args.files):
+        file_path = os.path.join(tempfile.gettempdir(), f"benchmark_boq_{args.rows}_{index}.xlsx")
+        if not os.path.exists(file_path):
+            print(f"Creating sample workbook with {args.rows} rows: {file_path}")
+            create_sample_workbook(file_path, rows=args.rows)
+        files.append(file_path)
+    
+    settings = {"header_row": 12, "data_start_row": 13, "streaming": args.streaming}
+    jobs = [(file_path, 0, settings) for file_path in files]
+    
+    serial = time_call(lambda: extract_many(jobs, max_workers=1), args.repeat)
+    parallel = time_call(lambda: extract_many(jobs, max_workers=args.workers), args.repeat)
+    print(f"Serial  : {serial:.3f}s ({args.files} files)")
+    print(f"Parallel: {parallel:.3f}s ({serial / parallel:.1f}x, workers: {args.workers or os.cpu_count()})")
+
+
+def legacy_whitespace_clean(df: pd.DataFrame, threshold: float) -> pd.DataFrame:
+    """Implementasi WhitespaceCleaner.clean sebelum vektorisasi (apply + generator per cell)."""
+    result_df = df.copy()
+    row_null_count = result_df.apply(
+        lambda row: row.isna().sum() + sum(1 for x in row if isinstance(x, str) and not x.strip()),
+        axis=1
+    )
+    result_df = result_df[row_null_count / len(result_df.columns) < threshold]
+    col_null_count = result_df.apply(
+        lambda col: col.isna().sum() + sum(1 for x in col if isinstance(x, str) and not x.strip()),
+        axis=0
+    )
+    result_df = result_df.loc[:, col_null_count / len(result_df) < threshold]
+    return result_df.reset_index(drop=True)
+
+
+def bench_whitespace(args):
+    """Bandingkan WhitespaceCleaner vektor dengan implementasi lama."""
+    df = create_sample_frame(args.rows, args.cols)
+    cleaner = WhitespaceCleaner(threshold=args.threshold)
+    
+    legacy_df = legacy_whitespace_clean(df, args.threshold)
+    new_df = cleaner.clean(df)
+    print(f"Frame: {df.shape}, result: {new_df.shape}, equal: {legacy_df.equals(new_df)}")
+    
+    legacy = time_call(lambda: legacy_whitespace_clean(df, args.threshold), args.repeat)
+    vectorized = time_call(lambda: cleaner.clean(df), args.repeat)
+    print(f"Legacy    : {legacy:.3f}s")
+    print(f"Vectorized: {vectorized:.3f}s ({legacy / vectorized:.1f}x)")
+
+
+def create_section_frame(rows: int, cols: int = 10, section_every: int = 20, seed: int = 0) -> pd.DataFrame:
+    """Buat DataFrame BoQ sintetis dengan baris section header setiap section_every baris."""
+    df = create_sample_frame(rows, cols, blank_ratio=0.05, seed=seed)
+    section_rows = np.arange(0, rows, section_every)
+    df.iloc[section_rows, :] = None
+    df.iloc[section_rows, 1] = [f"Section {i}" for i in range(len(section_rows))]
+    return df
+
+
+def legacy_section_extract(df: pd.DataFrame, indicator_col: str, target_col: str) -> pd.DataFrame:
+    """Implementasi SectionExtractor.extract sebelum vektorisasi (iterrows per baris)."""
+    result_df = df.copy()
+    result_df[target_col] = None
+    indicator_idx = df.columns.get_loc(indicator_col)
+    current_section = None
+    section_rows = []
+    for idx, row in result_df.iterrows():
+        value = row[indicator_col]
+        is_value_present = isinstance(value, str) and value.strip() != "" or (not pd.isna(value) and value is not None)
+        has_empty_surroundings = True
+        for neighbour in (indicator_idx - 1, indicator_idx + 1):
+            if 0 <= neighbour < len(row):
+                other = row.iloc[neighbour]
+                if isinstance(other, str) and other.strip() != "" or (not pd.isna(other) and other is not None):
+                    has_empty_surroundings = False
+        empty_cell_count = sum(1 for x in row if pd.isna(x) or (isinstance(x, str) and not x.strip()))
+        if is_value_present and has_empty_surroundings and empty_cell_count >= len(row) * 0.7:
+            current_section = value
+            section_rows.append(idx)
+        result_df.at[idx, target_col] = current_section
+    return result_df.drop(section_rows).reset_index(drop=True)
+
+
+def bench_section(args):
+    """Bandingkan SectionExtractor vektor dengan implementasi iterrows lama."""
+    for rows in args.rows:
+        df = create_section_frame(rows)
+        indicator_col = df.columns[1]
+        extractor = SectionExtractor(indicator_col, "Item")
+        
+        vectorized = time_call(lambda: extractor.extract(df), args.repeat)
+        line = f"{rows:>7} rows | vectorized: {vectorized:.3f}s"
+        if not args.skip_legacy:
+            equal = legacy_section_extract(df, indicator_col, "Item").equals(extractor.extract(df))
+            legacy = time_call(lambda: legacy_section_extract(df, indicator_col, "Item"), args.repeat)
+            line += f" | legacy: {legacy:.3f}s ({legacy / vectorized:.1f}x, equal: {equal})"
+        print(line)
+
+
+def create_bom_frame(rows: int, lines_per_product: int = 5, seed: int = 0) -> pd.DataFrame:
+    """Buat DataFrame BoM sintetis: beberapa baris komponen per produk."""
+    rng = np.random.default_rng(seed)
+    products = np.arange(rows) // lines_per_product
+    return pd.DataFrame({
+        "Product": [f"Product {p}" for p in products],
+        "Quantity": np.ones(rows),
+        "Sequence": products,
+        "Company": "Company",
+        "Component": [f"Component {i}" for i in rng.integers(0, 1000, rows)]
+    })
+
+
+def legacy_duplicate_suppress(df: pd.DataFrame, columns: list, group_by: list, replacement_value="") -> pd.DataFrame:
+    """
+    Implementasi DuplicateSuppressor.transform sebelum vektorisasi (iloc per baris, tanpa pemulihan dtype).
+    
+    Perbandingan dibaca dari salinan data asli; implementasi lama membaca baris sebelumnya yang sudah
+    di-suppress sehingga duplikat hanya dikosongkan selang-seling.
+    """
+    result_df = df.sort_values(by=group_by).reset_index(drop=True)
+    original = result_df.copy()
+    for idx in range(1, len(result_df)):
+        same_group = True
+        for col in group_by:
+            current_val = original.iloc[idx][col]
+            prev_val = original.iloc[idx - 1][col]
+            if pd.isna(current_val) and pd.isna(prev_val):
+                continue
+            if pd.isna(current_val) or pd.isna(prev_val) or current_val != prev_val:
+                same_group = False
+                break
+        if same_group:
+            for col in columns:
+                current_val = original.iloc[idx][col]
+                prev_val = original.iloc[idx - 1][col]
+                if pd.isna(current_val) or pd.isna(prev_val) or current_val != prev_val:
+                    continue
+                result_df.iloc[idx, result_df.columns.get_loc(col)] = replacement_value
+    return result_df
+
+
+def bench_suppress(args):
+    """Bandingkan DuplicateSuppressor vektor dengan implementasi iloc per baris lama."""
+    columns = ["Quantity", "Sequence", "Company"]
+    group_by = ["Product"]
+    for rows in args.rows:
+        df = create_bom_frame(rows)
+        suppressor = DuplicateSuppressor(columns, group_by=group_by, replacement_value=None)
+        
+        vectorized = time_call(lambda: suppressor.transform(df), args.repeat)
+        line = f"{rows:>7} rows | vectorized: {vectorized:.3f}s"
+        if not args.skip_legacy:
+            legacy_df = legacy_duplicate_suppress(df, columns, group_by, replacement_value=None)
+            equal = legacy_df.astype(object).equals(suppressor.transform(df).astype(object))
+            legacy = time_call(lambda: legacy_duplicate_suppress(df, columns, group_by, replacement_value=None), args.repeat)
+            line += f" | legacy: {legacy:.3f}s ({legacy / vectorized:.1f}x, equal: {equal})"
+        print(line)
+
+
+def create_so_frame(rows: int, lines_per_product: int = 5, seed: int = 0) -> pd.DataFrame:
+    """Buat DataFrame SO sintetis: Product/Unit of Measure hanya terisi di baris pertama tiap produk."""
+    df = create_bom_frame(rows, lines_per_product, seed)
+    first_line = np.arange(rows) % lines_per_product == 0
+    df["Unit of Measure"] = np.where(first_line, "Unit", "")
+    df["Product"] = df["Product"].where(first_line, None)
+    return df
+
+
+def legacy_duplicate_restore(df: pd.DataFrame, columns: list, group_by: list = None) -> pd.DataFrame:
+    """Implementasi DuplicateRestorer.transform sebelum vektorisasi (at/iloc per cell)."""
+    result_df = df.copy()
+    if group_by:
+        result_df = result_df.sort_values(by=group_by).reset_index(drop=True)
+    
+    def is_empty(val):
+        return pd.isna(val) or (isinstance(val, str) and val.strip() == "")
+    
+    if group_by:
+        for _, group_df in result_df.groupby(group_by):
+            for col in columns:
+                last_value = next((result_df.at[idx, col] for idx in group_df.index
+                                   if not is_empty(result_df.at[idx, col])), None)
+                if last_value is None:
+                    continue
+                for idx in group_df.index:
+                    if is_empty(result_df.at[idx, col]):
+                        result_df.at[idx, col] = last_value
+                    else:
+                        last_value = result_df.at[idx, col]
+    else:
+        for col in columns:
+            change_indices = [0]
+            prev_non_null = None
+            for idx in range(len(result_df)):
+                val = result_df.iloc[idx][col]
+                if not is_empty(val):
+                    if prev_non_null is not None and val != prev_non_null:
+                        change_indices.append(idx)
+                    prev_non_null = val
+            if prev_non_null is None:
+                continue
+            change_indices.append(len(result_df))
+            for start_idx, end_idx in zip(change_indices, change_indices[1:]):
+                first_value = next((result_df.iloc[idx][col] for idx in range(start_idx, end_idx)
+                                    if not is_empty(result_df.iloc[idx][col])), None)
+                if first_value is None:
+                    continue
+                for idx in range(start_idx, end_idx):
+                    if is_empty(result_df.iloc[idx][col]):
+                        result_df.iloc[idx, result_df.columns.get_loc(col)] = first_value
+    return result_df
+
+
+def bench_restore(args):
+    """Bandingkan DuplicateRestorer vektor dengan implementasi per cell lama (tanpa group_by, seperti df_base)."""
+    columns = ["Product", "Unit of Measure"]
+    for rows in args.rows:
+        df = create_so_frame(rows)
+        restorer = DuplicateRestorer(columns)
+        
+        vectorized = time_call(lambda: restorer.transform(df), args.repeat)
+        line = f"{rows:>7} rows | vectorized: {vectorized:.3f}s"
+        if not args.skip_legacy:
+            equal = legacy_duplicate_restore(df, columns).equals(restorer.transform(df))
+            legacy = time_call(lambda: legacy_duplicate_restore(df, columns), args.repeat)
+            line += f" | legacy: {legacy:.3f}s ({legacy / vectorized:.1f}x, equal: {equal})"
+        print(line)
+
+
+def bench_pipeline(args):
+    """Bandingkan rangkaian transformer biasa (salinan per langkah) dengan Pipeline (satu salinan)."""
+    df = create_section_frame(args.rows, cols=args.cols)
+    indicator_col = df.columns[1]
+    
+    def make_steps():
+        return [
+            WhitespaceCleaner(threshold=0.9),
+            SectionExtractor(indicator_col, "Item"),
+            EmptyspaceCleaner(indicator_col),
+            DuplicateRestorer(df.columns[0]),
+            StaticFieldAdder({"Company": "Company"}),
+            ColumnReorderer(["Item"])
+        ]
+    
+    def run_chained():
+        result_df = df
+        for step in make_steps():
+            method = getattr(step, Pipeline._step_method_name(step))
+            result_df = method(result_df)
+        return result_df
+    
+    def run_pipeline():
+        return Pipeline(make_steps(), track_memory=False).run(df)
+    
+    def peak_mb(func):
+        tracemalloc.start()
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return peak / (1024 * 1024)
+    
+    print(f"Frame: {df.shape}, equal: {run_chained().equals(run_pipeline())}")
+    chained = time_call(run_chained, args.repeat)
+    fused = time_call(run_pipeline, args.repeat)
+    print(f"Chained : {chained:.3f}s, peak {peak_mb(run_chained):.1f} MB")
+    print(f"Pipeline: {fused:.3f}s, peak {peak_mb(run_pipeline):.1f} MB")
+    
+    pipeline = Pipeline(make_steps(), track_memory=True)
+    pipeline.run(df)
+    print(pipeline.format_report())
+
+
+def bench_mapper(args):
+    """Bandingkan FieldMapper dengan callable (apply per elemen) dan transformasi bernama (per kolom)."""
+    df = create_sample_frame(args.rows, cols=3, blank_ratio=0.1)
+    mapping = {"Column 1": "Qty", "Column 2": "Name", "Column 3": "UoM"}
+    
+    def strip_prefix(value):
+        if pd.isna(value):
+            return value
+        text = str(value).strip()
+        return text if text.startswith("V - ") else "V - " + text
+    
+    applied = FieldMapper(mapping, {
+        "Qty": lambda value: pd.to_numeric(value, errors="coerce"),
+        "Name": strip_prefix,
+        "UoM": lambda value: value.upper() if isinstance(value, str) else value
+    })
+    named = FieldMapper(mapping, {"Qty": "numeric", "Name": ["strip", "prefix:V - "], "UoM": "upper"})
+    
+    equal = applied.map_fields(df).equals(named.map_fields(df))
+    apply_time = time_call(lambda: applied.map_fields(df), args.repeat)
+    named_time = time_call(lambda: named.map_fields(df), args.repeat)
+    print(f"Frame: {df.shape}, equal: {equal}, fallback columns: {applied.fallback_columns}")
+    print(f"Apply : {apply_time:.3f}s")
+    print(f"Named : {named_time:.3f}s ({apply_time / named_time:.1f}x)")
+
+
+def create_description_frame(rows: int, cols: int = 4, seed: int = 0) -> pd.DataFrame:
+    """Buat DataFrame yang didominasi kolom deskripsi teks panjang (dengan NA dan string kosong)."""
+    rng = np.random.default_rng(seed)
+    words = np.array(["Kabel", "NYY", "3x2.5mm", "Instalasi", "Panel", "MCB", "Schneider", "Pipa", "Conduit", "20mm"])
+    data = {"Qty": rng.integers(1, 100, rows)}
+    for col in range(cols):
+        values = np.array(
+            [" ".join(rng.choice(words, 6)) + f" {i}" for i in range(rows)],
+            dtype=object
+        )
+        blanks = rng.random(rows) < 0.1
+        values[blanks] = rng.choice(np.array([None, "", "  "], dtype=object), blanks.sum())
+        data[f"Description {col + 1}"] = values
+    return pd.DataFrame(data)
+
+
+def bench_arrow(args):
+    """Bandingkan memori dan waktu operasi teks pada kolom object vs string[pyarrow]."""
+    object_df = create_description_frame(args.rows)
+    arrow_df = apply_dtype_backend(object_df.copy(), "pyarrow")
+    mapper = FieldMapper(
+        {"Description 1": "Name", "Description 2": "UoM"},
+        {"Name": ["strip", "prefix:V - "], "UoM": "upper"}
+    )
+    operations = {
+        "WhitespaceCleaner": lambda df: WhitespaceCleaner(threshold=0.5).clean(df),
+        "EmptyspaceCleaner": lambda df: EmptyspaceCleaner(["Description 1", "Description 2"]).clean(df),
+        "normalize_text_prefix": lambda df: normalize_text_prefix(df["Description 1"], "V - ", strip=True),
+        "NormalizedKeyIndex": lambda df: NormalizedKeyIndex(df["Description 1"]).codes,
+        "FieldMapper": lambda df: mapper.map_fields(df)
+    }
+    
+    def as_object(result):
+        # Samakan representasi (object, NA -> None) agar hasil kedua mode bisa dibandingkan
+        if isinstance(result, np.ndarray):
+            return pd.Series(result)
+        return result.astype(object).where(result.notna(), None)
+    
+    object_mb = object_df.memory_usage(deep=True).sum() / 1024 ** 2
+    arrow_mb = arrow_df.memory_usage(deep=True).sum() / 1024 ** 2
+    print(f"Frame: {object_df.shape}")
+    print(f"Memory object : {object_mb:.1f} MB")
+    print(f"Memory arrow  : {arrow_mb:.1f} MB ({object_mb / arrow_mb:.1f}x)")
+    for name, operation in operations.items():
+        equal = as_object(operation(object_df)).equals(as_object(operation(arrow_df)))
+        object_time = time_call(lambda: operation(object_df), args.repeat)
+        arrow_time = time_call(lambda: operation(arrow_df), args.repeat)
+        print(f"{name:22s}: object {object_time:.3f}s, arrow {arrow_time:.3f}s "
+              f"({object_time / arrow_time:.1f}x), equal: {equal}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ETL components")
+    subparsers = parser.add_subparsers(dest="component", required=True)
+
+    extract_parser = subparsers.add_parser("extract", help="Benchmark ExcelExtractor")
+    extract_parser.add_argument("--file-path", help="Path to Excel file (default: generated sample)")
+    extract_parser.add_argument("--rows", type=int, default=5000, help="Rows for generated sample (default: 5000)")
+    extract_parser.add_argument("--sheet-name", default=0, help="Sheet name or index (default: 0)")
+    extract_parser.add_argument("--header-row", type=int, help="Header row (1-based, default: 12)")
+    extract_parser.add_argument("--data-start-row", type=int, help="Data start row (1-based)")
+    extract_parser.add_argument("--data-end-row", type=int, help="Data end row (1-based)")
+    extract_parser.add_argument("--disable-auto-detect", action="store_true",
+                                help="Disable automatic detection of data range using borders")
+    extract_parser.add_argument("--repeat", type=int, default=3, help="Number of repetitions (default: 3)")
+    extract_parser.set_defaults(func=bench_extract)
+
+    many_parser = subparsers.add_parser("extract-many", help="Benchmark extract_many (process pool)")
+    many_parser.add_argument("--files", type=int, default=4, help="Number of generated workbooks (default: 4)")
+    many_parser.add_argument("--rows", type=int, default=5000, help="Rows per generated workbook (default: 5000)")
+    many_parser.add_argument("--workers", type=int, help="Number of worker processes (default: CPU count)")
+    many_parser.add_argument("--streaming", action="store_true", help="Use streaming read-only mode")
+    many_parser.add_argument("--repeat", type=int, default=3, help="Number of repetitions (default: 3)")
+    many_parser.set_defaults(func=bench_extract_many)
+
+    whitespace_parser = subparsers.add_parser("whitespace", help="Benchmark WhitespaceCleaner")
+    whitespace_parser.add_argument("--rows", type=int, default=50000, help="Rows in generated frame (default: 50000)")
+    whitespace_parser.add_argument("--cols", type=int, default=30, help="Columns in generated frame (default: 30)")
+    whitespace_parser.add_argument("--threshold", type=float, default=0.5, help="Cleaner threshold (default: 0.5)")
+    whitespace_parser.add_argument("--repeat", type=int, default=3, help="Number of repetitions (default: 3)")
+    whitespace_parser.set_defaults(func=bench_whitespace)
+
+    section_parser = subparsers.add_parser("section", help="Benchmark SectionExtractor")
+    section_parser.add_argument("--rows", type=int, nargs="+", default=[10000, 100000],
+                                help="Row counts to benchmark (default: 10000 100000)")
+    section_parser.add_argument("--skip-legacy", action="store_true", help="Only time the vectorized implementation")
+    section_parser.add_argument("--repeat", type=int, default=1, help="Number of repetitions (default: 1)")
+    section_parser.set_defaults(func=bench_section)
+
+    suppress_parser = subparsers.add_parser("suppress", help="Benchmark DuplicateSuppressor")
+    suppress_parser.add_argument("--rows", type=int, nargs="+", default=[10000, 100000],
+                                 help="Row counts to benchmark (default: 10000 100000)")
+    suppress_parser.add_argument("--skip-legacy", action="store_true", help="Only time the vectorized implementation")
+    suppress_parser.add_argument("--repeat", type=int, default=1, help="Number of repetitions (default: 1)")
+    suppress_parser.set_defaults(func=bench_suppress)
+
+    restore_parser = subparsers.add_parser("restore", help="Benchmark DuplicateRestorer")
+    restore_parser.add_argument("--rows", type=int, nargs="+", default=[10000, 100000],
+                                help="Row counts to benchmark (default: 10000 100000)")
+    restore_parser.add_argument("--skip-legacy", action="store_true", help="Only time the vectorized implementation")
+    restore_parser.add_argument("--repeat", type=int, default=1, help="Number of repetitions (default: 1)")
+    restore_parser.set_defaults(func=bench_restore)
+
+    pipeline_parser = subparsers.add_parser("pipeline", help="Benchmark Pipeline vs chained transformers")
+    pipeline_parser.add_argument("--rows", type=int, default=100000, help="Rows in generated frame (default: 100000)")
+    pipeline_parser.add_argument("--cols", type=int, default=30, help="Columns in generated frame (default: 30)")
+    pipeline_parser.add_argument("--repeat", type=int, default=3, help="Number of repetitions (default: 3)")
+    pipeline_parser.set_defaults(func=bench_pipeline)
+
+    mapper_parser = subparsers.add_parser("mapper", help="Benchmark FieldMapper transforms")
+    mapper_parser.add_argument("--rows", type=int, default=100000, help="Rows in generated frame (default: 100000)")
+    mapper_parser.add_argument("--repeat", type=int, default=3, help="Number of repetitions (default: 3)")
+    mapper_parser.set_defaults(func=bench_mapper)
+
+    arrow_parser = subparsers.add_parser("arrow", help="Benchmark object vs string[pyarrow] columns")
+    arrow_parser.add_argument("--rows", type=int, default=200000, help="Rows in generated frame (default: 200000)")
+    arrow_parser.add_argument("--repeat", type=int, default=3, help="Number of repetitions (default: 3)")
+    arrow_parser.set_defaults(func=bench_arrow)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
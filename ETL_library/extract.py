@@ -1,6 +1,153 @@
 import pandas as pd
+import numpy as np
 import openpyxl
-from typing import Union, Optional, Tuple, List, Dict, Any
+import csv
+import hashlib
+import io
+import json
+import os
+import pickle
+import posixpath
+import threading
+import time
+import zipfile
+from concurrent.futures import Executor, ProcessPoolExecutor
+from xml.etree.ElementTree import iterparse, parse as parse_xml
+from openpyxl.reader.strings import read_string_table
+from openpyxl.styles.numbers import BUILTIN_FORMATS, is_date_format, is_timedelta_format
+from openpyxl.utils.cell import column_index_from_string, coordinate_to_tuple
+from openpyxl.utils.datetime import CALENDAR_MAC_1904, CALENDAR_WINDOWS_1900, from_excel, from_ISO8601
+from typing import Union, Optional, Tuple, List, Dict, Any, BinaryIO, Iterator
+
+
+ExcelSource = Union[str, os.PathLike, bytes, BinaryIO]
+
+
+def _open_source(source: ExcelSource):
+    """
+    Siapkan sumber file untuk dibaca: path dan file-like (mis. UploadedFile Streamlit)
+    dipakai apa adanya, bytes dibungkus BytesIO sehingga tidak perlu file sementara.
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return io.BytesIO(source)
+    if hasattr(source, "seek"):
+        source.seek(0)
+    return source
+
+
+def _read_source_bytes(source: ExcelSource) -> bytes:
+    """Baca seluruh isi sumber (path, bytes, atau file-like) sebagai bytes."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return bytes(source)
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            return f.read()
+    if hasattr(source, "getvalue"):
+        return source.getvalue()
+    source.seek(0)
+    return source.read()
+
+
+def _cell_bottom_borders(sheet, max_row: int, max_col: int) -> Dict[int, List[int]]:
+    """Scan bottom border per sel (sheet.cell) untuk grid max_row x max_col, seperti versi lama."""
+    rows_with_bottom_border = {}
+    for row in range(1, max_row + 1):
+        border_cols = []
+        for col in range(1, max_col + 1):
+            border = sheet.cell(row=row, column=col).border
+            if border and border.bottom and border.bottom.style:
+                border_cols.append(col)
+        if border_cols:
+            rows_with_bottom_border[row] = border_cols
+    return rows_with_bottom_border
+
+
+DTYPE_BACKENDS = (None, "pyarrow")
+
+
+def apply_dtype_backend(df: pd.DataFrame, dtype_backend: Optional[str] = None) -> pd.DataFrame:
+    """
+    Terapkan dtype_backend pada hasil ekstraksi (in-place, DataFrame yang sama dikembalikan).
+    
+    Dengan "pyarrow", kolom object yang semua nilainya string (NA diabaikan) diubah menjadi
+    string[pyarrow]; operasi .str pada kolom ini dijalankan oleh kernel pyarrow.compute
+    dan datanya disimpan sebagai buffer Arrow, bukan objek str Python per cell.
+    Kolom campuran (mis. angka dan teks) dan kolom kosong tetap object.
+    pyarrow baru di-import saat mode ini dipakai.
+    """
+    if dtype_backend not in DTYPE_BACKENDS:
+        raise ValueError(f"Unsupported dtype_backend: {dtype_backend}. Choose from: None, pyarrow")
+    if dtype_backend is None:
+        return df
+    
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as exc:
+        raise ImportError("dtype_backend='pyarrow' requires the pyarrow package") from exc
+    
+    string_dtype = pd.StringDtype("pyarrow")
+    for position, dtype in enumerate(df.dtypes):
+        if dtype == object and pd.api.types.infer_dtype(df.iloc[:, position], skipna=True) == "string":
+            df.isetitem(position, df.iloc[:, position].astype(string_dtype))
+    return df
+
+
+def to_object_backend(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Kebalikan apply_dtype_backend(df, "pyarrow") (in-place, DataFrame yang sama dikembalikan).
+    
+    Kolom StringDtype dikembalikan ke object dengan None untuk cell kosong, sama seperti
+    hasil ekstraksi Excel tanpa dtype_backend. Dipakai sebelum data masuk ke kode yang
+    mengurutkan dengan sort default (quicksort, tidak stabil): urutan baris dengan kunci
+    sama bisa berbeda antara kolom object dan string[pyarrow].
+    """
+    for position, dtype in enumerate(df.dtypes):
+        if isinstance(dtype, pd.StringDtype):
+            values = df.iloc[:, position].to_numpy(dtype=object, na_value=None)
+            df.isetitem(position, pd.Series(values, index=df.index, dtype=object))
+    return df
+
+
+def text_na_kind(series: pd.Series) -> Optional[str]:
+    """
+    Jenis NA di kolom object berisi teks: "none" atau "nan" (Arrow hanya punya satu null).
+    None jika kolom bukan teks/NA saja atau NA-nya campuran, sehingga tidak bisa disimpan di Arrow.
+    """
+    if pd.api.types.infer_dtype(series, skipna=True) not in ("string", "empty"):
+        return None
+    values = series.to_numpy()
+    na_kinds = {type(value) for value in values[pd.isna(values)]}
+    if na_kinds <= {type(None)}:
+        return "none"
+    if na_kinds == {float}:
+        return "nan"
+    return None
+
+
+def is_arrow_column(series: pd.Series) -> bool:
+    """
+    Kolom boleh disimpan di Arrow/Parquet jika nilainya kembali persis sama saat dibaca:
+    kolom bertipe (angka, tanggal, string) dan kolom object yang isinya hanya teks/NA.
+    Kolom object lain (mis. [1, None, 2] yang akan terbaca sebagai float64) harus di-pickle.
+    """
+    import pyarrow as pa
+    
+    if series.dtype == object:
+        return text_na_kind(series) is not None
+    try:
+        pa.array(series, from_pandas=True)
+        return True
+    except (pa.ArrowException, TypeError, ValueError):
+        return False
+
+
+def restore_text_na(series: pd.Series, na_kind: Optional[str]) -> pd.Series:
+    """Null Arrow dibaca sebagai None; kolom teks yang aslinya berisi NaN dikembalikan ke NaN."""
+    if na_kind != "nan":
+        return series
+    text = series.to_numpy(dtype=object, copy=True)
+    text[pd.isna(text)] = np.nan
+    return pd.Series(text, index=series.index, dtype=object)
 
 
 class ExcelExtractor:
@@ -11,15 +158,20 @@ class ExcelExtractor:
     
     def __init__(
         self,
-        file_path: str,
+        file_path: ExcelSource,
         sheet_name: Union[str, int] = 0,
         header_row: Optional[int] = None,
         data_start_row: Optional[int] = None,
         data_end_row: Optional[int] = None,
         header_start_col: Optional[int] = None,
         header_end_col: Optional[int] = None,
-        auto_detect_range: bool = True
+        auto_detect_range: bool = True,
+        streaming: bool = False,
+        trim_to_used_range: bool = False,
+        dtype_backend: Optional[str] = None
     ):
+        if dtype_backend not in DTYPE_BACKENDS:
+            raise ValueError(f"Unsupported dtype_backend: {dtype_backend}. Choose from: None, pyarrow")
         self.file_path = file_path
         self.sheet_name = sheet_name
         self.header_row = header_row
@@ -28,22 +180,80 @@ class ExcelExtractor:
         self.header_start_col = header_start_col
         self.header_end_col = header_end_col
         self.auto_detect_range = auto_detect_range
+        self.streaming = streaming
+        self.trim_to_used_range = trim_to_used_range
+        self.dtype_backend = dtype_backend
         self.workbook = None
         self.sheet = None
         self.border_info = {}
+        self._layout = None
+        self._default_bottom_border = False
+    
+    def _open_workbook(self):
+        """Buka workbook tanpa memilih sheet."""
+        # Mode streaming membuka workbook read-only sehingga sel dibaca langsung dari XML
+        self.workbook = openpyxl.load_workbook(_open_source(self.file_path), data_only=True, read_only=self.streaming)
     
     def _load_workbook(self):
         """Load workbook and sheet."""
-        self.workbook = openpyxl.load_workbook(self.file_path, data_only=True)
+        if self.workbook is None:
+            self._open_workbook()
         self.sheet = self.workbook[self.sheet_name] if isinstance(self.sheet_name, str) else self.workbook.worksheets[self.sheet_name]
+        
+        # Sheet read-only tanpa tag <dimension> tidak punya max_row/max_column
+        if self.streaming and (self.sheet.max_row is None or self.sheet.max_column is None):
+            self.sheet.calculate_dimension(force=True)
+    
+    def list_sheets(self) -> List[str]:
+        """
+        Daftar nama sheet. Jika workbook sudah dibuka, handle yang sama dengan extract()
+        dipakai; jika belum, cukup workbook.xml yang dibaca lewat list_sheet_names().
+        """
+        if self.workbook is None:
+            return list_sheet_names(self.file_path)
+        return self.workbook.sheetnames
+    
+    def _close_workbook(self):
+        """Tutup workbook read-only yang menahan handle file."""
+        if self.streaming and self.workbook is not None:
+            self.workbook.close()
+            self.workbook = None
+            self.sheet = None
+    
+    def _sheet_dimensions(self) -> Tuple[int, int]:
+        """Return (max_row, max_col) dari sheet."""
+        return self.sheet.max_row, self.sheet.max_column
+    
+    def _sheet_layout(self) -> Tuple[Dict[int, List[int]], Tuple[int, int]]:
+        """Border rows dan used range dari satu pass XML sheet (di-cache per extractor)."""
+        if self._layout is None:
+            package = _XlsxPackage(_open_source(self.file_path))
+            try:
+                self._default_bottom_border = 0 in package.styles["bottom_border_id"]
+                # Saat auto-detect pass XML tetap dilakukan, jadi used range ikut dihitung
+                self._layout = package.scan_layout(
+                    package.sheet_path(self.sheet_name),
+                    used_range=self.trim_to_used_range and (self.auto_detect_range or self._needs_used_range())
+                )
+            finally:
+                package.close()
+        return self._layout
+    
+    def _used_range(self) -> Tuple[int, int]:
+        """(baris, kolom) terakhir yang benar-benar berisi nilai."""
+        _, used_range = self._sheet_layout()
+        return used_range
+    
+    def _needs_used_range(self) -> bool:
+        """Used range hanya di-probe jika batas window masih bergantung pada dimensi sheet."""
+        return self.trim_to_used_range and (self.data_end_row is None or self.header_end_col is None)
     
     def _detect_range(self):
         """Detect table range based on cell content and borders."""
         if not self.sheet:
             self._load_workbook()
             
-        max_row = self.sheet.max_row
-        max_col = self.sheet.max_column
+        max_row, max_col = self._sheet_dimensions()
         
         # Auto-detect header row if not specified
         if self.header_row is None and self.auto_detect_range:
@@ -56,15 +266,7 @@ class ExcelExtractor:
             self.data_start_row = self.header_row + 1
         
         # Detect rows with bottom borders
-        rows_with_bottom_border = {}
-        for row in range(1, max_row + 1):
-            border_cols = []
-            for col in range(1, max_col + 1):
-                cell = self.sheet.cell(row=row, column=col)
-                if cell.border and cell.border.bottom and cell.border.bottom.style:
-                    border_cols.append(col)
-            if border_cols:
-                rows_with_bottom_border[row] = border_cols
+        rows_with_bottom_border = self._scan_bottom_borders(max_row, max_col)
         
         # Find continuous ranges with bottom borders
         # Group border rows by continuous ranges of column coverage
@@ -93,16 +295,94 @@ class ExcelExtractor:
             "rows_with_bottom_border": rows_with_bottom_border,
             "border_ranges": border_ranges
         }
+    
+    def _scan_bottom_borders(self, max_row: int, max_col: int) -> Dict[int, List[int]]:
+        """
+        Return {row: [kolom dengan bottom border]} untuk seluruh sheet.
         
+        Border dicocokkan dari atribut style (s=) sel di XML sheet terhadap index style ber-bottom
+        border di styles.xml (lihat _XlsxPackage.scan_layout), di mode normal maupun streaming,
+        sehingga tidak ada objek Cell yang dibuat untuk area kosong.
+        """
+        rows_with_bottom_border, _ = self._sheet_layout()
+        if self._default_bottom_border:
+            return self._scan_default_border_grid(max_row, max_col)
+        return {
+            row: [col for col in cols if col <= max_col]
+            for row, cols in rows_with_bottom_border.items()
+            if row <= max_row
+        }
+    
+    def _scan_default_border_grid(self, max_row: int, max_col: int) -> Dict[int, List[int]]:
+        """
+        Border default ber-bottom style: setiap sel grid max_row x max_col, termasuk sel yang tidak
+        ada di XML, ikut ber-border. Kasus langka ini dibaca per sel lewat cell.border dari
+        worksheet openpyxl mode normal (dimuat ulang jika extractor memakai mode streaming/xml)
+        sehingga hasilnya sama persis dengan scan per sel.
+        """
+        sheet = self.sheet
+        # Sheet read-only tidak punya border per sel; engine xml menyimpan path XML sheet
+        if self.streaming or isinstance(sheet, str):
+            workbook = openpyxl.load_workbook(_open_source(self.file_path), data_only=True)
+            sheet = workbook[self.sheet_name] if isinstance(self.sheet_name, str) else workbook.worksheets[self.sheet_name]
+        return _cell_bottom_borders(sheet, max_row, max_col)
+    
     def _get_cell_value(self, row, col):
         """Get cell value safely."""
         cell = self.sheet.cell(row=row, column=col)
         return cell.value
     
-    def extract(self) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    def _read_header(self, header_row: int, start_col: int, end_col: int) -> Tuple[Any, ...]:
+        """Nilai mentah baris header untuk kolom start_col..end_col."""
+        if self.streaming:
+            width = end_col - start_col + 1
+            return next(
+                self.sheet.iter_rows(
+                    min_row=header_row, max_row=header_row,
+                    min_col=start_col, max_col=end_col, values_only=True
+                ),
+                (None,) * width
+            )
+        return tuple(self._get_cell_value(header_row, col) for col in range(start_col, end_col + 1))
+    
+    def _iter_data_rows(
+        self,
+        data_start_row: int,
+        data_end_row: int,
+        start_col: int,
+        end_col: int
+    ) -> Iterator[Tuple[Any, ...]]:
+        """Generator tuple nilai per baris data, satu tuple per baris dari data_start_row s/d data_end_row."""
+        if not self.streaming:
+            for row in range(data_start_row, data_end_row + 1):
+                yield tuple(self._get_cell_value(row, col) for col in range(start_col, end_col + 1))
+            return
+        
+        # iter_rows(values_only=True) tidak membuat objek Cell per sel
+        row_count = 0
+        for values in self.sheet.iter_rows(
+            min_row=data_start_row, max_row=data_end_row,
+            min_col=start_col, max_col=end_col, values_only=True
+        ):
+            row_count += 1
+            yield values
+        
+        # iter_rows read-only berhenti di baris terakhir XML, lengkapi sampai data_end_row
+        empty_row = (None,) * (end_col - start_col + 1)
+        for _ in range((data_end_row - data_start_row + 1) - row_count):
+            yield empty_row
+    
+    @staticmethod
+    def _format_header(header_value, col: int) -> str:
+        """Nama kolom dari nilai header, fallback ke Column_<n> jika kosong."""
+        return f"Column_{col}" if header_value is None or str(header_value).strip() == "" else str(header_value)
+    
+    def _resolve_window(self) -> Tuple[int, int, int, int, int]:
         """
-        Extract data from Excel file based on specified or auto-detected range.
-        Returns the extracted DataFrame and border information.
+        Load workbook, jalankan deteksi range, lalu tentukan window ekstraksi.
+        
+        Returns:
+            Tuple (header_row, data_start_row, data_end_row, start_col, end_col), semuanya 1-based
         """
         # Load workbook if not already loaded
         if not self.sheet:
@@ -112,38 +392,585 @@ class ExcelExtractor:
         if self.auto_detect_range:
             self._detect_range()
         
+        max_row, max_col = self._sheet_dimensions()
+        
+        # Dimensi sheet bisa membengkak karena format kosong; pangkas batas default ke used range
+        if self._needs_used_range():
+            used_row, used_col = self._used_range()
+            self.border_info["used_range"] = {"max_row": used_row, "max_col": used_col}
+            max_row, max_col = min(max_row, used_row), min(max_col, used_col)
+        
         # Use user-specified values if provided
         header_row = self.header_row if self.header_row is not None else 1
         data_start_row = self.data_start_row if self.data_start_row is not None else header_row + 1
-        data_end_row = self.data_end_row if self.data_end_row is not None else self.sheet.max_row
-        
-        # Adjust for Excel 1-based indexing
-        header_row_index = header_row
-        data_start_row_index = data_start_row
-        data_end_row_index = data_end_row
+        data_end_row = self.data_end_row if self.data_end_row is not None else max_row
         
         # Determine column range
         start_col = self.header_start_col if self.header_start_col is not None else 1
-        end_col = self.header_end_col if self.header_end_col is not None else self.sheet.max_column
+        end_col = self.header_end_col if self.header_end_col is not None else max_col
+        
+        # Baris/kolom < 1 ditolak di semua engine, sama dengan sheet.cell() openpyxl
+        if start_col <= end_col and (
+            header_row < 1 or start_col < 1 or (data_start_row < 1 and data_start_row <= data_end_row)
+        ):
+            raise ValueError("Row or column values must be at least 1")
+        return header_row, data_start_row, data_end_row, start_col, end_col
+    
+    def _build_frame(self, rows: List[Tuple[Any, ...]], headers: List[str], start: int = 0) -> pd.DataFrame:
+        """
+        Susun DataFrame per kolom dari list tuple baris; kunci posisi menjaga header duplikat.
+        Kolom teks dikonversi sesuai dtype_backend.
+        """
+        if rows:
+            df = pd.DataFrame(
+                {position: list(values) for position, values in enumerate(zip(*rows))},
+                index=pd.RangeIndex(start, start + len(rows))
+            )
+        else:
+            # Tanpa baris data kolom tetap object, sama dengan pd.DataFrame([], columns=headers)
+            df = pd.DataFrame(index=pd.RangeIndex(start, start), columns=range(len(headers)), dtype=object)
+        df.columns = headers
+        return apply_dtype_backend(df, self.dtype_backend)
+    
+    def extract(self) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """
+        Extract data from Excel file based on specified or auto-detected range.
+        Returns the extracted DataFrame and border information.
+        """
+        header_row, data_start_row, data_end_row, start_col, end_col = self._resolve_window()
         
         # Extract headers
-        headers = []
-        for col in range(start_col, end_col + 1):
-            header_value = self._get_cell_value(header_row_index, col)
-            headers.append(f"Column_{col}" if header_value is None or str(header_value).strip() == "" else str(header_value))
+        header_values = self._read_header(header_row, start_col, end_col)
+        headers = [self._format_header(value, col) for col, value in zip(range(start_col, end_col + 1), header_values)]
+        
+        rows = list(self._iter_data_rows(data_start_row, data_end_row, start_col, end_col))
+        self._close_workbook()
+        
+        return self._build_frame(rows, headers), self.border_info
+    
+    def iter_chunks(self, chunk_rows: int = 10000) -> Iterator[pd.DataFrame]:
+        """
+        Extract data per potongan baris tanpa menyusun seluruh sheet sebagai satu DataFrame.
+        
+        Args:
+            chunk_rows: Jumlah baris maksimum per chunk
+            
+        Yields:
+            DataFrame dengan header yang sama di setiap chunk; index melanjutkan chunk
+            sebelumnya sehingga pd.concat(chunks) berisi nilai yang sama dengan hasil extract().
+            Tipe data di-infer per chunk, jadi kolom campuran bisa berbeda dtype (mis. sel kosong
+            menjadi NaN di chunk numerik, bukan None).
+            border_info tersedia di atribut border_info setelah chunk pertama.
+        """
+        if chunk_rows < 1:
+            raise ValueError("chunk_rows harus lebih dari 0")
+        
+        header_row, data_start_row, data_end_row, start_col, end_col = self._resolve_window()
+        header_values = self._read_header(header_row, start_col, end_col)
+        headers = [self._format_header(value, col) for col, value in zip(range(start_col, end_col + 1), header_values)]
+        
+        try:
+            chunk = []
+            start = 0
+            for values in self._iter_data_rows(data_start_row, data_end_row, start_col, end_col):
+                chunk.append(values)
+                if len(chunk) == chunk_rows:
+                    yield self._build_frame(chunk, headers, start)
+                    start += len(chunk)
+                    chunk = []
+            
+            # Chunk terakhir; sheet tanpa baris data tetap menghasilkan satu chunk kosong berheader
+            if chunk or start == 0:
+                yield self._build_frame(chunk, headers, start)
+        finally:
+            self._close_workbook()
+
+
+class _XlsxPackage:
+    """
+    Pembaca minimal untuk paket .xlsx: workbook.xml, sharedStrings, styles dan XML sheet
+    dibaca langsung dari zip tanpa membuat objek Cell openpyxl.
+    """
+    
+    def __init__(self, source):
+        self.archive = zipfile.ZipFile(source)
+        self.workbook_path = self._find_workbook_path()
+        self._rels = self._read_rels(self.workbook_path)
+        self._sheets = self._read_sheets()
+        self._shared_strings = None
+        self._styles = None
+    
+    @staticmethod
+    def _local(tag: str) -> str:
+        """Nama tag tanpa namespace."""
+        return tag.rsplit("}", 1)[-1]
+    
+    def _find_workbook_path(self) -> str:
+        """Cari part workbook utama dari _rels/.rels."""
+        for rel in self._read_rels("").values():
+            if rel["type"].endswith("/officeDocument"):
+                return rel["target"]
+        return "xl/workbook.xml"
+    
+    def _read_rels(self, part_path: str) -> Dict[str, Dict[str, str]]:
+        """Baca relationship sebuah part menjadi {Id: {type, target}} dengan target absolut."""
+        folder, name = posixpath.split(part_path)
+        rels_path = posixpath.join(folder, "_rels", f"{name}.rels")
+        if rels_path not in self.archive.namelist():
+            return {}
+        
+        rels = {}
+        root = parse_xml(self.archive.open(rels_path)).getroot()
+        for rel in root:
+            target = rel.get("Target", "")
+            if target.startswith("/"):
+                target = target.lstrip("/")
+            else:
+                target = posixpath.normpath(posixpath.join(folder, target))
+            rels[rel.get("Id")] = {"type": rel.get("Type", ""), "target": target}
+        return rels
+    
+    def _read_sheets(self) -> List[Dict[str, str]]:
+        """Daftar sheet sesuai urutan workbook, beserta path XML dan jenisnya."""
+        sheets = []
+        self.epoch = CALENDAR_WINDOWS_1900
+        root = parse_xml(self.archive.open(self.workbook_path)).getroot()
+        for element in root.iter():
+            tag = self._local(element.tag)
+            if tag == "workbookPr" and element.get("date1904") in ("1", "true"):
+                self.epoch = CALENDAR_MAC_1904
+            elif tag == "sheet":
+                rel_id = next((value for key, value in element.attrib.items() if self._local(key) == "id"), None)
+                rel = self._rels.get(rel_id, {})
+                sheets.append({
+                    "name": element.get("name"),
+                    "path": rel.get("target"),
+                    "is_worksheet": rel.get("type", "").endswith("/worksheet")
+                })
+        return sheets
+    
+    def _part_path(self, rel_type: str) -> Optional[str]:
+        """Path part workbook berdasarkan akhiran tipe relationship."""
+        for rel in self._rels.values():
+            if rel["type"].endswith(rel_type):
+                return rel["target"]
+        return None
+    
+    @property
+    def sheet_names(self) -> List[str]:
+        return [sheet["name"] for sheet in self._sheets]
+    
+    def sheet_path(self, sheet_name: Union[str, int]) -> str:
+        """Path XML untuk sheet berdasarkan nama atau indeks worksheet."""
+        if isinstance(sheet_name, str):
+            for sheet in self._sheets:
+                if sheet["name"] == sheet_name:
+                    return sheet["path"]
+            raise KeyError(f"Worksheet {sheet_name} does not exist.")
+        worksheets = [sheet for sheet in self._sheets if sheet["is_worksheet"]]
+        return worksheets[sheet_name]["path"]
+    
+    @property
+    def shared_strings(self) -> List[str]:
+        if self._shared_strings is None:
+            path = self._part_path("/sharedStrings")
+            self._shared_strings = []
+            if path and path in self.archive.namelist():
+                with self.archive.open(path) as src:
+                    self._shared_strings = read_string_table(src)
+        return self._shared_strings
+    
+    @property
+    def styles(self) -> Dict[str, set]:
+        """
+        Index style sel (atribut s=) yang relevan: format tanggal, timedelta,
+        dan style yang memiliki bottom border, plus borderId yang memiliki bottom style.
+        """
+        if self._styles is None:
+            self._styles = self._read_styles()
+        return self._styles
+    
+    def _read_styles(self) -> Dict[str, set]:
+        styles = {"date": set(), "timedelta": set(), "bottom_border": set(), "bottom_border_id": set()}
+        path = self._part_path("/styles")
+        if not path or path not in self.archive.namelist():
+            return styles
+        
+        root = parse_xml(self.archive.open(path)).getroot()
+        custom_formats = {}
+        bottom_borders = []
+        cell_xfs = []
+        for section in root:
+            tag = self._local(section.tag)
+            if tag == "numFmts":
+                for fmt in section:
+                    custom_formats[int(fmt.get("numFmtId"))] = fmt.get("formatCode", "")
+            elif tag == "borders":
+                for border in section:
+                    bottom = next((side for side in border if self._local(side.tag) == "bottom"), None)
+                    if bottom is not None and bottom.get("style"):
+                        styles["bottom_border_id"].add(len(bottom_borders))
+                    bottom_borders.append(bottom is not None and bool(bottom.get("style")))
+            elif tag == "cellXfs":
+                cell_xfs = list(section)
+        
+        for style_id, xf in enumerate(cell_xfs):
+            num_fmt_id = int(xf.get("numFmtId", 0))
+            fmt = custom_formats.get(num_fmt_id, BUILTIN_FORMATS.get(num_fmt_id))
+            if fmt and is_date_format(fmt):
+                styles["date"].add(style_id)
+                if is_timedelta_format(fmt):
+                    styles["timedelta"].add(style_id)
+            border_id = int(xf.get("borderId", 0))
+            if border_id < len(bottom_borders) and bottom_borders[border_id]:
+                styles["bottom_border"].add(style_id)
+        return styles
+    
+    def dimension(self, sheet_path: str) -> Optional[Tuple[int, int]]:
+        """(max_row, max_col) dari tag <dimension>, None jika tidak ada."""
+        with self.archive.open(sheet_path) as src:
+            for _, element in iterparse(src, events=("start",)):
+                tag = self._local(element.tag)
+                if tag == "dimension":
+                    ref = element.get("ref", "").split(":")[-1]
+                    try:
+                        return coordinate_to_tuple(ref)
+                    except ValueError:
+                        return None
+                if tag == "sheetData":
+                    return None
+        return None
+    
+    def _cell_value(self, element, style_id: int):
+        """Konversi elemen <c> menjadi nilai Python seperti openpyxl data_only=True."""
+        data_type = element.get("t", "n")
+        value = None
+        inline = None
+        for child in element:
+            tag = self._local(child.tag)
+            if tag == "v":
+                value = child.text or None
+            elif tag == "is":
+                inline = child
+        
+        if data_type == "inlineStr":
+            if inline is None:
+                return None
+            # Teks langsung <t> dan rich text <r><t>; teks phonetic <rPh> diabaikan
+            parts = []
+            for child in inline:
+                tag = self._local(child.tag)
+                if tag == "t":
+                    parts.append(child.text or "")
+                elif tag == "r":
+                    parts.extend(node.text or "" for node in child if self._local(node.tag) == "t")
+            return "".join(parts)
+        if value is None:
+            return None
+        if data_type == "n":
+            number = float(value) if ("." in value or "E" in value or "e" in value) else int(value)
+            if style_id in self.styles["date"]:
+                try:
+                    return from_excel(number, self.epoch, timedelta=style_id in self.styles["timedelta"])
+                except (OverflowError, ValueError):
+                    return "#VALUE!"
+            return number
+        if data_type == "s":
+            return self.shared_strings[int(value)]
+        if data_type == "b":
+            return bool(int(value))
+        if data_type == "d":
+            return from_ISO8601(value)
+        return value
+    
+    def iter_rows(
+        self,
+        sheet_path: str,
+        stop_row: Optional[int] = None,
+        values: bool = True,
+        merged_cells: Optional[List[str]] = None
+    ):
+        """
+        Iterasi baris sheet dengan iterparse, menghasilkan (row, [(col, value, style_id), ...]).
+        Parsing berhenti begitu melewati stop_row; elemen yang sudah dibaca langsung dibuang.
+        Dengan values=False nilai sel tidak dikonversi (selalu None), cukup untuk scan style.
+        Jika merged_cells diberikan, ref <mergeCell> (yang ada setelah <sheetData>) ditambahkan
+        ke list tersebut; tanpa itu parsing berhenti di akhir <sheetData>.
+        """
+        row_counter = 0
+        col_counter = 0
+        cells = []
+        sheet_data = None
+        row_tag = cell_tag = sheet_data_tag = merge_cell_tag = None
+        with self.archive.open(sheet_path) as src:
+            for event, element in iterparse(src, events=("start", "end")):
+                tag = element.tag
+                if row_tag is None:
+                    # Namespace diambil dari elemen root <worksheet> agar perbandingan tag cukup string biasa
+                    namespace = tag[:tag.index("}") + 1] if tag.startswith("{") else ""
+                    row_tag, cell_tag = f"{namespace}row", f"{namespace}c"
+                    sheet_data_tag = f"{namespace}sheetData"
+                    merge_cell_tag = f"{namespace}mergeCell"
+                
+                if event == "start":
+                    if tag == row_tag:
+                        row_attr = element.get("r")
+                        row_counter = int(float(row_attr)) if row_attr else row_counter + 1
+                        if stop_row is not None and row_counter > stop_row:
+                            return
+                        col_counter = 0
+                        cells = []
+                    elif tag == sheet_data_tag:
+                        sheet_data = element
+                    continue
+                
+                if tag == cell_tag:
+                    ref = element.get("r")
+                    if ref:
+                        col_counter = column_index_from_string(ref.rstrip("0123456789"))
+                    else:
+                        col_counter += 1
+                    style_attr = element.get("s")
+                    style_id = int(style_attr) if style_attr else 0
+                    value = self._cell_value(element, style_id) if values else None
+                    cells.append((col_counter, value, style_id))
+                elif tag == row_tag:
+                    yield row_counter, cells
+                    if sheet_data is not None:
+                        sheet_data.clear()
+                elif tag == sheet_data_tag:
+                    if merged_cells is None:
+                        return
+                    sheet_data.clear()
+                elif tag == merge_cell_tag and merged_cells is not None:
+                    merged_cells.append(element.get("ref"))
+    
+    @staticmethod
+    def apply_merged_borders(
+        rows_with_bottom_border: Dict[int, List[int]],
+        merged_cells: List[str]
+    ) -> Dict[int, List[int]]:
+        """
+        Terapkan aturan border merged cell openpyxl (mode normal) pada hasil scan style.
+        
+        openpyxl mengganti semua sel merged selain sel kiri atas dengan MergedCell tanpa border;
+        sel kiri atas mendapat bottom border dari sel kanan bawah, lalu bottom border itu
+        diterapkan ke seluruh baris terbawah range.
+        
+        Returns:
+            {row: [kolom dengan bottom border]} terurut per baris dan kolom
+        """
+        bordered = {row: set(cols) for row, cols in rows_with_bottom_border.items()}
+        for ref in merged_cells:
+            if not ref or ":" not in ref:
+                continue
+            (min_row, min_col), (max_row, max_col) = (coordinate_to_tuple(part) for part in ref.split(":"))
+            start_bottom = min_col in bordered.get(min_row, ()) or max_col in bordered.get(max_row, ())
+            for row in range(min_row, max_row + 1):
+                if row in bordered:
+                    bordered[row].difference_update(range(min_col, max_col + 1))
+            if start_bottom:
+                bordered.setdefault(min_row, set()).add(min_col)
+                bordered.setdefault(max_row, set()).update(range(min_col, max_col + 1))
+        return {row: sorted(cols) for row, cols in sorted(bordered.items()) if cols}
+    
+    @staticmethod
+    def has_value(value) -> bool:
+        """Sel dianggap terisi jika nilainya bukan None atau string kosong."""
+        return value is not None and not (isinstance(value, str) and value.strip() == "")
+    
+    def scan_layout(
+        self,
+        sheet_path: str,
+        stop_row: Optional[int] = None,
+        used_range: bool = True
+    ) -> Tuple[Dict[int, List[int]], Tuple[int, int]]:
+        """
+        Satu pass atas XML sheet untuk layout tabel.
+        
+        Args:
+            sheet_path: Path XML sheet di dalam zip
+            stop_row: Berhenti parsing setelah baris ini (opsional)
+            used_range: Jika False nilai sel tidak dikonversi dan used range bernilai (0, 0)
+            
+        Returns:
+            Tuple ({row: [kolom dengan bottom border]}, (baris terakhir, kolom terakhir) yang berisi nilai).
+            Border dicocokkan dari atribut s= sel terhadap index style ber-bottom border di styles.xml,
+            lalu disesuaikan dengan merged cell seperti openpyxl (lihat apply_merged_borders).
+        """
+        border_styles = self.styles["bottom_border"]
+        rows_with_bottom_border = {}
+        used_row = 0
+        used_col = 0
+        if not border_styles and not used_range:
+            return rows_with_bottom_border, (used_row, used_col)
+        
+        merged_cells = [] if border_styles else None
+        for row, cells in self.iter_rows(sheet_path, stop_row=stop_row, values=used_range, merged_cells=merged_cells):
+            if border_styles:
+                border_cols = [col for col, _, style_id in cells if style_id in border_styles]
+                if border_cols:
+                    rows_with_bottom_border[row] = border_cols
+            if used_range:
+                value_cols = [col for col, value, _ in cells if self.has_value(value)]
+                if value_cols:
+                    used_row = row
+                    used_col = max(used_col, value_cols[-1])
+        if merged_cells:
+            rows_with_bottom_border = self.apply_merged_borders(rows_with_bottom_border, merged_cells)
+        return rows_with_bottom_border, (used_row, used_col)
+    
+    def close(self):
+        self.archive.close()
+
+
+def list_sheet_names(source: ExcelSource) -> List[str]:
+    """
+    Daftar nama sheet sesuai urutan workbook, hanya dengan membaca workbook.xml
+    (dan relationship-nya) dari zip .xlsx tanpa memuat sheet, styles, atau sharedStrings.
+    
+    Args:
+        source: Path, bytes, atau file-like dari file .xlsx/.xlsm
+        
+    Returns:
+        List nama sheet, sama dengan openpyxl Workbook.sheetnames
+    """
+    package = _XlsxPackage(_open_source(source))
+    try:
+        return package.sheet_names
+    finally:
+        package.close()
+
+
+class XlsxXmlExtractor(ExcelExtractor):
+    """
+    Extractor ringan yang membaca XML sheet dan sharedStrings langsung dari zip .xlsx
+    dengan iterparse. Tidak membuat objek Cell openpyxl dan berhenti setelah
+    data_end_row jika range tidak perlu dideteksi dari border.
+    
+    Menghasilkan tuple (df, border_info) yang sama dengan ExcelExtractor.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._rows = {}
+        self._max_row = None
+        self._max_col = None
+        self._used = (0, 0)
+        self._rows_with_bottom_border = {}
+        self._default_bottom_border = False
+    
+    def _open_workbook(self):
+        self.workbook = _XlsxPackage(_open_source(self.file_path))
+    
+    def list_sheets(self) -> List[str]:
+        if self.workbook is None:
+            return list_sheet_names(self.file_path)
+        return self.workbook.sheet_names
+    
+    def _load_workbook(self):
+        """Buka paket zip dan scan sheet sekali (sampai data_end_row jika memungkinkan)."""
+        if self.workbook is None:
+            self._open_workbook()
+        self.sheet = self.workbook.sheet_path(self.sheet_name)
+        
+        # Tanpa auto-detect dan dengan window eksplisit, baris setelah data_end_row tidak perlu dibaca
+        stop_row = None
+        if not self.auto_detect_range and self.data_end_row is not None and not self._needs_used_range():
+            header_row = self.header_row if self.header_row is not None else 1
+            stop_row = max(header_row, self.data_end_row)
+        self._scan(stop_row)
+        
+        if stop_row is not None:
+            # Scan terpotong: ukuran sheet diambil dari tag <dimension> jika ada
+            dimension = self.workbook.dimension(self.sheet)
+            if dimension is not None:
+                self._max_row = max(self._max_row, dimension[0])
+                self._max_col = max(self._max_col, dimension[1])
+        self.workbook.close()
+        self.workbook = None
+    
+    def _scan(self, stop_row: Optional[int]):
+        """Kumpulkan nilai sel, ukuran sheet, dan baris ber-bottom border dalam satu pass."""
+        first_row = min(
+            row for row in (self.header_row, self.data_start_row, 1) if row is not None
+        )
+        border_styles = self.workbook.styles["bottom_border"] if self.auto_detect_range else set()
+        self._default_bottom_border = bool(border_styles) and 0 in self.workbook.styles["bottom_border_id"]
+        self._rows = {}
+        self._rows_with_bottom_border = {}
+        # Merged cell ikut dihitung ke ukuran sheet dan border, sama seperti openpyxl mode normal
+        merged_cells = [] if stop_row is None else None
         
-        # Extract data rows
-        data = []
-        for row in range(data_start_row_index, data_end_row_index + 1):
-            row_data = []
-            for col in range(start_col, end_col + 1):
-                row_data.append(self._get_cell_value(row, col))
-            data.append(row_data)
+        max_row = 0
+        max_col = 0
+        used_row = 0
+        used_col = 0
+        for row, cells in self.workbook.iter_rows(self.sheet, stop_row=stop_row, merged_cells=merged_cells):
+            if not cells:
+                continue
+            max_row = max(max_row, row)
+            max_col = max(max_col, max(col for col, _, _ in cells))
+            value_cols = [col for col, value, _ in cells if _XlsxPackage.has_value(value)]
+            if value_cols:
+                used_row = row
+                used_col = max(used_col, value_cols[-1])
+            if row >= first_row:
+                self._rows[row] = {col: value for col, value, _ in cells if value is not None}
+            if border_styles:
+                border_cols = [col for col, _, style_id in cells if style_id in border_styles]
+                if border_cols:
+                    self._rows_with_bottom_border[row] = border_cols
         
-        # Create DataFrame
-        df = pd.DataFrame(data, columns=headers)
+        for ref in merged_cells or ():
+            if ref and ":" in ref:
+                merge_row, merge_col = coordinate_to_tuple(ref.split(":")[1])
+                max_row = max(max_row, merge_row)
+                max_col = max(max_col, merge_col)
+        if border_styles and merged_cells:
+            self._rows_with_bottom_border = _XlsxPackage.apply_merged_borders(self._rows_with_bottom_border, merged_cells)
         
-        return df, self.border_info
+        # Sheet kosong tetap dianggap berukuran 1x1 seperti openpyxl
+        self._max_row = max(max_row, 1)
+        self._max_col = max(max_col, 1)
+        self._used = (used_row, used_col)
+    
+    def _close_workbook(self):
+        # Nilai hasil scan dilepas; extract() berikutnya akan membaca ulang paket
+        self._rows = {}
+        self.sheet = None
+    
+    def _sheet_dimensions(self) -> Tuple[int, int]:
+        return self._max_row, self._max_col
+    
+    def _used_range(self) -> Tuple[int, int]:
+        return self._used
+    
+    def _scan_bottom_borders(self, max_row: int, max_col: int) -> Dict[int, List[int]]:
+        if self._default_bottom_border:
+            return self._scan_default_border_grid(max_row, max_col)
+        return {
+            row: [col for col in cols if col <= max_col]
+            for row, cols in sorted(self._rows_with_bottom_border.items())
+            if row <= max_row
+        }
+    
+    def _row_values(self, row: int, start_col: int, end_col: int) -> Tuple[Any, ...]:
+        values = self._rows.get(row, {})
+        return tuple(values.get(col) for col in range(start_col, end_col + 1))
+    
+    def _read_header(self, header_row: int, start_col: int, end_col: int) -> Tuple[Any, ...]:
+        return self._row_values(header_row, start_col, end_col)
+    
+    def _iter_data_rows(
+        self,
+        data_start_row: int,
+        data_end_row: int,
+        start_col: int,
+        end_col: int
+    ) -> Iterator[Tuple[Any, ...]]:
+        for row in range(data_start_row, data_end_row + 1):
+            yield self._row_values(row, start_col, end_col)
 
 
 class CSVExtractor:
@@ -151,40 +978,154 @@ class CSVExtractor:
     
     def __init__(
         self,
-        file_path: str,
+        file_path: ExcelSource,
         encoding: str = "utf-8",
         header_row: int = 0,
         data_start_row: int = 1,
-        data_end_row: Optional[int] = None
+        data_end_row: Optional[int] = None,
+        dtype_backend: Optional[str] = None
     ):
+        if dtype_backend not in DTYPE_BACKENDS:
+            raise ValueError(f"Unsupported dtype_backend: {dtype_backend}. Choose from: None, pyarrow")
         self.file_path = file_path
         self.encoding = encoding
         self.header_row = header_row
         self.data_start_row = data_start_row
         self.data_end_row = data_end_row
+        self.dtype_backend = dtype_backend
     
-    def extract(self) -> pd.DataFrame:
-        """Extract data from CSV file."""
-        # Read the CSV file
-        df = pd.read_csv(self.file_path, encoding=self.encoding, header=None)
+    def _skiprows(self, *rows: int) -> List[int]:
+        """
+        Jumlah record mentah sebelum baris logis rows (untuk skiprows read_csv).
         
-        # Extract headers
-        headers = [
+        header_row/data_start_row menghitung baris seperti read_csv(header=None) pada seluruh file:
+        baris kosong (atau hanya whitespace) dilewati. skiprows read_csv menghitung record mentah
+        termasuk baris kosong, sehingga offset dihitung dengan csv.reader hanya sampai baris
+        terbesar yang diminta (field ber-quote dengan newline tetap satu record).
+        """
+        target = max(rows)
+        found = {}
+        source = _open_source(self.file_path)
+        binary = open(source, "rb") if isinstance(source, (str, os.PathLike)) else source
+        text = io.TextIOWrapper(binary, encoding=self.encoding, newline="")
+        raw = -1
+        try:
+            logical = 0
+            for raw, record in enumerate(csv.reader(text)):
+                if len(record) > 1 or (record and record[0].strip()):
+                    found[logical] = raw
+                    logical += 1
+                    if logical > target:
+                        break
+        finally:
+            text.detach()
+            if binary is not source:
+                binary.close()
+        # Baris di luar akhir file: lewati semua record sehingga read_csv tidak menghasilkan baris
+        return [found.get(row, raw + 1) for row in rows]
+    
+    def _read_csv(self, skiprows: int, nrows: Optional[int], **kwargs):
+        """Baca sebagian baris CSV mulai dari record mentah ke-skiprows."""
+        return pd.read_csv(
+            _open_source(self.file_path),
+            encoding=self.encoding,
+            header=None,
+            skiprows=skiprows,
+            nrows=nrows,
+            **kwargs
+        )
+    
+    def _read_header_row(self) -> pd.Series:
+        """Baca hanya baris header sebagai teks (tanpa inferensi tipe)."""
+        [skiprows] = self._skiprows(self.header_row)
+        return self._read_csv(skiprows, 1, dtype=object).iloc[0]
+    
+    def _read_headers(self) -> List[str]:
+        """Baca hanya baris header."""
+        return [
             f"Column_{i}" if pd.isna(h) or str(h).strip() == "" else str(h) 
-            for i, h in enumerate(df.iloc[self.header_row])
+            for i, h in enumerate(self._read_header_row())
         ]
+    
+    def _read_data(self, **kwargs):
+        """
+        Baca baris data_start_row..data_end_row (atau reader chunk jika chunksize diberikan).
+        
+        Seperti pembacaan lama (read_csv seluruh file lalu iloc): kolom dengan cell header berisi
+        selalu teks (object); kolom tanpa header di-infer oleh read_csv, tetapi dari baris yang
+        dibaca saja (per chunk untuk iter_chunks), bukan dari seluruh file.
+        """
+        header_cells = self._read_header_row()
+        [skiprows] = self._skiprows(self.data_start_row)
+        text_columns = {i: object for i, h in enumerate(header_cells) if not pd.isna(h)}
+        return self._read_csv(
+            skiprows, self._data_rows(),
+            names=list(range(len(header_cells))), index_col=False, dtype=text_columns, **kwargs
+        )
+    
+    @staticmethod
+    def _as_extracted(df: pd.DataFrame, headers: List[str]) -> pd.DataFrame:
+        """
+        Bentuk hasil sama dengan pembacaan lama pd.DataFrame(df.iloc[...].values): jika ada kolom
+        object, semua kolom menjadi object dengan nilai Python per cell. Kolom integer menjadi
+        float, karena di pembacaan lama cell header kosong (NaN) ikut di kolom yang sama.
+        """
+        for position, dtype in enumerate(df.dtypes):
+            if pd.api.types.is_integer_dtype(dtype):
+                df.isetitem(position, df.iloc[:, position].astype(np.float64))
+        return pd.DataFrame(df.to_numpy(), index=df.index, columns=headers)
+    
+    def _data_rows(self) -> Optional[int]:
+        """Jumlah baris data (data_end_row eksklusif, seperti slicing iloc); None = sampai akhir file."""
+        if self.data_end_row is None:
+            return None
+        return max(self.data_end_row - self.data_start_row, 0)
+    
+    def extract(self) -> pd.DataFrame:
+        """Extract data from CSV file."""
+        # Hanya header dan baris data_start_row..data_end_row yang di-parse
+        headers = self._read_headers()
+        df = self._as_extracted(self._read_data(), headers)
+        return apply_dtype_backend(df, self.dtype_backend)
+    
+    def iter_chunks(self, chunk_rows: int = 10000) -> Iterator[pd.DataFrame]:
+        """
+        Extract data CSV per potongan baris dengan read_csv(chunksize=...).
+        
+        Args:
+            chunk_rows: Jumlah baris maksimum per chunk
+            
+        Yields:
+            DataFrame dengan header yang sama di setiap chunk; index melanjutkan chunk
+            sebelumnya sehingga pd.concat(chunks) sama dengan hasil extract().
+            Rentang data kosong tetap menghasilkan satu chunk kosong berheader.
+        """
+        if chunk_rows < 1:
+            raise ValueError("chunk_rows harus lebih dari 0")
+        
+        headers = self._read_headers()
+        data_rows = self._data_rows()
         
-        # Extract data rows
-        data_rows = df.iloc[
-            self.data_start_row:(self.data_end_row if self.data_end_row is not None else None)
-        ].values
+        # read_csv(nrows=0, chunksize=...) tidak menghasilkan chunk sama sekali; seperti
+        # ExcelExtractor, rentang kosong tetap satu chunk kosong berheader (sama dengan extract())
+        if data_rows == 0:
+            yield self.extract()
+            return
         
-        # Create final DataFrame
-        return pd.DataFrame(data_rows, columns=headers)
+        reader = self._read_data(chunksize=chunk_rows)
+        with reader:
+            for chunk in reader:
+                yield apply_dtype_backend(self._as_extracted(chunk, headers), self.dtype_backend)
+
+
+EXCEL_ENGINES = {
+    "openpyxl": ExcelExtractor,
+    "xml": XlsxXmlExtractor
+}
 
 
 def create_extractor(
-    file_path: str,
+    file_path: ExcelSource,
     sheet_name: Union[str, int] = 0,
     header_row: Optional[int] = None,
     data_start_row: Optional[int] = None,
@@ -192,13 +1133,37 @@ def create_extractor(
     header_start_col: Optional[int] = None,
     header_end_col: Optional[int] = None,
     auto_detect_range: bool = True,
-    encoding: str = "utf-8"
+    encoding: str = "utf-8",
+    streaming: bool = False,
+    engine: str = "openpyxl",
+    trim_to_used_range: bool = False,
+    file_name: Optional[str] = None,
+    dtype_backend: Optional[str] = None
 ) -> Union[ExcelExtractor, CSVExtractor]:
-    """Factory function to create appropriate extractor based on file type."""
-    file_ext = file_path.split(".")[-1].lower()
+    """
+    Factory function to create appropriate extractor based on file type.
+    
+    engine memilih backend Excel: "openpyxl" (default) atau "xml" untuk
+    XlsxXmlExtractor yang mem-parsing XML sheet langsung dari zip .xlsx.
+    
+    file_path boleh berupa path, bytes, atau file-like (mis. UploadedFile Streamlit).
+    Untuk bytes/file-like, tipe file ditentukan dari file_name (atau atribut .name).
+    
+    dtype_backend="pyarrow" (opsional) menghasilkan kolom teks bertipe string[pyarrow];
+    default None mempertahankan kolom object seperti sebelumnya.
+    """
+    if file_name is None:
+        file_name = file_path if isinstance(file_path, (str, os.PathLike)) else getattr(file_path, "name", None)
+    if file_name is None:
+        raise ValueError("file_name is required to detect file type from bytes or file-like input")
+    file_ext = os.fspath(file_name).split(".")[-1].lower()
+    
+    if engine not in EXCEL_ENGINES:
+        raise ValueError(f"Unsupported Excel engine: {engine}. Choose from: {', '.join(EXCEL_ENGINES)}")
     
     if file_ext in ["xlsx", "xls", "xlsm"]:
-        return ExcelExtractor(
+        extractor_class = EXCEL_ENGINES[engine]
+        return extractor_class(
             file_path=file_path,
             sheet_name=sheet_name,
             header_row=header_row,
@@ -206,7 +1171,10 @@ def create_extractor(
             data_end_row=data_end_row,
             header_start_col=header_start_col,
             header_end_col=header_end_col,
-            auto_detect_range=auto_detect_range
+            auto_detect_range=auto_detect_range,
+            streaming=streaming,
+            trim_to_used_range=trim_to_used_range,
+            dtype_backend=dtype_backend
         )
     elif file_ext == "csv":
         return CSVExtractor(
@@ -214,7 +1182,287 @@ def create_extractor(
             encoding=encoding,
             header_row=header_row if header_row is not None else 0,
             data_start_row=data_start_row if data_start_row is not None else 1,
-            data_end_row=data_end_row
+            data_end_row=data_end_row,
+            dtype_backend=dtype_backend
         )
     else:
         raise ValueError(f"Unsupported file extension: {file_ext}")
+
+
+ExtractionJob = Tuple[ExcelSource, Union[str, int], Dict[str, Any]]
+
+
+def _extract_job(
+    file_path,
+    sheet_name,
+    settings: Dict[str, Any],
+    cache: Optional["ExtractionCache"] = None,
+    with_timing: bool = False
+):
+    """
+    Worker untuk extract_many; harus fungsi top-level agar bisa di-pickle ke proses lain.
+    Hasil CSV dinormalisasi menjadi (df, {}) supaya semua job punya bentuk yang sama.
+    """
+    start = time.perf_counter()
+    if cache is not None:
+        result = cache.extract(file_path, sheet_name=sheet_name, **settings)
+    else:
+        result = create_extractor(file_path, sheet_name=sheet_name, **settings).extract()
+    df, border_info = result if isinstance(result, tuple) else (result, {})
+    
+    if with_timing:
+        return df, border_info, time.perf_counter() - start
+    return df, border_info
+
+
+def extract_many(
+    jobs: List[ExtractionJob],
+    max_workers: Optional[int] = None,
+    cache: Optional["ExtractionCache"] = None,
+    with_timing: bool = False,
+    executor: Optional[Executor] = None
+) -> List[Tuple]:
+    """
+    Ekstrak beberapa file/sheet sekaligus dengan process pool.
+    
+    Args:
+        jobs: List (file, sheet_name, settings). file berupa path, bytes, atau file-like;
+            settings adalah parameter create_extractor lainnya (header_row, data_start_row, ...)
+        max_workers: Jumlah proses (default: jumlah CPU, maksimal sebanyak job)
+        cache: ExtractionCache opsional yang dipakai di setiap worker
+        with_timing: Jika True, setiap hasil ditambah durasi ekstraksi (detik) di worker
+        executor: Pool yang sudah ada (process atau thread pool, mis. thread pool persisten aplikasi);
+            tidak di-shutdown di sini
+        
+    Returns:
+        List (df, border_info) atau (df, border_info, detik) sesuai urutan jobs
+    """
+    prepared = []
+    for file_path, sheet_name, settings in jobs:
+        settings = dict(settings)
+        # File-like (mis. UploadedFile) tidak bisa di-pickle; kirim bytes beserta nama filenya
+        if not isinstance(file_path, (str, os.PathLike, bytes)):
+            settings.setdefault("file_name", getattr(file_path, "name", None))
+            file_path = _read_source_bytes(file_path)
+        prepared.append((file_path, sheet_name, settings))
+    
+    if executor is not None:
+        futures = [
+            executor.submit(_extract_job, file_path, sheet_name, settings, cache, with_timing)
+            for file_path, sheet_name, settings in prepared
+        ]
+        return [future.result() for future in futures]
+    
+    max_workers = min(max_workers or os.cpu_count() or 1, len(prepared))
+    if max_workers <= 1:
+        return [
+            _extract_job(file_path, sheet_name, settings, cache, with_timing)
+            for file_path, sheet_name, settings in prepared
+        ]
+    
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return extract_many(prepared, cache=cache, with_timing=with_timing, executor=executor)
+
+
+class ExtractionCache:
+    """
+    Cache hasil ekstraksi di disk, dikunci dengan SHA-256 isi file dan setting range
+    (sheet, header/data rows, window kolom, dll). Ekstraksi ulang file yang sama
+    dengan setting yang sama langsung dibaca dari cache.
+    
+    DataFrame disimpan kolumnar sebagai Parquet hanya untuk kolom yang kembali persis
+    sama saat dibaca (lihat is_arrow_column); kolom object lain (mis. angka dan teks
+    "Rp -" dalam satu kolom, atau [1, None, 2]) disimpan terpisah dengan pickle.
+    Hasil cache hit sama dengan cache miss, termasuk dtype dan jenis NA.
+    Total ukuran cache dibatasi dengan eviksi LRU.
+    """
+    
+    # Setting yang tidak memengaruhi hasil ekstraksi, tidak dimasukkan ke key
+    RESULT_NEUTRAL_SETTINGS = ("streaming", "engine")
+    # Naikkan jika format penyimpanan atau hasil ekstraksi berubah agar entry lama tidak dipakai
+    FORMAT_VERSION = 2
+    
+    def __init__(self, cache_dir: str = "temp/extract_cache/", max_bytes: int = 256 * 1024 * 1024):
+        """
+        Args:
+            cache_dir: Folder penyimpanan cache
+            max_bytes: Batas total ukuran file cache; entry yang paling lama tidak dipakai dihapus lebih dulu
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+    
+    def make_key(self, digest: str, file_name: str, settings: Dict[str, Any]) -> str:
+        """Key cache dari hash isi file, ekstensi file, dan setting ekstraksi."""
+        relevant = {
+            name: value for name, value in settings.items()
+            if name not in self.RESULT_NEUTRAL_SETTINGS
+        }
+        file_ext = os.fspath(file_name).split(".")[-1].lower()
+        payload = json.dumps([self.FORMAT_VERSION, digest, file_ext, sorted(relevant.items())], default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def extract(self, file_path: ExcelSource, file_name: Optional[str] = None, **extractor_kwargs):
+        """
+        Ekstrak lewat cache. Parameter sama dengan create_extractor; hasil sama dengan
+        extractor.extract(): (df, border_info) untuk Excel, df untuk CSV.
+        """
+        if file_name is None:
+            file_name = file_path if isinstance(file_path, (str, os.PathLike)) else getattr(file_path, "name", None)
+        if file_name is None:
+            raise ValueError("file_name is required to detect file type from bytes or file-like input")
+        
+        data = _read_source_bytes(file_path)
+        key = self.make_key(hashlib.sha256(data).hexdigest(), file_name, extractor_kwargs)
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        
+        result = create_extractor(data, file_name=file_name, **extractor_kwargs).extract()
+        if isinstance(result, tuple):
+            self.put(key, result[0], result[1])
+        else:
+            self.put(key, result, None)
+        return result
+    
+    def _path(self, key: str, suffix: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}{suffix}")
+    
+    def get(self, key: str):
+        """Ambil entry cache; None jika tidak ada atau rusak."""
+        meta_path = self._path(key, ".json")
+        if not os.path.exists(meta_path):
+            return None
+        
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            
+            columns = {}
+            if meta["arrow_columns"]:
+                arrow_df = pd.read_parquet(self._path(key, ".parquet"))
+                for position in arrow_df.columns:
+                    series = arrow_df[position]
+                    storage = meta["string_storage"].get(position)
+                    if storage is not None:
+                        # Parquet tidak menyimpan storage StringDtype; kembalikan storage aslinya
+                        series = series.astype(pd.StringDtype(storage))
+                    columns[int(position)] = restore_text_na(series, meta["na"].get(position))
+            if meta["pickled_columns"]:
+                with open(self._path(key, ".pkl"), "rb") as f:
+                    columns.update(pickle.load(f))
+        except (OSError, ValueError, KeyError, pickle.UnpicklingError):
+            self._remove(key)
+            return None
+        
+        # Susun ulang kolom sesuai posisi asli; header duplikat tetap terjaga
+        df = pd.DataFrame({position: columns[position] for position in range(len(meta["headers"]))})
+        if df.shape[1] == 0:
+            df = pd.DataFrame(index=pd.RangeIndex(meta["rows"]))
+        df.columns = meta["headers"]
+        
+        # Tandai sebagai baru dipakai untuk eviksi LRU
+        os.utime(meta_path)
+        
+        if meta["border_info"] is None:
+            return df
+        return df, self._decode_border_info(meta["border_info"])
+    
+    def put(self, key: str, df: pd.DataFrame, border_info: Optional[Dict[str, Any]]):
+        """Simpan DataFrame dan border_info ke cache, lalu jalankan eviksi."""
+        arrow_columns = {}
+        pickled_columns = {}
+        na_kinds = {}
+        string_storage = {}
+        for position in range(df.shape[1]):
+            series = df.iloc[:, position].reset_index(drop=True)
+            if not is_arrow_column(series):
+                pickled_columns[position] = series
+                continue
+            arrow_columns[str(position)] = series
+            if series.dtype == object:
+                na_kinds[str(position)] = text_na_kind(series)
+            elif isinstance(series.dtype, pd.StringDtype):
+                string_storage[str(position)] = series.dtype.storage
+        
+        if arrow_columns:
+            self._write_atomic(
+                self._path(key, ".parquet"),
+                lambda f: pd.DataFrame(arrow_columns).to_parquet(f, index=False)
+            )
+        if pickled_columns:
+            self._write_atomic(
+                self._path(key, ".pkl"),
+                lambda f: pickle.dump(pickled_columns, f, protocol=pickle.HIGHEST_PROTOCOL)
+            )
+        
+        # Meta ditulis terakhir: entry dianggap lengkap hanya jika file .json ada
+        meta = {
+            "headers": [str(column) for column in df.columns],
+            "rows": len(df),
+            "arrow_columns": sorted(arrow_columns, key=int),
+            "pickled_columns": sorted(pickled_columns),
+            "na": na_kinds,
+            "string_storage": string_storage,
+            "border_info": border_info,
+            "created_at": time.time()
+        }
+        self._write_atomic(
+            self._path(key, ".json"),
+            lambda f: f.write(json.dumps(meta, default=str).encode("utf-8"))
+        )
+        self._evict(keep=key)
+    
+    @staticmethod
+    def _write_atomic(path: str, write):
+        """
+        Tulis ke file sementara lalu rename, aman untuk beberapa sesi Streamlit sekaligus.
+        Nama file sementara memuat pid dan id thread karena job extract_many bisa berjalan di thread pool.
+        """
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as f:
+            write(f)
+        os.replace(temp_path, path)
+    
+    @staticmethod
+    def _decode_border_info(border_info: Dict[str, Any]) -> Dict[str, Any]:
+        """JSON mengubah key int menjadi string; kembalikan key baris ke int."""
+        if "rows_with_bottom_border" in border_info:
+            border_info["rows_with_bottom_border"] = {
+                int(row): cols for row, cols in border_info["rows_with_bottom_border"].items()
+            }
+        return border_info
+    
+    def _remove(self, key: str):
+        for suffix in (".json", ".parquet", ".pkl"):
+            # Entry bisa sudah dihapus oleh worker/sesi lain yang melakukan evict bersamaan
+            try:
+                os.remove(self._path(key, suffix))
+            except FileNotFoundError:
+                pass
+    
+    def _evict(self, keep: Optional[str] = None):
+        """Hapus entry dengan akses paling lama sampai total ukuran <= max_bytes."""
+        entries = {}
+        for name in os.listdir(self.cache_dir):
+            key, suffix = os.path.splitext(name)
+            if suffix not in (".json", ".parquet", ".pkl"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entry = entries.setdefault(key, {"size": 0, "last_used": 0.0})
+            entry["size"] += stat.st_size
+            if suffix == ".json":
+                entry["last_used"] = stat.st_mtime
+        
+        total = sum(entry["size"] for entry in entries.values())
+        for key, entry in sorted(entries.items(), key=lambda item: item[1]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            self._remove(key)
+            total -= entry["size"]
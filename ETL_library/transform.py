@@ -1,8 +1,105 @@
+import json
+import time
+import tracemalloc
+
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Callable, Optional, Union, Any, Tuple
 
 
+def is_string_dtype(dtype: Any) -> bool:
+    """
+    True untuk kolom teks bertipe string (StringDtype, termasuk string[pyarrow], atau ArrowDtype string).
+    
+    Kolom seperti ini hanya berisi string dan NA, sehingga operasi .str dapat dijalankan
+    langsung pada seluruh kolom (kernel pyarrow.compute untuk storage Arrow) tanpa
+    konversi ke object atau cek isinstance per cell.
+    """
+    if isinstance(dtype, pd.StringDtype):
+        return True
+    if isinstance(dtype, pd.ArrowDtype):
+        # ArrowDtype hanya bisa dibuat jika pyarrow terpasang
+        import pyarrow as pa
+        return pa.types.is_string(dtype.pyarrow_dtype) or pa.types.is_large_string(dtype.pyarrow_dtype)
+    return False
+
+
+def empty_mask(df: pd.DataFrame) -> np.ndarray:
+    """
+    Mask boolean 2D (baris x kolom) untuk cell kosong: NaN/None atau string berisi whitespace saja.
+    
+    isna() dihitung sekali untuk seluruh frame; cek string kosong hanya dijalankan
+    pada kolom object/string, satu pass per kolom tanpa apply per baris.
+    """
+    mask = df.isna().to_numpy(copy=True)
+    for position, dtype in enumerate(df.dtypes):
+        if is_string_dtype(dtype):
+            blank = df.iloc[:, position].str.strip().eq("")
+            mask[:, position] |= blank.to_numpy(dtype=bool, na_value=False)
+        elif dtype == object:
+            values = df.iloc[:, position].to_numpy()
+            # "" atau whitespace saja; sama dengan `not x.strip()` tanpa membuat string baru
+            mask[:, position] |= np.fromiter(
+                (isinstance(x, str) and (not x or x.isspace()) for x in values),
+                dtype=bool,
+                count=len(values)
+            )
+    return mask
+
+
+def normalize_text_prefix(
+    values: pd.Series,
+    prefix: str,
+    strip: bool = False,
+    skip_na: bool = True,
+    strings_only: bool = False
+) -> pd.Series:
+    """
+    Pastikan setiap nilai di kolom diawali prefix (mis. "V - "), dalam satu operasi kolom.
+    
+    Nilai yang sudah diawali prefix tidak diberi prefix lagi. Nilai non-string dikonversi
+    ke string sebelum dicek, kecuali strings_only=True (nilai non-string dibiarkan).
+    
+    Args:
+        values: Kolom yang akan dinormalisasi
+        prefix: Awalan teks yang ditambahkan jika belum ada
+        strip: Strip whitespace sebelum dicek dan sebelum prefix ditambahkan
+        skip_na: Biarkan nilai NA; jika False, NA diganti dengan prefix saja
+        strings_only: Hanya proses cell bertipe string
+        
+    Returns:
+        Series baru dengan index yang sama
+    """
+    if is_string_dtype(values.dtype):
+        # Kolom string (mis. string[pyarrow]): strip/startswith/concat langsung pada kolom, NA tetap NA
+        text = values.str.strip() if strip else values
+        starts = text.str.startswith(prefix).to_numpy(dtype=bool, na_value=True)
+        result = text.where(starts, prefix + text)
+        return result if skip_na else result.fillna(prefix)
+    
+    na = values.isna().to_numpy()
+    target = ~na
+    if strings_only:
+        target &= np.fromiter(
+            (isinstance(x, str) for x in values.to_numpy(dtype=object)),
+            dtype=bool,
+            count=len(values)
+        )
+    fill_na = not skip_na and na.any()
+    if not target.any() and not fill_na:
+        return values.copy()
+    
+    result = values.astype(object)
+    if target.any():
+        text = values[target].astype(str)
+        if strip:
+            text = text.str.strip()
+        result[target] = text.where(text.str.startswith(prefix), prefix + text).to_numpy()
+    if fill_na:
+        result[na] = prefix
+    return result
+
+
 class WhitespaceCleaner:
     """
     Menghapus whitespace (baris/kolom kosong) dari DataFrame.
@@ -18,36 +115,46 @@ class WhitespaceCleaner:
         self.clean_cols = clean_cols
         self.threshold = threshold
     
-    def clean(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Membersihkan baris dan kolom kosong dari DataFrame."""
-        result_df = df.copy()
+    def clean(self, df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
+        """
+        Membersihkan baris dan kolom kosong dari DataFrame.
+        
+        Args:
+            df: DataFrame yang akan dibersihkan
+            copy: Jika False, df boleh diubah langsung (dipakai oleh Pipeline)
+        """
+        # Mask NaN/string kosong dihitung sekali lalu dipakai untuk baris dan kolom
+        blank = empty_mask(df)
+        keep_rows = np.ones(len(df), dtype=bool)
+        keep_cols = np.ones(len(df.columns), dtype=bool)
         
         # Bersihkan baris kosong
         if self.clean_rows:
             # Hitung persentase nilai NaN atau string kosong di setiap baris
-            row_null_count = result_df.apply(
-                lambda row: row.isna().sum() + sum(1 for x in row if isinstance(x, str) and not x.strip()),
-                axis=1
-            )
-            row_null_percent = row_null_count / len(result_df.columns)
+            row_null_percent = pd.Series(blank.sum(axis=1), index=df.index) / len(df.columns)
             
             # Filter baris yang memiliki nilai kosong lebih sedikit dari threshold
-            result_df = result_df[row_null_percent < self.threshold]
+            keep_rows = (row_null_percent < self.threshold).to_numpy()
+            blank = blank[keep_rows]
         
         # Bersihkan kolom kosong
         if self.clean_cols:
             # Hitung persentase nilai NaN atau string kosong di setiap kolom
-            col_null_count = result_df.apply(
-                lambda col: col.isna().sum() + sum(1 for x in col if isinstance(x, str) and not x.strip()),
-                axis=0
-            )
-            col_null_percent = col_null_count / len(result_df)
+            col_null_percent = pd.Series(blank.sum(axis=0)) / int(keep_rows.sum())
             
             # Filter kolom yang memiliki nilai kosong lebih sedikit dari threshold
-            result_df = result_df.loc[:, col_null_percent < self.threshold]
-        
-        # Reset index setelah filtering
-        return result_df.reset_index(drop=True)
+            keep_cols = (col_null_percent < self.threshold).to_numpy()
+        
+        # Subset diambil dengan take (salinan baru tanpa flag "copy of a slice"), lalu index di-reset tanpa menyalin data
+        result_df = df
+        if not keep_rows.all():
+            result_df = result_df.take(np.flatnonzero(keep_rows))
+        if not keep_cols.all():
+            result_df = result_df.take(np.flatnonzero(keep_cols), axis=1)
+        if result_df is df and copy:
+            result_df = df.copy()
+        result_df.index = pd.RangeIndex(len(result_df))
+        return result_df
 
 
 class EmptyspaceCleaner:
@@ -67,27 +174,31 @@ class EmptyspaceCleaner:
         else:
             self.header_names = header_names
     
-    def clean(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Membersihkan baris yang memiliki cell kosong pada kolom yang ditentukan."""
+    def clean(self, df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
+        """
+        Membersihkan baris yang memiliki cell kosong pada kolom yang ditentukan.
+        
+        Args:
+            df: DataFrame yang akan dibersihkan
+            copy: Jika False, df boleh diubah langsung (dipakai oleh Pipeline)
+        """
         # Validasi keberadaan kolom
         missing_headers = [h for h in self.header_names if h not in df.columns]
         if missing_headers:
             raise ValueError(f"Header tidak ditemukan dalam DataFrame: {', '.join(missing_headers)}")
         
-        result_df = df.copy()
-        
-        # Buat mask untuk setiap kolom (True = tidak kosong, False = kosong)
-        mask = pd.Series(True, index=df.index)
-        for header in self.header_names:
-            # Kondisi not kosong: tidak NA dan isinya tidak string kosong
-            col_mask = df[header].notna() & (df[header].astype(str).str.strip() != '')
-            mask = mask & col_mask
+        # Baris dipertahankan jika semua kolom yang ditentukan tidak NA dan bukan string kosong/whitespace
+        mask = ~empty_mask(df[self.header_names]).any(axis=1)
         
         # Filter baris dengan semua kolom yang ditentukan tidak kosong
-        result_df = result_df[mask]
+        if not mask.all():
+            result_df = df.take(np.flatnonzero(mask))
+        else:
+            result_df = df.copy() if copy else df
         
-        # Reset index setelah filtering
-        return result_df.reset_index(drop=True)
+        # Reset index setelah filtering (tanpa menyalin data)
+        result_df.index = pd.RangeIndex(len(result_df))
+        return result_df
 
 
 class SectionExtractor:
@@ -105,76 +216,293 @@ class SectionExtractor:
         self.target_section_col = target_section_col
         self.remove_section_rows = remove_section_rows
     
-    def extract(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Mengekstrak section dari DataFrame."""
+    def extract(self, df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
+        """
+        Mengekstrak section dari DataFrame.
+        
+        Args:
+            df: DataFrame yang akan diproses
+            copy: Jika False, df boleh diubah langsung (dipakai oleh Pipeline)
+        """
         if self.section_indicator_col not in df.columns:
             raise ValueError(f"Kolom '{self.section_indicator_col}' tidak ditemukan dalam DataFrame")
         
-        result_df = df.copy()
+        result_df = df.copy() if copy else df
         
         # Tambahkan kolom section baru
         result_df[self.target_section_col] = None
         
         # Dapatkan indeks kolom indikator
         indicator_idx = df.columns.get_loc(self.section_indicator_col)
+        n_cols = result_df.shape[1]
         
-        current_section = None
-        section_rows = []
+        # Section header dideteksi per kolom sebagai mask boolean:
+        # 1. Nilai di kolom indikator tidak kosong (string whitespace tetap dihitung ada, seperti sebelumnya)
+        is_value_present = result_df.iloc[:, indicator_idx].notna().to_numpy()
         
-        # Identifikasi section dan isi kolom target
-        for idx, row in result_df.iterrows():
-            # Cek apakah row ini adalah section header:
-            # 1. Nilai di kolom indikator tidak kosong
-            # 2. Cell di sekitarnya (kiri dan kanan) kosong
-            value = row[self.section_indicator_col]
-            
-            # Cek jika nilai di kolom indikator tidak kosong
-            is_value_present = isinstance(value, str) and value.strip() != "" or (not pd.isna(value) and value is not None)
-            
-            # Cek jika cell di sekitarnya kosong (kiri dan kanan)
-            has_empty_surroundings = True
-            
-            # Periksa cell di kiri (jika bukan kolom pertama)
-            if indicator_idx > 0:
-                left_value = row.iloc[indicator_idx - 1]
-                if isinstance(left_value, str) and left_value.strip() != "" or (not pd.isna(left_value) and left_value is not None):
-                    has_empty_surroundings = False
-            
-            # Periksa cell di kanan (jika bukan kolom terakhir)
-            if indicator_idx < len(row) - 1:
-                right_value = row.iloc[indicator_idx + 1]
-                if isinstance(right_value, str) and right_value.strip() != "" or (not pd.isna(right_value) and right_value is not None):
-                    has_empty_surroundings = False
-            
-            # Pastikan sebagian besar cell di baris ini kosong
-            empty_cell_count = sum(1 for x in row if pd.isna(x) or (isinstance(x, str) and not x.strip()))
-            mostly_empty = empty_cell_count >= len(row) * 0.7  # 70% cell kosong
-            
-            is_section = is_value_present and has_empty_surroundings and mostly_empty
-            
-            if is_section:
-                current_section = value
-                section_rows.append(idx)
-            
-            result_df.at[idx, self.target_section_col] = current_section
+        # 2. Cell di sekitarnya (kiri dan kanan) kosong
+        has_empty_surroundings = np.ones(len(result_df), dtype=bool)
+        if indicator_idx > 0:
+            has_empty_surroundings &= result_df.iloc[:, indicator_idx - 1].isna().to_numpy()
+        if indicator_idx < n_cols - 1:
+            has_empty_surroundings &= result_df.iloc[:, indicator_idx + 1].isna().to_numpy()
+        
+        # 3. Sebagian besar cell di baris ini kosong (70%), termasuk kolom section yang masih kosong
+        mostly_empty = empty_mask(result_df).sum(axis=1) >= n_cols * 0.7
+        
+        is_section = is_value_present & has_empty_surroundings & mostly_empty
+        
+        # Propagasi label section ke baris berikutnya (forward fill posisi section terakhir)
+        values = result_df.iloc[:, indicator_idx].to_numpy(dtype=object)
+        last_section = np.maximum.accumulate(np.where(is_section, np.arange(len(result_df)), -1))
+        sections = np.empty(len(result_df), dtype=object)
+        sections[last_section >= 0] = values[last_section[last_section >= 0]]
+        result_df[self.target_section_col] = sections
         
         # Hapus baris section jika diperlukan
-        if self.remove_section_rows and section_rows:
-            result_df = result_df.drop(section_rows)
+        if self.remove_section_rows and is_section.any():
+            result_df = result_df.take(np.flatnonzero(~is_section))
+        
+        # Reset index setelah perubahan (tanpa menyalin data)
+        result_df.index = pd.RangeIndex(len(result_df))
+        return result_df
+
+
+class SectionTreeBuilder:
+    """
+    Membangun hierarki section bertingkat (level 1, level 2, ...) untuk setiap baris item
+    dan index dari path section ke rentang baris.
+    
+    Level section diambil dari kolom penomoran di sebelah kiri kolom indikator
+    ("A" -> 1, "A.1" -> 2, "1.2.3" -> 3). Jika kolom penomoran kosong, penomoran
+    bertitik di awal label (mis. "A.1 Cabling") juga dikenali; selain itu section
+    dianggap level 1, sama seperti SectionExtractor.
+    """
+    
+    def __init__(
+        self,
+        section_indicator_col: str,
+        numbering_col: Optional[str] = None,
+        level_col_prefix: str = "Section Level ",
+        remove_section_rows: bool = True
+    ):
+        """
+        Args:
+            section_indicator_col: Kolom yang berisi label section
+            numbering_col: Kolom penomoran section (default: kolom di kiri kolom indikator)
+            level_col_prefix: Prefix nama kolom level yang ditambahkan ("Section Level 1", ...)
+            remove_section_rows: Hapus baris section header dari hasil
+        """
+        self.section_indicator_col = section_indicator_col
+        self.numbering_col = numbering_col
+        self.level_col_prefix = level_col_prefix
+        self.remove_section_rows = remove_section_rows
+        self.section_index: Dict[Tuple[Any, ...], List[Tuple[int, int]]] = {}
+    
+    @staticmethod
+    def _numbering_level(value: Any) -> int:
+        """Hitung level dari satu nilai penomoran (jumlah segmen yang dipisah titik)."""
+        if isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(value, bool):
+            # Angka Excel: 1.0 -> "1", 1.1 -> "1.1"
+            value = format(value, "g")
+        segments = [segment for segment in str(value).strip().split(".") if segment.strip()]
+        return max(len(segments), 1)
+    
+    def build(self, df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
+        """
+        Menambahkan kolom path section per level dan mengisi self.section_index.
+        
+        Args:
+            df: DataFrame yang akan diproses
+            copy: Jika False, df boleh diubah langsung (dipakai oleh Pipeline)
+            
+        Returns:
+            DataFrame dengan kolom level section; self.section_index berisi
+            {path: [(start, stop), ...]} dengan posisi baris (stop eksklusif) pada hasil
+        """
+        if self.section_indicator_col not in df.columns:
+            raise ValueError(f"Kolom '{self.section_indicator_col}' tidak ditemukan dalam DataFrame")
         
-        # Reset index setelah perubahan
-        return result_df.reset_index(drop=True)
+        indicator_idx = df.columns.get_loc(self.section_indicator_col)
+        n_cols = df.shape[1]
+        if self.numbering_col is not None:
+            if self.numbering_col not in df.columns:
+                raise ValueError(f"Kolom '{self.numbering_col}' tidak ditemukan dalam DataFrame")
+            numbering_idx = df.columns.get_loc(self.numbering_col)
+        else:
+            numbering_idx = indicator_idx - 1 if indicator_idx > 0 else None
+        
+        # Deteksi section header seperti SectionExtractor, tetapi kolom penomoran boleh terisi
+        is_value_present = df.iloc[:, indicator_idx].notna().to_numpy()
+        has_empty_surroundings = np.ones(len(df), dtype=bool)
+        for neighbour in (indicator_idx - 1, indicator_idx + 1):
+            if 0 <= neighbour < n_cols and neighbour != numbering_idx:
+                has_empty_surroundings &= df.iloc[:, neighbour].isna().to_numpy()
+        # Kolom level yang ditambahkan dihitung sebagai satu kolom kosong, setara kolom target SectionExtractor
+        mostly_empty = empty_mask(df).sum(axis=1) + 1 >= (n_cols + 1) * 0.7
+        is_section = is_value_present & has_empty_surroundings & mostly_empty
+        
+        # Level hanya dihitung untuk baris section (jumlahnya kecil dibanding baris item)
+        section_pos = np.flatnonzero(is_section)
+        labels = df.iloc[section_pos, indicator_idx]
+        numbering = (
+            df.iloc[section_pos, numbering_idx] if numbering_idx is not None
+            else pd.Series(None, index=labels.index, dtype=object)
+        )
+        label_numbering = labels.astype(str).str.extract(
+            r"^\s*([A-Za-z0-9]+(?:\.[A-Za-z0-9]+)+)\.?(?:\s|$)", expand=False
+        )
+        numbering = numbering.where(~empty_mask(numbering.to_frame())[:, 0], label_numbering)
+        section_levels = np.array(
+            [1 if pd.isna(value) else self._numbering_level(value) for value in numbering],
+            dtype=np.int64
+        )
+        
+        levels = np.zeros(len(df), dtype=np.int64)
+        levels[section_pos] = section_levels
+        values = df.iloc[:, indicator_idx].to_numpy(dtype=object)
+        positions = np.arange(len(df))
+        max_level = int(section_levels.max()) if len(section_levels) else 0
+        
+        # Per level: forward fill label section level tersebut, di-reset oleh section level yang lebih tinggi
+        result_df = df.copy() if copy else df
+        level_cols = []
+        for level in range(1, max_level + 1):
+            is_marker = is_section & (levels <= level)
+            last_marker = np.maximum.accumulate(np.where(is_marker, positions, -1))
+            filled = np.empty(len(df), dtype=object)
+            valid = last_marker >= 0
+            source = last_marker[valid]
+            filled[valid] = np.where(levels[source] == level, values[source], None)
+            level_col = f"{self.level_col_prefix}{level}"
+            result_df[level_col] = filled
+            level_cols.append(level_col)
+        
+        if self.remove_section_rows and is_section.any():
+            result_df = result_df.take(np.flatnonzero(~is_section))
+        result_df.index = pd.RangeIndex(len(result_df))
+        
+        self.section_index = self._build_index(result_df, level_cols)
+        return result_df
+    
+    @staticmethod
+    def _build_index(df: pd.DataFrame, level_cols: List[str]) -> Dict[Tuple[Any, ...], List[Tuple[int, int]]]:
+        """Bangun index path -> rentang baris dari run kontigu setiap prefix path."""
+        section_index: Dict[Tuple[Any, ...], List[Tuple[int, int]]] = {}
+        if df.empty:
+            return section_index
+        
+        changed = np.zeros(len(df), dtype=bool)
+        for depth, level_col in enumerate(level_cols, start=1):
+            column = df[level_col]
+            # Run baru dimulai jika salah satu level sampai depth ini berubah (None dianggap sama)
+            previous = column.shift()
+            differs = ~((column == previous) | (column.isna() & previous.isna())).to_numpy()
+            differs[0] = True
+            changed = changed | differs
+            
+            starts = np.flatnonzero(changed)
+            stops = np.append(starts[1:], len(df))
+            present = column.notna().to_numpy()
+            path_values = df[level_cols[:depth]].to_numpy(dtype=object)
+            for start, stop in zip(starts, stops):
+                if present[start]:
+                    path = tuple(path_values[start])
+                    section_index.setdefault(path, []).append((int(start), int(stop)))
+        return section_index
+    
+    def get_rows(self, df: pd.DataFrame, path: Tuple[Any, ...]) -> pd.DataFrame:
+        """
+        Mengambil baris milik suatu path section (termasuk sub-section) dari hasil build().
+        
+        Args:
+            df: DataFrame hasil build()
+            path: Tuple label section, mis. ("A. CCTV", "A.1 Cabling")
+            
+        Returns:
+            DataFrame berisi baris pada path tersebut (kosong jika path tidak ada)
+        """
+        ranges = self.section_index.get(tuple(path), [])
+        if not ranges:
+            return df.iloc[0:0]
+        return pd.concat([df.iloc[start:stop] for start, stop in ranges])
+
+
+def _on_strings(values: pd.Series, func: Callable[[pd.Series], pd.Series]) -> pd.Series:
+    """Terapkan operasi .str hanya pada cell string; cell lain (angka, NA) dibiarkan."""
+    if is_string_dtype(values.dtype):
+        return func(values)
+    is_str = np.fromiter(
+        (isinstance(x, str) for x in values.to_numpy(dtype=object)),
+        dtype=bool,
+        count=len(values)
+    )
+    if not is_str.any():
+        return values
+    result = values.astype(object)
+    result[is_str] = func(values[is_str].astype(str)).to_numpy()
+    return result
+
+
+def _value_map(mapping: Union[Dict[Any, Any], str]) -> Callable[[pd.Series], pd.Series]:
+    """Ganti nilai sesuai dictionary; nilai yang tidak ada di dictionary dibiarkan."""
+    if isinstance(mapping, str):
+        mapping = json.loads(mapping)
+    keys = list(mapping.keys())
+    return lambda values: values.where(~values.isin(keys), values.map(mapping))
+
+
+def _default_value(value: Any) -> Callable[[pd.Series], pd.Series]:
+    """Isi nilai NA dengan value."""
+    return lambda values: values.where(values.notna(), value)
+
+
+# Registry transformasi kolom bernama: {nama: factory(argumen) -> fungsi Series -> Series}.
+# Semua fungsi bekerja per kolom (vektor), bukan per elemen.
+COLUMN_TRANSFORMS: Dict[str, Callable[..., Callable[[pd.Series], pd.Series]]] = {
+    "strip": lambda: lambda values: _on_strings(values, lambda text: text.str.strip()),
+    "upper": lambda: lambda values: _on_strings(values, lambda text: text.str.upper()),
+    "lower": lambda: lambda values: _on_strings(values, lambda text: text.str.lower()),
+    "title": lambda: lambda values: _on_strings(values, lambda text: text.str.title()),
+    "numeric": lambda: lambda values: pd.to_numeric(values, errors="coerce"),
+    "prefix": lambda prefix: lambda values: normalize_text_prefix(values, prefix),
+    "map": _value_map,
+    "default": _default_value,
+}
+
+
+def register_column_transform(name: str, factory: Callable[..., Callable[[pd.Series], pd.Series]]) -> None:
+    """
+    Daftarkan transformasi kolom bernama baru untuk FieldMapper.
+    
+    Args:
+        name: Nama transformasi yang dipakai di spesifikasi mapping
+        factory: Fungsi yang menerima argumen (opsional) dan mengembalikan fungsi Series -> Series
+    """
+    COLUMN_TRANSFORMS[name] = factory
 
 
 class FieldMapper:
     """
     Memetakan kolom sumber ke field target dengan nama baru.
+    
+    transform_functions menerima callable biasa (diterapkan per elemen dengan apply) atau
+    spesifikasi transformasi bernama dari COLUMN_TRANSFORMS yang diterapkan per kolom:
+    
+        {
+            "Name": ["strip", "prefix:V - "],
+            "Qty": "numeric",
+            "UoM": ("map", {"pcs": "Units"}),
+            "Vendor": ("default", "-")
+        }
+    
+    Kolom yang masih memakai apply dicatat di self.fallback_columns.
     """
     
     def __init__(
         self,
         mapping: Dict[str, str],
-        transform_functions: Optional[Dict[str, Callable]] = None,
+        transform_functions: Optional[Dict[str, Any]] = None,
         default_values: Optional[Dict[str, Any]] = None
     ):
         """
@@ -182,17 +510,64 @@ class FieldMapper:
         
         Args:
             mapping: Dictionary mapping dari {kolom_sumber: kolom_target}
-            transform_functions: Dictionary {kolom_target: fungsi_transformasi}
+            transform_functions: Dictionary {kolom_target: fungsi atau spesifikasi transformasi}
             default_values: Dictionary {kolom_target: nilai_default}
         """
         self.mapping = mapping  # {source_col: target_col}
         self.transform_functions = transform_functions or {}
         self.default_values = default_values or {}
+        self.fallback_columns: List[str] = []
+    
+    @staticmethod
+    def _compile_step(step: Any) -> Tuple[Callable[[pd.Series], pd.Series], bool]:
+        """
+        Kompilasi satu langkah transformasi.
+        
+        Returns:
+            Tuple (fungsi Series -> Series, True jika memakai apply per elemen)
+        """
+        if isinstance(step, str):
+            name, _, arg = step.partition(":")
+            args = (arg,) if arg else ()
+        elif isinstance(step, tuple) and step and isinstance(step[0], str):
+            name, args = step[0], step[1:]
+        elif callable(step):
+            return (lambda values: values.apply(step)), True
+        else:
+            raise ValueError(f"Spesifikasi transformasi tidak valid: {step!r}")
+        
+        if name not in COLUMN_TRANSFORMS:
+            raise ValueError(f"Transformasi '{name}' tidak dikenal. Tersedia: {', '.join(COLUMN_TRANSFORMS)}")
+        return COLUMN_TRANSFORMS[name](*args), False
+    
+    def compile(self) -> Dict[str, List[Callable[[pd.Series], pd.Series]]]:
+        """
+        Kompilasi transform_functions menjadi daftar fungsi per kolom target.
+        
+        Returns:
+            Dictionary {kolom_target: [fungsi Series -> Series, ...]}; self.fallback_columns
+            diisi dengan kolom yang memakai apply
+        """
+        compiled = {}
+        fallback_columns = []
+        for target_col, spec in self.transform_functions.items():
+            steps = spec if isinstance(spec, list) else [spec]
+            funcs = []
+            for step in steps:
+                func, uses_apply = self._compile_step(step)
+                funcs.append(func)
+                if uses_apply and target_col not in fallback_columns:
+                    fallback_columns.append(target_col)
+            compiled[target_col] = funcs
+        self.fallback_columns = fallback_columns
+        return compiled
     
-    def map_fields(self, df: pd.DataFrame) -> pd.DataFrame:
+    def map_fields(self, df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
         """
         Memetakan kolom dari DataFrame sumber ke DataFrame target dengan nama baru.
         
+        Jika copy=False, kolom sumber dipakai tanpa disalin terlebih dahulu (dipakai oleh Pipeline).
+        
         Contoh:
             Jika dataframe input punya kolom ['description', 'quantity', 'supplier']
             Dan mapping = {'description': 'Name', 'quantity': 'Jumlah', 'supplier': 'Vendor'}
@@ -200,37 +575,148 @@ class FieldMapper:
             Maka output DataFrame akan punya kolom ['Name', 'Jumlah', 'Vendor'] dengan
             data yang sesuai dari dataframe input.
         """
-        # Buat DataFrame baru dengan kolom target
-        result_df = pd.DataFrame()
+        compiled = self.compile()
         
-        # Salin data dari kolom sumber ke kolom target
+        # Kumpulkan semua kolom target dulu, lalu bangun DataFrame sekali
+        columns: Dict[str, Any] = {}
         for source_col, target_col in self.mapping.items():
             if source_col in df.columns:
                 # Salin data dari kolom sumber ke kolom target dengan nama baru
-                result_df[target_col] = df[source_col].copy()
+                columns[target_col] = df[source_col].copy() if copy else df[source_col]
             elif target_col in self.default_values:
                 # Jika kolom sumber tidak ada tapi ada nilai default untuk target
-                result_df[target_col] = self.default_values[target_col]
+                columns[target_col] = self.default_values[target_col]
             else:
                 # Jika kolom sumber tidak ada dan tidak ada nilai default, isi dengan NaN
-                result_df[target_col] = np.nan
+                columns[target_col] = np.nan
         
-        # Terapkan fungsi transformasi jika ada
-        for target_col, transform_func in self.transform_functions.items():
-            if target_col in result_df.columns:
-                result_df[target_col] = result_df[target_col].apply(transform_func)
+        # Nilai skalar (default/NaN) diperluas ke seluruh baris
+        for target_col, value in columns.items():
+            if not isinstance(value, pd.Series):
+                columns[target_col] = pd.Series(value, index=df.index)
+        
+        # Terapkan fungsi transformasi (vektor per kolom; callable biasa lewat apply)
+        for target_col, funcs in compiled.items():
+            if target_col in columns:
+                for func in funcs:
+                    columns[target_col] = func(columns[target_col])
         
         # Tambahkan field default yang belum ada di result_df
         for target_col, default_value in self.default_values.items():
-            if target_col not in result_df.columns:
-                result_df[target_col] = default_value
+            if target_col not in columns:
+                columns[target_col] = pd.Series(default_value, index=df.index)
         
-        return result_df
+        return pd.DataFrame(columns, index=df.index)
+
+
+class NormalizedKeyIndex:
+    """
+    Index hash dari kunci ternormalisasi (astype(str) + lower) ke posisi baris.
+    
+    Index dibangun sekali untuk satu kolom, lalu dapat dipakai untuk lookup
+    berulang (validasi, pencocokan nilai) tanpa menormalisasi ulang kolom.
+    Normalisasi sama dengan perbandingan astype(str).str.lower() sebelumnya:
+    tidak ada strip kecuali strip=True, dan nilai NA menjadi teksnya ("nan", "none").
+    """
+    
+    # Kode untuk kunci probe yang tidak ditemukan
+    MISSING = -1
+    
+    def __init__(self, keys: pd.Series, match_case: bool = False, strip: bool = False):
+        """
+        Args:
+            keys: Kolom kunci yang diindeks
+            match_case: Jika True, kunci dibandingkan apa adanya (tanpa konversi/lower)
+            strip: Jika True, kunci juga di-strip sebelum dibandingkan (diabaikan jika match_case=True)
+        """
+        self.match_case = match_case
+        self.strip = strip
+        normalized = self.normalize(keys, match_case, strip)
+        codes, uniques = pd.factorize(normalized, use_na_sentinel=False)
+        self.codes = codes.astype(np.int64)
+        self.uniques = pd.Index(uniques, dtype=object)
+        self._groups: Optional[Dict[int, np.ndarray]] = None
+    
+    @staticmethod
+    def normalize(values: Union[pd.Series, List[Any]], match_case: bool = False, strip: bool = False) -> np.ndarray:
+        """
+        Normalisasi kunci: semua nilai (termasuk NA) dikonversi ke string lalu di-lower.
+        
+        Args:
+            values: Nilai yang dinormalisasi
+            match_case: Jika True, nilai dikembalikan apa adanya
+            strip: Jika True, string juga di-strip
+            
+        Returns:
+            Array object
+        """
+        values = values if isinstance(values, pd.Series) else pd.Series(list(values), dtype=object)
+        if match_case:
+            return values.to_numpy(dtype=object)
+        if is_string_dtype(values.dtype) and values.dtype != object:
+            # Kolom string[pyarrow]: lower lewat kernel Arrow, NA menjadi "<na>" seperti astype(str).str.lower()
+            text = values.str.lower().fillna(str(pd.NA).lower())
+        else:
+            text = values.astype(str).str.lower()
+        if strip:
+            text = text.str.strip()
+        return text.to_numpy(dtype=object)
+    
+    def lookup(self, values: Union[pd.Series, List[Any]]) -> np.ndarray:
+        """
+        Cari kode kunci untuk setiap nilai probe.
+        
+        Returns:
+            Array kode (MISSING jika tidak ditemukan)
+        """
+        normalized = self.normalize(values, self.match_case, self.strip)
+        return self.uniques.get_indexer(normalized).astype(np.int64)
+    
+    def contains(self, value: Any) -> bool:
+        """Apakah nilai (setelah normalisasi) ada di index."""
+        return bool(self.lookup([value])[0] >= 0)
+    
+    def positions(self, value: Any) -> np.ndarray:
+        """
+        Posisi baris yang kuncinya sama dengan value (setelah normalisasi).
+        
+        Returns:
+            Array posisi baris (urut), kosong jika tidak ditemukan
+        """
+        if self._groups is None:
+            order = np.argsort(self.codes, kind="stable")
+            sorted_codes = self.codes[order]
+            boundaries = np.flatnonzero(np.diff(sorted_codes)) + 1
+            self._groups = {
+                int(group[0]): positions
+                for group, positions in zip(np.split(sorted_codes, boundaries), np.split(order, boundaries))
+                if len(group)
+            }
+        code = int(self.lookup([value])[0])
+        return self._groups.get(code, np.empty(0, dtype=np.int64))
+
+
+class PreparedJoin:
+    """
+    DataFrame kanan yang sudah disiapkan oleh DataFrameJoiner.prepare.
+    
+    frame berisi kolom yang akan digabungkan (data kolom tidak disalin) ditambah kolom
+    kunci ternormalisasi join_key yang dihitung sekali, sehingga dapat di-merge
+    dengan sejumlah DataFrame kiri.
+    """
+    
+    def __init__(self, frame: pd.DataFrame, right_key: str, join_key: str):
+        self.frame = frame
+        self.right_key = right_key
+        self.join_key = join_key
 
 
 class DataFrameJoiner:
     """
     Menggabungkan dua DataFrame berdasarkan kolom kunci yang sama/terkait.
+    
+    Untuk join berulang ke DataFrame kanan yang sama, gunakan prepare() sekali lalu
+    join(left_df, prepared) untuk setiap DataFrame kiri.
     """
     
     def __init__(
@@ -249,11 +735,16 @@ class DataFrameJoiner:
         self.target_column_names = target_column_names or {}
         self.match_case = match_case
     
-    def join(self, left_df: pd.DataFrame, right_df: pd.DataFrame) -> pd.DataFrame:
-        """Menggabungkan dua DataFrame berdasarkan kunci."""
-        # Validasi keberadaan kolom kunci
-        if self.left_key not in left_df.columns:
-            raise ValueError(f"Kolom '{self.left_key}' tidak ditemukan dalam DataFrame kiri")
+    def prepare(self, right_df: pd.DataFrame) -> PreparedJoin:
+        """
+        Siapkan DataFrame kanan: pilih dan rename kolom, lalu hitung kolom kunci ternormalisasi sekali.
+        
+        Args:
+            right_df: DataFrame kanan (tidak diubah dan tidak disalin penuh)
+            
+        Returns:
+            PreparedJoin yang dapat dipakai berulang kali di join()
+        """
         if self.right_key not in right_df.columns:
             raise ValueError(f"Kolom '{self.right_key}' tidak ditemukan dalam DataFrame kanan")
         
@@ -265,53 +756,78 @@ class DataFrameJoiner:
                 raise ValueError(f"Kolom tidak ditemukan di DataFrame kanan: {', '.join(invalid_cols)}")
             
             columns_to_use = [self.right_key] + self.columns_to_add
-            right_df_subset = right_df[columns_to_use].copy()
+            right_df_subset = right_df[columns_to_use]
         else:
-            # Gunakan semua kolom selain right_key
-            right_df_subset = right_df.copy()
+            # Gunakan semua kolom (salinan dangkal: kolom kunci sementara tidak mengubah right_df)
+            right_df_subset = right_df.copy(deep=False)
         
         # Rename kolom sesuai target_column_names
         for old_name, new_name in self.target_column_names.items():
             if old_name in right_df_subset.columns:
-                right_df_subset = right_df_subset.rename(columns={old_name: new_name})
+                right_df_subset = right_df_subset.rename(columns={old_name: new_name}, copy=False)
         
-        # Persiapkan data untuk join jika tidak match_case
-        left_df_copy = left_df.copy()
-        right_df_copy = right_df_subset.copy()
+        if self.match_case:
+            join_key = self.right_key
+        else:
+            # Kunci non-case-sensitive dihitung sekali untuk semua join berikutnya
+            join_key = f'__{self.right_key}_lower'
+            right_df_subset[join_key] = NormalizedKeyIndex.normalize(right_df_subset[self.right_key])
         
-        if not self.match_case:
-            # Konversi kunci ke lowercase untuk non-case-sensitive matching
-            left_df_copy[f'__{self.left_key}_lower'] = left_df_copy[self.left_key].astype(str).str.lower()
-            right_df_copy[f'__{self.right_key}_lower'] = right_df_copy[self.right_key].astype(str).str.lower()
+        return PreparedJoin(right_df_subset, self.right_key, join_key)
+    
+    def join(self, left_df: pd.DataFrame, right_df: Union[pd.DataFrame, PreparedJoin]) -> pd.DataFrame:
+        """
+        Menggabungkan dua DataFrame berdasarkan kunci.
+        
+        Tanpa match_case, kunci dicocokkan setelah astype(str) + lower (tanpa strip; NaN/None
+        menjadi "nan"/"none" sehingga tetap saling cocok). Urutan baris dan pencocokan NA
+        mengikuti pd.merge sesuai join_type.
+        
+        Args:
+            left_df: DataFrame kiri
+            right_df: DataFrame kanan atau hasil prepare() dari joiner dengan match_case yang sama
             
-            join_key_left = f'__{self.left_key}_lower'
-            join_key_right = f'__{self.right_key}_lower'
-        else:
+        Returns:
+            DataFrame hasil join
+        """
+        # Validasi keberadaan kolom kunci
+        if self.left_key not in left_df.columns:
+            raise ValueError(f"Kolom '{self.left_key}' tidak ditemukan dalam DataFrame kiri")
+        
+        prepared = right_df if isinstance(right_df, PreparedJoin) else self.prepare(right_df)
+        
+        if self.match_case:
+            left_keyed = left_df
             join_key_left = self.left_key
-            join_key_right = self.right_key
+        else:
+            # Salinan dangkal: hanya kolom kunci sementara yang ditambahkan, data left_df tidak disalin
+            left_keyed = left_df.copy(deep=False)
+            join_key_left = f'__{self.left_key}_lower'
+            left_keyed[join_key_left] = NormalizedKeyIndex.normalize(left_df[self.left_key])
         
         # Lakukan join
         result_df = pd.merge(
-            left_df_copy,
-            right_df_copy,
+            left_keyed,
+            prepared.frame,
             how=self.join_type,
             left_on=join_key_left,
-            right_on=join_key_right,
+            right_on=prepared.join_key,
             suffixes=('', '_right')
         )
         
         # Hapus kolom temporary jika menggunakan non-case-sensitive matching
         if not self.match_case:
-            result_df = result_df.drop(columns=[f'__{self.left_key}_lower', f'__{self.right_key}_lower'])
+            result_df = result_df.drop(columns=[join_key_left, prepared.join_key])
         
         # Hapus kolom duplikat dari right_df (biasanya kolom kunci)
-        if f'{self.right_key}_right' in result_df.columns:
-            result_df = result_df.drop(columns=[f'{self.right_key}_right'])
-        elif self.right_key != self.left_key and self.right_key in result_df.columns:
-            result_df = result_df.drop(columns=[self.right_key])
+        if f'{prepared.right_key}_right' in result_df.columns:
+            result_df = result_df.drop(columns=[f'{prepared.right_key}_right'])
+        elif prepared.right_key != self.left_key and prepared.right_key in result_df.columns:
+            result_df = result_df.drop(columns=[prepared.right_key])
         
         return result_df
 
+
 class DuplicateSuppressor:
     """
     Menghilangkan tampilan nilai duplikat pada dataframe untuk meningkatkan keterbacaan.
@@ -365,12 +881,33 @@ class DuplicateSuppressor:
             
         self.replacement_value = replacement_value
     
-    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+    @staticmethod
+    def _equals_previous(series: pd.Series, nan_equal: bool) -> np.ndarray:
+        """
+        Bandingkan setiap nilai dengan nilai pada baris sebelumnya.
+        
+        Args:
+            series: Kolom yang dibandingkan
+            nan_equal: Anggap dua nilai NaN berurutan sebagai sama
+            
+        Returns:
+            Array boolean; baris pertama selalu False
+        """
+        previous = series.shift()
+        equal = (series == previous).fillna(False).to_numpy(dtype=bool)
+        if nan_equal:
+            equal |= (series.isna() & previous.isna()).to_numpy()
+        if len(equal):
+            equal[0] = False
+        return equal
+    
+    def transform(self, df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
         """
         Transform DataFrame dengan menghilangkan tampilan nilai duplikat.
         
         Args:
             df: DataFrame untuk ditransformasi
+            copy: Jika False, df boleh diubah langsung (dipakai oleh Pipeline)
             
         Returns:
             DataFrame dengan tampilan nilai duplikat dihilangkan
@@ -386,52 +923,31 @@ class DuplicateSuppressor:
         
         # Jika DataFrame kosong atau hanya memiliki satu baris, return as is
         if len(df) <= 1:
-            return df.copy()
+            return df.copy() if copy else df
         
-        # Salin DataFrame untuk hasil
-        result_df = df.copy()
-        
-        # Urutkan data berdasarkan kolom grouping jika diminta
+        # Urutkan data berdasarkan kolom grouping jika diminta (sort_values sudah menghasilkan salinan)
         if self.sort_data:
-            result_df = result_df.sort_values(by=self.group_by).reset_index(drop=True)
+            result_df = df.sort_values(by=self.group_by, ignore_index=True)
+        else:
+            result_df = df.copy() if copy else df
         
         # Simpan tipe data asli untuk kolom yang akan di-suppress
         original_dtypes = {col: result_df[col].dtype for col in self.columns_to_suppress}
         
-        # Iterate through DataFrame
-        for idx in range(1, len(result_df)):  # Start from second row
-            # Cek apakah baris ini dalam grup yang sama dengan baris sebelumnya
-            same_group = True
-            for col in self.group_by:
-                current_val = result_df.iloc[idx][col]
-                prev_val = result_df.iloc[idx-1][col]
-                
-                # Handle NaN values
-                if pd.isna(current_val) and pd.isna(prev_val):
-                    continue  # Both NaN, considered equal
-                elif pd.isna(current_val) or pd.isna(prev_val):
-                    same_group = False  # One is NaN, one is not
-                    break
-                elif current_val != prev_val:
-                    same_group = False
-                    break
-            
-            # Jika dalam grup yang sama, cek nilai kolom yang akan di-suppress
-            if same_group:
-                for col in self.columns_to_suppress:
-                    current_val = result_df.iloc[idx][col]
-                    prev_val = result_df.iloc[idx-1][col]
-                    
-                    # Handle NaN values
-                    if pd.isna(current_val) and pd.isna(prev_val):
-                        continue  # Both NaN, considered equal
-                    elif pd.isna(current_val) or pd.isna(prev_val):
-                        continue  # One is NaN, different values
-                    elif current_val != prev_val:
-                        continue  # Different values
-                    
-                    # Jika sama, suppress dengan replacement_value
-                    result_df.iloc[idx, result_df.columns.get_loc(col)] = self.replacement_value
+        # Baris dalam grup yang sama dengan baris sebelumnya (NaN dianggap sama)
+        same_group = np.ones(len(result_df), dtype=bool)
+        for col in self.group_by:
+            same_group &= self._equals_previous(result_df[col], nan_equal=True)
+        
+        # Suppress nilai yang sama dengan baris sebelumnya (NaN tidak pernah di-suppress)
+        for col in self.columns_to_suppress:
+            mask = same_group & self._equals_previous(result_df[col], nan_equal=False)
+            if mask.any():
+                values = result_df[col]
+                # Kolom string (mis. string[pyarrow]) hanya menerima str/NA; replacement lain butuh object
+                if is_string_dtype(values.dtype) and not (isinstance(self.replacement_value, str) or pd.isna(self.replacement_value)):
+                    values = values.astype(object)
+                result_df[col] = values.where(~mask, self.replacement_value)
         
         # Kembalikan tipe data asli jika replacement_value adalah string kosong
         if self.replacement_value == "":
@@ -506,12 +1022,20 @@ class DuplicateRestorer:
             
         self.consider_empty_as_null = consider_empty_as_null
     
-    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+    def transform(
+        self,
+        df: pd.DataFrame,
+        copy: bool = True,
+        rows: Optional[Union[np.ndarray, pd.Series]] = None
+    ) -> pd.DataFrame:
         """
         Transform DataFrame dengan mengisi nilai kosong dengan nilai terakhir yang tidak kosong.
         
         Args:
             df: DataFrame untuk ditransformasi
+            copy: Jika False, df boleh diubah langsung (dipakai oleh Pipeline)
+            rows: Mask boolean per baris df (opsional); hanya baris True yang boleh diisi.
+                Semua baris tetap menjadi sumber nilai. Default: semua baris.
             
         Returns:
             DataFrame dengan nilai kosong diisi kembali
@@ -528,112 +1052,59 @@ class DuplicateRestorer:
         
         # Jika DataFrame kosong, return as is
         if len(df) == 0:
-            return df.copy()
+            return df.copy() if copy else df
         
-        # Salin DataFrame untuk hasil
-        result_df = df.copy()
+        if rows is not None:
+            rows = np.asarray(rows, dtype=bool)
+            if len(rows) != len(df):
+                raise ValueError("Panjang rows harus sama dengan jumlah baris DataFrame")
         
-        # Urutkan data berdasarkan kolom grouping jika diminta
+        # Urutkan data berdasarkan kolom grouping jika diminta (sort_values sudah menghasilkan salinan)
         if self.sort_data and self.group_by:
-            result_df = result_df.sort_values(by=self.group_by).reset_index(drop=True)
+            if rows is None:
+                result_df = df.sort_values(by=self.group_by, ignore_index=True)
+            else:
+                # Index posisi (tanpa menyalin data) agar mask rows bisa diurutkan mengikuti baris
+                result_df = df.set_axis(pd.RangeIndex(len(df)), copy=False).sort_values(by=self.group_by)
+                rows = rows[result_df.index.to_numpy()]
+                result_df.index = pd.RangeIndex(len(result_df))
+        else:
+            result_df = df.copy() if copy else df
         
-        # Fungsi untuk menentukan apakah nilai dianggap kosong
-        def is_empty(val):
-            if pd.isna(val):
-                return True
-            if self.consider_empty_as_null and isinstance(val, str) and val.strip() == "":
-                return True
-            return False
+        # Nilai kosong: NaN/None, dan string kosong/whitespace jika consider_empty_as_null
+        if self.consider_empty_as_null:
+            empty = empty_mask(result_df[self.columns_to_restore])
+        else:
+            empty = result_df[self.columns_to_restore].isna().to_numpy()
         
+        # Hanya cell kosong di baris yang diminta yang perlu diisi
+        if rows is not None:
+            empty_targets = empty & rows[:, None]
+            if not empty_targets.any():
+                return result_df
+        else:
+            empty_targets = empty
+        
+        # Forward fill lalu backward fill posisi baris bernilai (bukan nilainya), sehingga
+        # nilai kosong di awal grup/kolom diisi dengan nilai valid pertama seperti sebelumnya.
+        # Tanpa group_by seluruh kolom dianggap satu grup; baris dengan kunci grup NaN tidak diisi.
+        positions = pd.DataFrame(
+            np.where(empty, np.nan, np.arange(len(result_df), dtype=np.float64)[:, None]),
+            index=result_df.index
+        )
         if self.group_by:
-            # Gunakan groupby untuk memproses setiap grup secara terpisah
-            # Ini menangani kasus data yang mungkin tidak berurutan
-            groups = result_df.groupby(self.group_by)
-            
-            for group_name, group_df in groups:
-                group_indices = group_df.index
-                
-                # Iterate kolom yang akan diisi
-                for col in self.columns_to_restore:
-                    # Track nilai terakhir yang valid untuk kolom ini dalam grup
-                    last_value = None
-                    first_valid_idx = None
-                    
-                    # Cari nilai pertama yang valid dalam grup untuk kolom ini
-                    for idx in group_indices:
-                        val = result_df.at[idx, col]
-                        if not is_empty(val):
-                            first_valid_idx = idx
-                            last_value = val
-                            break
-                    
-                    # Jika tidak ada nilai valid dalam grup, lanjutkan ke kolom berikutnya
-                    if last_value is None:
-                        continue
-                    
-                    # Dalam urutan maju, isi nilai kosong
-                    for idx in group_indices:
-                        val = result_df.at[idx, col]
-                        if is_empty(val):
-                            result_df.at[idx, col] = last_value
-                        else:
-                            # Update last value
-                            last_value = val
+            keys = [result_df[col] for col in self.group_by]
+            positions = positions.groupby(keys, sort=False).ffill()
+            positions = positions.groupby(keys, sort=False).bfill()
         else:
-            # Tanpa grup, restore berdasarkan urutan baris dan perubahan nilai
-            # Iterate kolom yang akan diisi
-            for col in self.columns_to_restore:
-                # Cari nilai non-null pertama di kolom
-                last_value = None
-                
-                # Catat indeks dimana terjadi perubahan nilai (bukan null-ke-nilai)
-                change_indices = []
-                prev_non_null = None
-                
-                for idx in range(len(result_df)):
-                    val = result_df.iloc[idx][col]
-                    
-                    if not is_empty(val):
-                        if last_value is None:
-                            last_value = val
-                        
-                        # Jika nilai berbeda dengan nilai non-null sebelumnya, catat perubahan
-                        if prev_non_null is not None and val != prev_non_null:
-                            change_indices.append(idx)
-                        
-                        prev_non_null = val
-                
-                # Jika tidak ditemukan nilai valid, lewati kolom ini
-                if last_value is None:
-                    continue
-                
-                # Tambahkan indeks 0 dan len(df) ke daftar indeks perubahan
-                if 0 not in change_indices:
-                    change_indices.insert(0, 0)
-                change_indices.append(len(result_df))
-                
-                # Proses setiap segmen terpisah (segmen = rentang antara dua perubahan nilai)
-                for i in range(len(change_indices) - 1):
-                    start_idx = change_indices[i]
-                    end_idx = change_indices[i+1]
-                    
-                    # Cari nilai non-null pertama di segmen ini
-                    first_value = None
-                    for idx in range(start_idx, end_idx):
-                        val = result_df.iloc[idx][col]
-                        if not is_empty(val):
-                            first_value = val
-                            break
-                    
-                    # Jika tidak ada nilai non-null di segmen ini, gunakan nilai dari segmen sebelumnya
-                    if first_value is None:
-                        continue
-                    
-                    # Isi nilai kosong di segmen ini dengan nilai first_value
-                    for idx in range(start_idx, end_idx):
-                        val = result_df.iloc[idx][col]
-                        if is_empty(val):
-                            result_df.iloc[idx, result_df.columns.get_loc(col)] = first_value
+            positions = positions.ffill().bfill()
+        sources = positions.to_numpy()
+        
+        for i, col in enumerate(self.columns_to_restore):
+            fill = empty_targets[:, i] & ~np.isnan(sources[:, i])
+            if fill.any():
+                values = result_df[col].array
+                result_df.loc[fill, col] = values[sources[fill, i].astype(np.int64)]
         
         return result_df
 
@@ -679,12 +1150,13 @@ class TextPrefixFormatter:
         self.prefix = prefix
         self.skip_na = skip_na
     
-    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+    def transform(self, df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
         """
         Transform DataFrame dengan memastikan semua nilai di kolom target memiliki awalan teks.
         
         Args:
             df: DataFrame untuk ditransformasi
+            copy: Jika False, df boleh diubah langsung (dipakai oleh Pipeline)
             
         Returns:
             DataFrame dengan nilai di kolom target yang sudah diformat
@@ -694,29 +1166,15 @@ class TextPrefixFormatter:
             raise ValueError(f"Kolom '{self.column}' tidak ditemukan dalam DataFrame")
         
         # Salin DataFrame untuk hasil
-        result_df = df.copy()
-        
-        # Fungsi untuk menambahkan prefix jika belum ada
-        def add_prefix_if_missing(text):
-            if pd.isna(text):
-                # Jika nilai adalah NA dan skip_na=True, return as is
-                if self.skip_na:
-                    return text
-                # Jika tidak, tambahkan prefix ke string kosong
-                else:
-                    return self.prefix
-            
-            # Konversi ke string untuk memastikan
-            text_str = str(text).strip()
-            
-            # Cek apakah sudah memiliki prefix
-            if text_str.startswith(self.prefix):
-                return text_str
-            else:
-                return self.prefix + text_str
-        
-        # Terapkan fungsi ke kolom target
-        result_df[self.column] = result_df[self.column].apply(add_prefix_if_missing)
+        result_df = df.copy() if copy else df
+        
+        # Nilai di-strip lalu diberi prefix jika belum ada (NA dilewati atau diganti prefix sesuai skip_na)
+        result_df[self.column] = normalize_text_prefix(
+            result_df[self.column],
+            self.prefix,
+            strip=True,
+            skip_na=self.skip_na
+        )
         
         return result_df
     
@@ -753,26 +1211,27 @@ class StaticFieldAdder:
         """
         self.fields_to_add = fields_to_add
     
-    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+    def transform(self, df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
         """
         Transform DataFrame dengan menambahkan kolom baru dengan nilai statis.
         
         Args:
             df: DataFrame untuk ditransformasi
+            copy: Jika False, df boleh diubah langsung (dipakai oleh Pipeline)
             
         Returns:
             DataFrame dengan kolom baru yang ditambahkan
         """
+        # Periksa dulu apakah kolom sudah ada, agar df tidak berubah sebagian saat copy=False
+        for field_name in self.fields_to_add:
+            if field_name in df.columns:
+                raise ValueError(f"Kolom '{field_name}' sudah ada dalam DataFrame")
+        
         # Salin DataFrame untuk hasil
-        result_df = df.copy()
+        result_df = df.copy() if copy else df
         
-        # Tambahkan setiap kolom baru
+        # Tambahkan setiap kolom baru dengan nilai statis
         for field_name, field_value in self.fields_to_add.items():
-            # Periksa apakah kolom sudah ada
-            if field_name in result_df.columns:
-                raise ValueError(f"Kolom '{field_name}' sudah ada dalam DataFrame")
-            
-            # Tambahkan kolom baru dengan nilai statis
             result_df[field_name] = field_value
         
         return result_df
@@ -815,12 +1274,13 @@ class ColumnReorderer:
         self.column_order = column_order
         self.include_remaining = include_remaining
     
-    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+    def transform(self, df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
         """
         Transform DataFrame dengan mengubah urutan kolom.
         
         Args:
             df: DataFrame untuk ditransformasi
+            copy: Jika False, df boleh diubah langsung (dipakai oleh Pipeline)
             
         Returns:
             DataFrame dengan urutan kolom yang diubah
@@ -840,7 +1300,7 @@ class ColumnReorderer:
             new_column_order = self.column_order
         
         # Reorder kolom
-        result_df = df[new_column_order].copy()
+        result_df = df[new_column_order].copy() if copy else df[new_column_order]
         
         return result_df
     
@@ -923,12 +1383,13 @@ class DataFrameSorter:
             if not isinstance(order_list, list):
                 raise ValueError(f"Custom order untuk kolom {col} harus berupa list")
     
-    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+    def transform(self, df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
         """
         Transform DataFrame dengan mengurutkan berdasarkan kriteria yang ditentukan.
         
         Args:
             df: DataFrame untuk ditransformasi
+            copy: Jika False, df boleh diubah langsung (dipakai oleh Pipeline)
             
         Returns:
             DataFrame yang sudah diurutkan
@@ -943,8 +1404,12 @@ class DataFrameSorter:
         if missing_custom_cols:
             raise ValueError(f"Kolom custom order tidak ditemukan dalam DataFrame: {', '.join(missing_custom_cols)}")
         
-        # Salin DataFrame untuk hasil
-        result_df = df.copy()
+        # Simpan tipe data asli sebelum kolom custom order diubah menjadi kategorikal
+        original_dtypes = {col: df[col].dtype for col in self.custom_order.keys()}
+        
+        # Salinan hanya diperlukan jika custom order mengubah kolom sebelum pengurutan;
+        # sort_values sendiri sudah menghasilkan salinan
+        result_df = df.copy() if copy and self.custom_order else df
         
         # Terapkan custom ordering jika ada
         if self.custom_order:
@@ -953,21 +1418,18 @@ class DataFrameSorter:
                 cat_type = pd.CategoricalDtype(categories=order_list, ordered=True)
                 result_df[col] = result_df[col].astype(cat_type)
         
-        # Lakukan pengurutan
+        # Lakukan pengurutan (reset index sekaligus jika diminta)
         result_df = result_df.sort_values(
             by=self.sort_columns,
             ascending=self.ascending_values,
-            na_position=self.na_position
+            na_position=self.na_position,
+            ignore_index=self.reset_index
         )
         
-        # Reset index jika diminta
-        if self.reset_index:
-            result_df = result_df.reset_index(drop=True)
-        
         # Kembalikan tipe data asli untuk kolom yang menggunakan custom ordering
         for col in self.custom_order.keys():
             # Kembalikan ke tipe data asli (atau object sebagai fallback)
-            result_df[col] = result_df[col].astype(df[col].dtype)
+            result_df[col] = result_df[col].astype(original_dtypes[col])
         
         return result_df
     
@@ -1025,5 +1487,127 @@ class DataFrameSorter:
             reset_index=reset_index,
             custom_order=custom_order
         )
+
+        return sorter.transform(df)
+
+
+class Pipeline:
+    """
+    Menjalankan urutan transformer dengan satu salinan DataFrame di awal.
+    
+    Setiap transformer di modul ini secara default menyalin DataFrame input. Pipeline
+    menyalin input sekali, lalu memanggil setiap langkah dengan copy=False sehingga
+    langkah-langkah bekerja langsung pada frame milik pipeline. Waktu dan puncak
+    memori setiap langkah dicatat di self.report.
+    
+    Contoh:
+        pipeline = Pipeline([
+            WhitespaceCleaner(),
+            SectionExtractor("Description", "Section"),
+            DuplicateRestorer("Product"),
+            ColumnReorderer(["Section", "Product"])
+        ])
+        result_df = pipeline.run(df)
+        print(pipeline.format_report())
+    """
+    
+    # Nama metode transformasi yang dikenali, sesuai urutan prioritas
+    STEP_METHODS = ("transform", "clean", "extract", "build", "map_fields")
+    
+    def __init__(
+        self,
+        steps: List[Any],
+        copy: bool = True,
+        track_memory: bool = False
+    ):
+        """
+        Inisialisasi Pipeline.
+        
+        Args:
+            steps: List transformer (objek dengan salah satu metode STEP_METHODS yang menerima argumen copy) atau
+                   fungsi df -> df; fungsi biasa dipanggil tanpa argumen copy
+            copy: Salin DataFrame input sekali sebelum langkah pertama (default: True).
+                  Jika False, DataFrame input boleh diubah langsung
+            track_memory: Catat puncak alokasi memori per langkah dengan tracemalloc (default: False).
+                          tracemalloc memperlambat setiap alokasi, jadi nyalakan hanya saat benchmark
+        """
+        for step in steps:
+            if not callable(step) and self._step_method_name(step) is None:
+                raise ValueError(f"Langkah pipeline tidak memiliki metode transformasi: {type(step).__name__}")
+        
+        self.steps = steps
+        self.copy = copy
+        self.track_memory = track_memory
+        self.report: List[Dict[str, Any]] = []
+    
+    @classmethod
+    def _step_method_name(cls, step: Any) -> Optional[str]:
+        """Cari nama metode transformasi pada langkah (None jika tidak ada)."""
+        for name in cls.STEP_METHODS:
+            if callable(getattr(step, name, None)):
+                return name
+        return None
+    
+    def run(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Menjalankan semua langkah secara berurutan.
         
-        return sorter.transform(df)
\ No newline at end of file
+        Args:
+            df: DataFrame input
+            
+        Returns:
+            DataFrame hasil langkah terakhir
+        """
+        self.report = []
+        frame = df.copy() if self.copy else df
+        
+        # tracemalloc hanya dihentikan jika dinyalakan oleh pipeline ini
+        started_tracing = self.track_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        
+        try:
+            for step in self.steps:
+                method_name = self._step_method_name(step)
+                if self.track_memory:
+                    tracemalloc.reset_peak()
+                    baseline = tracemalloc.get_traced_memory()[0]
+                
+                start = time.perf_counter()
+                if method_name is None:
+                    frame = step(frame)
+                else:
+                    frame = getattr(step, method_name)(frame, copy=False)
+                elapsed = time.perf_counter() - start
+                
+                entry = {
+                    "step": type(step).__name__ if method_name else getattr(step, "__name__", type(step).__name__),
+                    "seconds": elapsed,
+                    "peak_bytes": None,
+                    "rows": len(frame),
+                    "columns": len(frame.columns)
+                }
+                if self.track_memory:
+                    entry["peak_bytes"] = max(tracemalloc.get_traced_memory()[1] - baseline, 0)
+                self.report.append(entry)
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+        
+        return frame
+    
+    def format_report(self) -> str:
+        """
+        Format self.report sebagai tabel teks.
+        
+        Returns:
+            String berisi satu baris per langkah (waktu, puncak memori, ukuran hasil)
+        """
+        lines = []
+        for entry in self.report:
+            line = f"{entry['step']:<22} {entry['seconds'] * 1000:>9.1f} ms"
+            if entry["peak_bytes"] is not None:
+                line += f" {entry['peak_bytes'] / (1024 * 1024):>9.1f} MB peak"
+            line += f"  -> {entry['rows']} x {entry['columns']}"
+            lines.append(line)
+        return "\n".join(lines)
@@ -1,6 +1,7 @@
+import difflib
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Union, Optional, Any
+from typing import Dict, List, Union, Optional, Any, Tuple
 
 
 class DataPreview:
@@ -115,6 +116,27 @@ class ConfigManager:
         Returns:
             Dictionary of {source_field: target_field}
         """
+        mapping, default_values, _ = ConfigManager.load_mapping_spec(mapping_file)
+        return mapping, default_values
+    
+    @staticmethod
+    def load_mapping_spec(mapping_file: str) -> Tuple[Dict[str, str], Dict[str, Any], Dict[str, List[str]]]:
+        """
+        Load field mapping beserta spesifikasi transformasi kolom dari CSV.
+        
+        Format CSV: source_field,target_field,default_value,transform
+        
+        Kolom transform (opsional) berisi nama transformasi FieldMapper yang dipisah "|",
+        mis. "strip|prefix:V - ", sehingga hasilnya bisa langsung dipakai sebagai
+        transform_functions dan dijalankan per kolom.
+        
+        Args:
+            mapping_file: Path to CSV mapping file
+            
+        Returns:
+            Tuple (mapping {source: target}, default_values {target: value},
+            transform_functions {target: [spesifikasi, ...]})
+        """
         mapping_df = pd.read_csv(mapping_file)
         
         # Basic validation
@@ -126,6 +148,7 @@ class ConfigManager:
         # Create mapping dictionary
         mapping = {}
         default_values = {}
+        transform_functions = {}
         
         for _, row in mapping_df.iterrows():
             source = row['source_field']
@@ -135,5 +158,167 @@ class ConfigManager:
             # Add default value if present
             if 'default_value' in mapping_df.columns and pd.notna(row.get('default_value')):
                 default_values[target] = row['default_value']
+            
+            # Add transform spec if present ("nama" atau "nama:argumen", dipisah "|")
+            if 'transform' in mapping_df.columns and pd.notna(row.get('transform')):
+                steps = []
+                for part in str(row['transform']).split('|'):
+                    name, sep, arg = part.partition(':')
+                    if name.strip():
+                        steps.append(name.strip() + sep + arg)
+                if steps:
+                    transform_functions[target] = steps
         
-        return mapping, default_values
+        return mapping, default_values, transform_functions
+
+
+class ColumnResolver:
+    """
+    Pencarian nama kolom DataFrame berdasarkan alias, dibangun sekali per frame.
+    
+    Urutan pencocokan:
+    1. Nama persis
+    2. Case-insensitive
+    3. Substring (nama dicari ada di dalam nama kolom)
+    4. Tanpa whitespace (mis. "ModalUnit" untuk "Modal Unit")
+    
+    Dengan fuzzy=True, tahap 3 juga menerima nama kolom (> 3 karakter) yang ada di dalam
+    nama dicari, tahap 4 juga menerima kecocokan sebagian (minimal 70% karakter), dan
+    ditambah tahap 5: difflib.get_close_matches dengan cutoff 0.7.
+    
+    Index exact, case-insensitive dan tanpa whitespace dihitung sekali saat inisialisasi;
+    hasil setiap pencarian disimpan, sehingga alias yang sama cukup dicari sekali.
+    """
+    
+    def __init__(
+        self,
+        columns: Union[pd.DataFrame, pd.Index, List[Any]],
+        fuzzy: bool = False,
+        verbose: bool = False
+    ):
+        """
+        Inisialisasi ColumnResolver.
+        
+        Args:
+            columns: DataFrame atau daftar nama kolom
+            fuzzy: Aktifkan pencocokan sebagian dan difflib
+            verbose: Print tahap pencocokan setiap pencarian (untuk debugging)
+        """
+        if isinstance(columns, pd.DataFrame):
+            columns = columns.columns
+        self.columns = list(columns)
+        self.fuzzy = fuzzy
+        self.verbose = verbose
+        
+        self._exact = set(self.columns)
+        # (kolom, lowercase, tanpa whitespace) sesuai urutan kolom
+        self._keys = [(col, str(col).lower(), self._compact(str(col).lower())) for col in self.columns]
+        # Kolom pertama untuk setiap kunci (sama dengan loop "for col in df.columns" yang berhenti di kecocokan pertama)
+        self._lower = {}
+        self._no_space = {}
+        for col, lower, no_space in self._keys:
+            self._lower.setdefault(lower, col)
+            self._no_space.setdefault(no_space, col)
+        self._cache = {}
+    
+    @staticmethod
+    def _compact(text: str) -> str:
+        return "".join(text.split())
+    
+    def _log(self, message: str):
+        if self.verbose:
+            print(message)
+    
+    def get(self, column_name: str) -> Optional[Any]:
+        """
+        Cari kolom dengan nama sama secara case-insensitive saja (tanpa substring/fuzzy).
+        
+        Args:
+            column_name: Nama kolom yang dicari
+            
+        Returns:
+            Nama kolom asli pertama yang cocok, None jika tidak ada
+        """
+        return self._lower.get(str(column_name).lower())
+    
+    def resolve(self, column_name: str) -> Optional[Any]:
+        """
+        Cari kolom untuk satu alias sesuai urutan pencocokan di docstring class.
+        
+        Args:
+            column_name: Nama kolom yang dicari
+            
+        Returns:
+            Nama kolom asli jika ditemukan, None jika tidak
+        """
+        if column_name not in self._cache:
+            self._cache[column_name] = self._resolve(column_name)
+        return self._cache[column_name]
+    
+    def resolve_any(self, column_names: List[str]) -> Optional[Any]:
+        """
+        Cari kolom untuk alias pertama dalam daftar yang ditemukan.
+        
+        Args:
+            column_names: Daftar alias sesuai prioritas
+            
+        Returns:
+            Nama kolom asli, None jika tidak ada alias yang ditemukan
+        """
+        for column_name in column_names:
+            col = self.resolve(column_name)
+            if col is not None:
+                return col
+        return None
+    
+    def _resolve(self, column_name: str) -> Optional[Any]:
+        self._log(f"Searching for column '{column_name}' in columns: {self.columns}")
+        
+        # 1. Exact match
+        if column_name in self._exact:
+            self._log(f"Found exact match for '{column_name}'")
+            return column_name
+        
+        # 2. Case-insensitive exact match
+        name = str(column_name).lower()
+        if name in self._lower:
+            col = self._lower[name]
+            self._log(f"Found case-insensitive match: '{col}' for '{column_name}'")
+            return col
+        
+        # 3. Substring match (untuk kolom dengan awalan/akhiran tambahan)
+        for col, lower, _ in self._keys:
+            if name in lower:
+                self._log(f"Found substring match: '{col}' for '{column_name}'")
+                return col
+            # Nama kolom ada di dalam nama dicari (minimal 4 karakter agar tidak cocok dengan kolom pendek)
+            if self.fuzzy and lower in name and len(lower) > 3:
+                self._log(f"Found reverse substring match: '{col}' in '{column_name}'")
+                return col
+        
+        # 4. Match tanpa whitespace
+        no_space_name = self._compact(name)
+        if not self.fuzzy:
+            col = self._no_space.get(no_space_name)
+            if col is not None:
+                self._log(f"Found no-space match: '{col}' for '{column_name}'")
+            return col
+        for col, _, no_space_col in self._keys:
+            if no_space_name == no_space_col:
+                self._log(f"Found no-space match: '{col}' for '{column_name}'")
+                return col
+            # Partial match tanpa whitespace (minimal 70% karakter)
+            if (no_space_name in no_space_col and len(no_space_name) >= 0.7 * len(no_space_col)) or \
+               (no_space_col in no_space_name and len(no_space_col) >= 0.7 * len(no_space_name)):
+                self._log(f"Found partial no-space match: '{col}' for '{column_name}'")
+                return col
+        
+        # 5. Fuzzy match untuk nama kolom yang mirip
+        matches = difflib.get_close_matches(name, [lower for _, lower, _ in self._keys], n=1, cutoff=0.7)
+        if matches:
+            col = self._lower[matches[0]]
+            self._log(f"Found fuzzy match: '{col}' for '{column_name}'")
+            return col
+        
+        self._log(f"No match found for '{column_name}'")
+        return None
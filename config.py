@@ -34,7 +34,24 @@ ODOO_CONFIG = {
 }
 # Path untuk file temporary
 TEMP_PATH = "temp/"
-DF_BASE_PATH = TEMP_PATH + "df_base.pkl"
+
+# Artifact hasil transformasi (Arrow IPC + manifest) yang dibaca modul df_*
+ARTIFACT_PATH = TEMP_PATH + "artifacts/"
+
+# Cache hasil ekstraksi (Parquet per file + setting range), dibatasi ukurannya
+EXTRACT_CACHE_PATH = TEMP_PATH + "extract_cache/"
+EXTRACT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Backend dtype hasil ekstraksi: None (kolom object) atau "pyarrow" (kolom teks string[pyarrow])
+EXTRACT_DTYPE_BACKEND = None
+
+# Opsi ekstraksi upload di aplikasi: sel dibaca dari XML (streaming) dan batas default window
+# dipangkas ke used range, sehingga sheet yang diformat jauh melewati datanya tidak membaca ribuan sel kosong
+EXTRACT_OPTIONS = {
+    "streaming": True,
+    "trim_to_used_range": True,
+    "dtype_backend": EXTRACT_DTYPE_BACKEND
+}
 
 # Output file paths
 OUTPUT_PATHS = {
@@ -0,0 +1,268 @@
+import glob
+import hashlib
+import json
+import os
+import pickle
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+from config import ARTIFACT_PATH
+from ETL_library.extract import is_arrow_column, restore_text_na, text_na_kind
+
+
+class ArtifactStore:
+    """
+    Penyimpanan DataFrame antar langkah transformasi dalam format kolom (Arrow IPC) dengan manifest.
+
+    Setiap artifact (mis. "boq_df", "so_df") ditulis sekali sebagai file terpisah:
+    - {name}.v{version}.arrow: kolom yang bisa direpresentasikan Arrow (tanpa kompresi agar bisa
+      dibaca lewat memory map dan hanya kolom yang diminta yang dikonversi ke pandas)
+    - {name}.v{version}.pkl: kolom object campuran (mis. angka dan teks dalam satu kolom) dan index
+      non-default, yang tidak bisa disimpan Arrow tanpa mengubah nilainya
+    - {name}.json: manifest (versi, schema, jumlah baris, content hash, created_at)
+
+    Manifest ditulis terakhir, sehingga pembaca selalu melihat file data yang lengkap dan
+    konsisten dengan manifest-nya; file versi lama dihapus setelah manifest baru ditulis.
+    Penulisan satu artifact dari beberapa sesi sekaligus diserialkan lewat file {name}.lock.
+    """
+
+    FORMAT_VERSION = 1
+    # Lock yang lebih tua dari ini dianggap sisa proses yang mati dan boleh diambil alih
+    LOCK_STALE_SECONDS = 60
+
+    def __init__(self, root: str = ARTIFACT_PATH):
+        self.root = root
+
+    def _path(self, file_name: str) -> str:
+        return os.path.join(self.root, file_name)
+
+    @staticmethod
+    def _dtype_name(dtype: Any) -> str:
+        """Nama dtype untuk manifest; storage StringDtype ikut dicatat (Arrow hanya menyimpan "string")."""
+        if isinstance(dtype, pd.StringDtype):
+            return f"string[{dtype.storage}]"
+        return str(dtype)
+
+    def _write_atomic(self, file_name: str, data: bytes):
+        """Tulis ke file sementara (nama memuat pid dan id thread) lalu rename."""
+        path = self._path(file_name)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    @contextmanager
+    def _lock(self, name: str):
+        """
+        Lock per artifact: {name}.lock dibuat dengan O_CREAT | O_EXCL sehingga hanya satu
+        penulis (proses atau thread) yang bisa menaikkan versi dan menulis manifest pada satu waktu.
+        """
+        path = self._path(f"{name}.lock")
+        while True:
+            try:
+                fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                break
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(path) > self.LOCK_STALE_SECONDS:
+                        os.remove(path)
+                        continue
+                except OSError:
+                    # Lock baru saja dilepas penulis lain
+                    continue
+                time.sleep(0.01)
+        try:
+            os.write(fd, str(os.getpid()).encode("utf-8"))
+            os.close(fd)
+            yield
+        finally:
+            os.remove(path)
+
+    def manifest(self, name: str) -> Optional[Dict[str, Any]]:
+        """Manifest artifact; None jika artifact belum pernah ditulis atau manifest rusak."""
+        try:
+            with open(self._path(f"{name}.json"), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def exists(self, name: str) -> bool:
+        return self.manifest(name) is not None
+
+    def write(self, name: str, df: pd.DataFrame) -> Dict[str, Any]:
+        """
+        Simpan DataFrame sebagai versi baru artifact.
+
+        Args:
+            name: Nama artifact (mis. "boq_df")
+            df: DataFrame yang disimpan; header duplikat dan urutan kolom dipertahankan
+
+        Returns:
+            Manifest yang ditulis
+        """
+        import pyarrow as pa
+
+        os.makedirs(self.root, exist_ok=True)
+
+        # Kolom dipisah per posisi (header duplikat tetap aman): Arrow atau pickle
+        arrow_columns = {}
+        pickled_columns = {}
+        schema = []
+        for position in range(df.shape[1]):
+            series = df.iloc[:, position].reset_index(drop=True)
+            stored_in_arrow = is_arrow_column(series)
+            if stored_in_arrow:
+                arrow_columns[str(position)] = series
+            else:
+                pickled_columns[position] = series
+            schema.append({
+                "name": str(df.columns[position]),
+                "dtype": self._dtype_name(series.dtype),
+                "storage": "arrow" if stored_in_arrow else "pickle"
+            })
+            if stored_in_arrow and series.dtype == object:
+                schema[-1]["na"] = text_na_kind(series)
+
+        # Index default (0..n-1) tidak perlu disimpan
+        default_index = df.index.equals(pd.RangeIndex(len(df)))
+        if not default_index:
+            pickled_columns["index"] = df.index
+
+        table = pa.Table.from_pandas(
+            pd.DataFrame(arrow_columns, index=pd.RangeIndex(len(df))),
+            preserve_index=False
+        )
+        for arrow_field in table.schema:
+            schema[int(arrow_field.name)]["arrow_type"] = str(arrow_field.type)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        arrow_bytes = sink.getvalue().to_pybytes()
+        pickle_bytes = pickle.dumps(pickled_columns, protocol=pickle.HIGHEST_PROTOCOL) if pickled_columns else None
+
+        digest = hashlib.sha256(arrow_bytes)
+        if pickle_bytes is not None:
+            digest.update(pickle_bytes)
+
+        # Versi dibaca dan dinaikkan di dalam lock: sesi lain tidak bisa memakai nomor versi yang sama
+        # atau menghapus file versi ini sebelum manifest-nya ditulis
+        with self._lock(name):
+            previous = self.manifest(name)
+            version = previous["version"] + 1 if previous else 1
+            files = {"arrow": f"{name}.v{version}.arrow"}
+            self._write_atomic(files["arrow"], arrow_bytes)
+            if pickle_bytes is not None:
+                files["pickle"] = f"{name}.v{version}.pkl"
+                self._write_atomic(files["pickle"], pickle_bytes)
+
+            # Manifest ditulis terakhir: versi baru dianggap ada hanya jika manifest-nya sudah ditulis
+            manifest = {
+                "name": name,
+                "format_version": self.FORMAT_VERSION,
+                "version": version,
+                "rows": len(df),
+                "schema": schema,
+                "default_index": default_index,
+                "files": files,
+                "content_hash": digest.hexdigest(),
+                "created_at": time.time()
+            }
+            self._write_atomic(f"{name}.json", json.dumps(manifest, indent=2).encode("utf-8"))
+            self._remove_old_versions(name, files)
+        return manifest
+
+    def _remove_old_versions(self, name: str, keep: Dict[str, str]):
+        for path in glob.glob(self._path(f"{name}.v*")):
+            if os.path.basename(path) not in keep.values():
+                try:
+                    os.remove(path)
+                except OSError:
+                    # File masih dipakai (mis. memory map terbuka di Windows); dihapus pada penulisan berikutnya
+                    pass
+
+    def read(
+        self,
+        name: str,
+        columns: Optional[List[str]] = None,
+        memory_map: bool = True,
+        verify: bool = False
+    ) -> Optional[pd.DataFrame]:
+        """
+        Baca artifact, opsional hanya sebagian kolom.
+
+        Args:
+            name: Nama artifact
+            columns: Nama kolom yang dibaca (urutan hasil mengikuti list ini); kolom yang tidak ada
+                di artifact diabaikan. None berarti semua kolom.
+            memory_map: Baca file Arrow lewat memory map; kolom yang tidak diminta tidak dibaca ke memori
+            verify: Cocokkan content hash file dengan manifest sebelum membaca
+
+        Returns:
+            DataFrame, atau None jika artifact tidak ada
+        """
+        import pyarrow as pa
+
+        manifest = self.manifest(name)
+        if manifest is None:
+            return None
+        if manifest.get("format_version") != self.FORMAT_VERSION:
+            raise ValueError(f"Format artifact {name} tidak didukung: {manifest.get('format_version')}")
+
+        files = manifest["files"]
+        if verify:
+            digest = hashlib.sha256()
+            for key in ("arrow", "pickle"):
+                if key in files:
+                    with open(self._path(files[key]), "rb") as f:
+                        digest.update(f.read())
+            if digest.hexdigest() != manifest["content_hash"]:
+                raise ValueError(f"Content hash artifact {name} tidak cocok dengan manifest")
+
+        schema = manifest["schema"]
+        if columns is None:
+            positions = list(range(len(schema)))
+        else:
+            positions = [
+                position
+                for column in columns
+                for position, field in enumerate(schema)
+                if field["name"] == column
+            ]
+
+        values = {}
+        arrow_positions = [position for position in positions if schema[position]["storage"] == "arrow"]
+        if arrow_positions:
+            arrow_path = self._path(files["arrow"])
+            source = pa.memory_map(arrow_path, "r") if memory_map else pa.OSFile(arrow_path, "rb")
+            with source:
+                table = pa.ipc.open_file(source).read_all().select([str(position) for position in arrow_positions])
+                arrow_df = table.to_pandas()
+                del table
+            for position in arrow_positions:
+                series = arrow_df[str(position)]
+                dtype = schema[position]["dtype"]
+                if dtype.startswith("string["):
+                    # Arrow menyimpan StringDtype tanpa storage; kembalikan storage aslinya
+                    series = series.astype(pd.StringDtype(dtype[len("string["):-1]))
+                else:
+                    series = restore_text_na(series, schema[position].get("na"))
+                values[position] = series
+
+        pickled = {}
+        needs_pickle = any(schema[position]["storage"] == "pickle" for position in positions)
+        if needs_pickle or not manifest["default_index"]:
+            with open(self._path(files["pickle"]), "rb") as f:
+                pickled = pickle.load(f)
+            values.update({position: pickled[position] for position in positions if position in pickled})
+
+        df = pd.DataFrame(
+            {i: values[position] for i, position in enumerate(positions)},
+            index=pd.RangeIndex(manifest["rows"])
+        )
+        df.columns = [schema[position]["name"] for position in positions]
+        if not manifest["default_index"]:
+            df.index = pickled["index"]
+        return df
@@ -1,9 +1,28 @@
 import pandas as pd
-import pickle
 import os
-from config import TEMP_PATH, OUTPUT_PATHS
-from ETL_library.transform import DuplicateSuppressor
+from config import OUTPUT_PATHS, DEFAULT_SETTINGS
+from ETL_library.transform import DuplicateSuppressor, normalize_text_prefix
+from df_transformation.df_base import load_df_base, BOQ_ARTIFACT
+from df_transformation.transform_memo import memoized
 
+# Kolom df_base yang dipakai untuk menyusun Bill of Material
+BOM_SOURCE_COLUMNS = ['Product', 'Description - Item yang Ditawarkan', 'Qty.', 'Unit of Measure']
+
+def get_company():
+    """Ambil company dari session state Streamlit atau gunakan default dari config"""
+    try:
+        import streamlit as st
+    except ImportError:
+        # Dijalankan di luar aplikasi (mis. test) tanpa streamlit terpasang
+        return DEFAULT_SETTINGS["company"]
+    return st.session_state.get('company', DEFAULT_SETTINGS["company"])
+
+@memoized(
+    "BillOfMaterial",
+    input_artifacts=(BOQ_ARTIFACT,),
+    settings=lambda: {"company": get_company()},
+    output_path=OUTPUT_PATHS.get('BillOfMaterial')
+)
 def transform():
     """
     Transform base dataframe into Bill of Material format
@@ -11,26 +30,9 @@ def transform():
     Returns:
         DataFrame: Transformed BOM dataframe
     """
-    # Path untuk df_base.pkl yang hanya berisi boq_df
-    df_base_only_path = os.path.join(TEMP_PATH, "df_base.pkl")
-    
-    # Path untuk df_base.pkl yang berisi dictionary
-    df_base_path = os.path.join(os.path.dirname(TEMP_PATH), "df_base.pkl")
-    
-    # Coba load dari df_base_only_path dulu
-    df_base = None
     try:
-        if os.path.exists(df_base_only_path):
-            with open(df_base_only_path, 'rb') as f:
-                df_base = pickle.load(f)
-        # Jika tidak ada, coba load dari df_base_path
-        elif os.path.exists(df_base_path):
-            with open(df_base_path, 'rb') as f:
-                data = pickle.load(f)
-                if isinstance(data, dict) and 'boq_df' in data:
-                    df_base = data['boq_df']
-                else:
-                    df_base = data
+        # Hanya kolom yang dibutuhkan yang dibaca dari artifact df_base
+        df_base = load_df_base(columns=BOM_SOURCE_COLUMNS)
         
         if df_base is None or not isinstance(df_base, pd.DataFrame) or df_base.empty:
             print("Error: df_base is None or empty")
@@ -58,11 +60,7 @@ def transform():
         rows = []
         
         # Get company dari session state atau gunakan default
-        try:
-            import streamlit as st
-            company = st.session_state.get('company', "PT. Visiniaga Mitra Kreasindo")
-        except:
-            company = "PT. Visiniaga Mitra Kreasindo"
+        company = get_company()
         
         # Dictionary untuk melacak sequence berdasarkan Product Variant
         product_variant_seq = {}
@@ -85,13 +83,9 @@ def transform():
                 current_product = product
                 sequence += 1
             
-            # Get component value (Description - Item yang Ditawarkan)
+            # Get component value (Description - Item yang Ditawarkan); prefix "V - " ditambahkan per kolom di bawah
             component = row.get('Description - Item yang Ditawarkan', '')
             
-            # Add prefix "V - " if not already present
-            if not pd.isna(component) and not str(component).startswith("V - "):
-                component = f"V - {component}"
-            
             # Dapatkan quantity
             quantity = row.get('Qty.', 0)
             uom_value = row.get('Unit of Measure', '')
@@ -114,6 +108,9 @@ def transform():
         if rows:
             df_bom = pd.DataFrame(rows)
             
+            # Add prefix "V - " if not already present
+            df_bom['BoM Lines/Component'] = normalize_text_prefix(df_bom['BoM Lines/Component'], "V - ")
+            
             try:
                 # Pastikan data terurut dengan benar sebelum menerapkan DuplicateSuppressor
                 df_bom = df_bom.sort_values(by=['Product', 'Product Variant']).reset_index(drop=True)
@@ -2,8 +2,18 @@ import pandas as pd
 import os
 import pickle
 from config import OUTPUT_PATHS, BOQ_VALIDATION_COL
-from df_transformation.df_base import load_df_base
+from df_transformation.df_base import load_df_base, BOQ_ARTIFACT
+from df_transformation.transform_memo import memoized
+from ETL_library.transform import normalize_text_prefix
+from ETL_library.utility import ColumnResolver
 
+# get_company didefinisikan di bawah, sehingga dipanggil lewat lambda saat transform dijalankan
+@memoized(
+    "ProductVariant",
+    input_artifacts=(BOQ_ARTIFACT,),
+    settings=lambda: {"company": get_company()},
+    output_path=OUTPUT_PATHS["ProductVariant"]
+)
 def transform():
     """
     Transform data dari df_base menjadi format ProductVariant sesuai aturan yang ditentukan
@@ -61,7 +71,9 @@ def transform():
     # Cek dan filter baris yang memiliki "Internal References"
     print("Checking for rows with Internal References...")
     df_base_filtered = []
-    internal_ref_col = find_column(df_base, "Internal References")
+    # Semua pencarian kolom memakai resolver yang sama (df_base_filtered punya kolom yang sama dengan df_base)
+    resolver = ColumnResolver(df_base)
+    internal_ref_col = resolver.resolve("Internal References")
     if internal_ref_col:
         print(f"Found 'Internal References' column: {internal_ref_col}")
         # Tampilkan sample nilai dari kolom Internal References
@@ -92,6 +104,17 @@ def transform():
     
     print(f"Original df_base: {len(df_base)} rows, Filtered: {len(df_base_filtered)} rows")
     
+    # Kolom sumber dicari sekali sebelum loop baris
+    description_col = resolver.resolve(BOQ_VALIDATION_COL)
+    vn_col = resolver.resolve("VN")
+    supplier_col = resolver.resolve("Supplier")
+    # Coba dengan semua kemungkinan nama kolom untuk Modal Unit
+    possible_modal_cols = ["Modal Unit", "Modal", "Unit Cost", "Unit Modal", "Cost per Unit", "Price Unit"]
+    modal_col = resolver.resolve_any(possible_modal_cols)
+    price_col = resolver.resolve("Unit Price")
+    uom_col = resolver.resolve("UoM")
+    item_col = resolver.resolve("Item")
+    
     # Isi DataFrame dengan data dari df_base_filtered sesuai aturan yang ditentukan
     rows = []
     for idx, row in df_base_filtered.iterrows():
@@ -101,14 +124,12 @@ def transform():
         new_row = {}
         
         # 2. "Name" berisi data dari kolom "Description - Item yang Ditawarkan"
-        description_col = find_column(df_base, BOQ_VALIDATION_COL)
         if description_col:
             new_row["Name"] = row[description_col]
         else:
             new_row["Name"] = f"Product {idx+1}"
         
         # 3 & 4. "Product Type" & "Product Type Info" berdasarkan kolom "VN"
-        vn_col = find_column(df_base, "VN")
         if vn_col and pd.notna(row[vn_col]):
             vn_value = str(row[vn_col]).lower().strip()
             if vn_value == "yes":
@@ -122,24 +143,12 @@ def transform():
             new_row["Product Type Info"] = "Storable Product"
         
         # 5. "Vendors/Display Name" dari kolom "Supplier"
-        supplier_col = find_column(df_base, "Supplier")
         if supplier_col and pd.notna(row[supplier_col]):
             new_row["Vendors/Display Name"] = row[supplier_col]
         else:
             new_row["Vendors/Display Name"] = ""
         
         # 6. "Vendors/Price" & "Cost" dari kolom "Modal Unit"
-        # Coba dengan semua kemungkinan nama kolom untuk Modal Unit
-        possible_modal_cols = ["Modal Unit", "Modal", "Unit Cost", "Unit Modal", "Cost per Unit", "Price Unit"]
-        modal_col = None
-        
-        # Cari kolom yang sesuai
-        for col_name in possible_modal_cols:
-            found_col = find_column(df_base_filtered, col_name)
-            if found_col:
-                modal_col = found_col
-                break
-        
         # Debug: Tampilkan kolom yang ditemukan & nilainya
         if idx < 5:  # Hanya print untuk 5 baris pertama
             print(f"Row {idx}: Looking for Modal Unit, found column: {modal_col}")
@@ -173,7 +182,6 @@ def transform():
         new_row["Vendors/Company"] = company if company else ""
         
         # 8. "Public Price" dari "Unit Price"
-        price_col = find_column(df_base, "Unit Price")
         if price_col and pd.notna(row[price_col]):
             try:
                 new_row["Public Price"] = float(row[price_col])
@@ -183,7 +191,6 @@ def transform():
             new_row["Public Price"] = 0
         
         # 9. "Unit of Measure" & "Purchase Unit of Measure" dari "UoM"
-        uom_col = find_column(df_base, "UoM")
         if uom_col and pd.notna(row[uom_col]):
             new_row["Unit of Measure"] = row[uom_col]
             new_row["Purchase Unit of Measure"] = row[uom_col]
@@ -196,7 +203,6 @@ def transform():
         new_row["Purchase Description"] = ""
         
         # 11. "Item" dari df_base
-        item_col = find_column(df_base, "Item")
         if item_col and pd.notna(row[item_col]):
             new_row["Item"] = row[item_col]
         else:
@@ -209,12 +215,9 @@ def transform():
     if rows:
         df_product = pd.DataFrame(rows, columns=columns[1:])  # Hapus Sequence dari columns
         
-        # Tambahkan "V - " di depan setiap nilai di kolom "Name" jika belum ada
+        # Tambahkan "V - " di depan setiap nilai string di kolom "Name" jika belum ada
         if "Name" in df_product.columns:
-            for idx, name in enumerate(df_product["Name"]):
-                if pd.notna(name) and isinstance(name, str):
-                    if not name.startswith("V - "):
-                        df_product.at[idx, "Name"] = f"V - {name}"
+            df_product["Name"] = normalize_text_prefix(df_product["Name"], "V - ", strings_only=True)
         
         # Tambahkan kolom Sequence di awal dengan nilai berurutan
         df_product.insert(0, "Sequence", range(1, len(df_product) + 1))
@@ -232,40 +235,6 @@ def transform():
     
     return df_product
 
-def find_column(df, column_name):
-    """
-    Cari kolom dalam DataFrame dengan pencocokan case-insensitive
-    
-    Args:
-        df (pd.DataFrame): DataFrame untuk dicari
-        column_name (str): Nama kolom yang dicari
-        
-    Returns:
-        str: Nama kolom asli jika ditemukan, None jika tidak
-    """
-    # 1. Exact match
-    if column_name in df.columns:
-        return column_name
-    
-    # 2. Case-insensitive exact match
-    for col in df.columns:
-        if col.lower() == column_name.lower():
-            return col
-    
-    # 3. Substring match (untuk kolom dengan awalan/akhiran tambahan)
-    for col in df.columns:
-        if column_name.lower() in col.lower():
-            return col
-    
-    # 4. Match dengan spasi fleksibel (misalnya "ModalUnit" untuk "Modal Unit")
-    no_space_name = column_name.lower().replace(" ", "")
-    for col in df.columns:
-        no_space_col = col.lower().replace(" ", "")
-        if no_space_name == no_space_col:
-            return col
-    
-    return None
-
 def get_company():
     """
     Ambil nilai company dari st.session_state atau config
@@ -1,15 +1,27 @@
 import pandas as pd
-import pickle
 import os
 from config import TEMP_PATH, OUTPUT_PATHS
+from ETL_library.transform import normalize_text_prefix
+from df_transformation import df_base as base
+from df_transformation.artifact_store import ArtifactStore
+from df_transformation.transform_memo import memoized
 
-# Path untuk menyimpan hasil transformasi df_SalesOrder
-DF_SO_PATH = os.path.join(TEMP_PATH, "df_so.pkl")
+# Nama artifact untuk menyimpan hasil transformasi df_SalesOrder
+DF_SO_ARTIFACT = "df_so"
 
+# Kolom df_base yang dipakai untuk menyusun Sales Order
+SO_SOURCE_COLUMNS = ["Product", "Line Total", "Description - Item yang Ditawarkan", "Single Product", "Qty.", "Unit Price"]
+
+@memoized(
+    "SalesOrder",
+    input_artifacts=(base.BOQ_ARTIFACT,),
+    output_path=OUTPUT_PATHS["SalesOrder"],
+    output_artifacts={DF_SO_ARTIFACT: None}
+)
 def transform():
     """
-    Transform data dari df_base.pkl menjadi format Sales Order
-    dan simpan hasilnya ke df_so.pkl dan Excel
+    Transform data dari artifact df_base menjadi format Sales Order
+    dan simpan hasilnya ke artifact df_so dan Excel
     
     Returns:
         DataFrame: DataFrame hasil transformasi df_SalesOrder
@@ -76,8 +88,15 @@ def transform():
             "Taxes": "11% PPN Sale"  # Taxes selalu "11% PPN Sale"
         }])], ignore_index=True)
     
+    # Description dengan prefix "V - " (jika belum ada) dihitung sekali untuk seluruh kolom
+    desc_col = "Description - Item yang Ditawarkan"
+    if desc_col in df_base_sorted.columns:
+        descriptions = normalize_text_prefix(df_base_sorted[desc_col], "V - ", strip=True)
+    else:
+        descriptions = normalize_text_prefix(pd.Series("", index=df_base_sorted.index), "V - ", strip=True)
+    
     # Langkah kedua: Tambahkan data dari Single Product yang tidak NULL
-    for _, row in df_base_sorted.iterrows():
+    for idx, row in df_base_sorted.iterrows():
         single_product = row.get("Single Product")
         
         # Skip jika Single Product kosong atau None
@@ -85,10 +104,7 @@ def transform():
             continue
             
         # Ambil data yang diperlukan
-        desc = row.get("Description - Item yang Ditawarkan", "")
-        # Tambahkan prefix "V - " jika belum ada
-        if not pd.isna(desc) and not str(desc).strip().startswith("V - "):
-            desc = "V - " + str(desc).strip()
+        desc = descriptions.at[idx]
         jumlah = row.get("Qty.", 0)
         uPrice = row.get("Unit Price", 0)
         
@@ -134,9 +150,8 @@ def transform():
     # Pastikan direktori temp ada
     os.makedirs(TEMP_PATH, exist_ok=True)
     
-    # Simpan df_so ke pickle
-    with open(DF_SO_PATH, 'wb') as f:
-        pickle.dump(df_so, f)
+    # Simpan df_so sebagai artifact
+    ArtifactStore().write(DF_SO_ARTIFACT, df_so)
     
     # Simpan df_so ke Excel
     df_so.to_excel(OUTPUT_PATHS["SalesOrder"], index=False)
@@ -145,33 +160,22 @@ def transform():
 
 def load_df_base():
     """
-    Load df_base dari pickle file
+    Load kolom df_base yang dibutuhkan Sales Order dari ArtifactStore
     
     Returns:
-        DataFrame: df_base atau None jika file tidak ada
+        DataFrame: df_base atau None jika artifact tidak ada
     """
-    df_base_path = os.path.join(TEMP_PATH, "df_base.pkl")
-    try:
-        if os.path.exists(df_base_path):
-            with open(df_base_path, 'rb') as f:
-                return pickle.load(f)
-        return None
-    except Exception as e:
-        print(f"Error loading df_base: {str(e)}")
-        return None
+    return base.load_df_base(columns=SO_SOURCE_COLUMNS)
 
 def load_data():
     """
-    Load data dari pickle file df_so.pkl
+    Load data dari artifact df_so
     
     Returns:
-        DataFrame: df_so atau None jika file tidak ada
+        DataFrame: df_so atau None jika artifact tidak ada
     """
     try:
-        if os.path.exists(DF_SO_PATH):
-            with open(DF_SO_PATH, 'rb') as f:
-                return pickle.load(f)
-        return None
+        return ArtifactStore().read(DF_SO_ARTIFACT)
     except Exception as e:
         print(f"Error loading df_so: {str(e)}")
         return None
@@ -1,10 +1,11 @@
 import pandas as pd
-import pickle
 import json
 import os
 import xmlrpc.client
 import streamlit as st
 from config import OUTPUT_PATHS
+from df_transformation.df_base import load_df_base
+from ETL_library.utility import ColumnResolver
 
 # Path ke file konfigurasi
 USER_CONFIG_FILE = "temp/user_config.json"
@@ -59,33 +60,10 @@ def transform():
     products_missing_xml_id = []
     products_with_empty_id = []
     
-    # Load df_base.pkl
-    df_base_path = os.path.join(os.path.dirname(OUTPUT_PATHS['UpdateProduct']), "df_base.pkl")
-    
-    try:
-        print(f"Loading df_base from {df_base_path}")
-        with open(df_base_path, 'rb') as f:
-            data = pickle.load(f)
-            
-        # Check if data is a dictionary or DataFrame
-        if isinstance(data, dict):
-            print("df_base is stored as a dictionary with keys:", list(data.keys()))
-            # If it's a dictionary, we need to get the boq_df
-            if 'boq_df' in data:
-                df_base = data['boq_df']
-                print(f"Using 'boq_df' from dictionary, with {len(df_base)} rows")
-            else:
-                # Try the first value if boq_df doesn't exist
-                df_base = next(iter(data.values()))
-                print(f"Using first DataFrame from dictionary, with {len(df_base)} rows")
-        else:
-            # It's directly a DataFrame
-            df_base = data
-            print(f"Loaded DataFrame directly, with {len(df_base)} rows")
-        
-    except Exception as e:
-        print(f"Error loading df_base: {str(e)}")
-        return None
+    # Load artifact df_base (boq_df); None jika belum ada atau gagal dibaca
+    df_base = load_df_base()
+    if df_base is not None:
+        print(f"Loaded df_base artifact, with {len(df_base)} rows")
     
     if df_base is None or df_base.empty:
         print("No data in df_base or file not found")
@@ -99,7 +77,9 @@ def transform():
     print("=" * 50)
     
     # 1. Filter rows where "Internal References" is not empty
-    internal_ref_col = find_column(df_base, "Internal References")
+    # Resolver dibangun sekali; df_filtered memiliki kolom yang sama dengan df_base
+    resolver = ColumnResolver(df_base, fuzzy=True, verbose=True)
+    internal_ref_col = resolver.resolve("Internal References")
     
     if internal_ref_col:
         # Filter out rows where "Internal References" is empty, NULL, or "0"
@@ -137,7 +117,7 @@ def transform():
     df_update1['default_code'] = df_filtered[internal_ref_col]
     
     # Map "Description - Item yang Ditawarkan" to "name"
-    description_col = find_column(df_filtered, "Description - Item yang Ditawarkan")
+    description_col = resolver.resolve("Description - Item yang Ditawarkan")
     if description_col:
         df_update1['name'] = df_filtered[description_col]
     else:
@@ -145,7 +125,7 @@ def transform():
         df_update1['name'] = ""
     
     # Map "Supplier" to "seller_ids"
-    supplier_col = find_column(df_filtered, "Supplier")
+    supplier_col = resolver.resolve("Supplier")
     if supplier_col:
         df_update1['seller_ids'] = df_filtered[supplier_col]
     else:
@@ -157,7 +137,7 @@ def transform():
     print("-" * 40)
     
     # Try exact match first
-    modal_unit_col = find_column(df_filtered, "Modal Unit")
+    modal_unit_col = resolver.resolve("Modal Unit")
     if modal_unit_col:
         print(f"Found 'Modal Unit' column: {modal_unit_col}")
         print(f"Sample values: {df_filtered[modal_unit_col].head(3).tolist()}")
@@ -550,69 +530,6 @@ def transform():
     
     return df_update1
 
-def find_column(df, column_name):
-    """
-    Cari kolom dalam DataFrame dengan pencocokan case-insensitive
-    
-    Args:
-        df (pd.DataFrame): DataFrame untuk dicari
-        column_name (str): Nama kolom yang dicari
-        
-    Returns:
-        str: Nama kolom asli jika ditemukan, None jika tidak
-    """
-    # Print columns we're searching through - helpful for debugging
-    print(f"Searching for column '{column_name}' in columns: {list(df.columns)}")
-    
-    # 1. Exact match
-    if column_name in df.columns:
-        print(f"Found exact match for '{column_name}'")
-        return column_name
-    
-    # 2. Case-insensitive exact match
-    for col in df.columns:
-        if col.lower() == column_name.lower():
-            print(f"Found case-insensitive match: '{col}' for '{column_name}'")
-            return col
-    
-    # 3. Substring match (untuk kolom dengan awalan/akhiran tambahan)
-    for col in df.columns:
-        if column_name.lower() in col.lower():
-            print(f"Found substring match: '{col}' for '{column_name}'")
-            return col
-        # Also check if column is in the search term (reversed check)
-        elif col.lower() in column_name.lower() and len(col) > 3:  # Minimum 4 chars to avoid short matches
-            print(f"Found reverse substring match: '{col}' in '{column_name}'")
-            return col
-    
-    # 4. Match dengan spasi fleksibel (misalnya "ModalUnit" untuk "Modal Unit")
-    no_space_name = column_name.lower().replace(" ", "")
-    for col in df.columns:
-        no_space_col = col.lower().replace(" ", "")
-        if no_space_name == no_space_col:
-            print(f"Found no-space match: '{col}' for '{column_name}'")
-            return col
-        # Partial match without space (at least 70% of the characters)
-        elif (no_space_name in no_space_col and len(no_space_name) >= 0.7 * len(no_space_col)) or \
-             (no_space_col in no_space_name and len(no_space_col) >= 0.7 * len(no_space_name)):
-            print(f"Found partial no-space match: '{col}' for '{column_name}'")
-            return col
-    
-    # 5. Try fuzzy matching for similar column names with high similarity
-    try:
-        import difflib
-        matches = difflib.get_close_matches(column_name.lower(), [c.lower() for c in df.columns], n=1, cutoff=0.7)
-        if matches:
-            for col in df.columns:
-                if col.lower() == matches[0]:
-                    print(f"Found fuzzy match: '{col}' for '{column_name}'")
-                    return col
-    except ImportError:
-        pass  # Skip fuzzy matching if difflib is not available
-    
-    print(f"No match found for '{column_name}'")
-    return None
-
 def save_to_excel(df=None):
     """
     Save df_update1 to Excel file.
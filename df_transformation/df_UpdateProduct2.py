@@ -3,6 +3,7 @@ import os
 import streamlit as st
 import json
 from config import OUTPUT_PATHS
+from ETL_library.utility import ColumnResolver
 
 # Path ke file konfigurasi
 USER_CONFIG_FILE = "temp/user_config.json"
@@ -73,10 +74,11 @@ def process_second_table(df_filtered, odoo_data):
         return df_update2
     
     # Get necessary columns
-    internal_ref_col = find_column(df_filtered, "Internal References")
-    description_col = find_column(df_filtered, "Description - Item yang Ditawarkan")
-    supplier_col = find_column(df_filtered, "Supplier")
-    modal_unit_col = find_column(df_filtered, "Modal Unit")
+    resolver = ColumnResolver(df_filtered, fuzzy=True, verbose=True)
+    internal_ref_col = resolver.resolve("Internal References")
+    description_col = resolver.resolve("Description - Item yang Ditawarkan")
+    supplier_col = resolver.resolve("Supplier")
+    modal_unit_col = resolver.resolve("Modal Unit")
     
     if not all([internal_ref_col, modal_unit_col, supplier_col]):
         print("Missing required columns for second table processing")
@@ -225,69 +227,6 @@ def process_second_table(df_filtered, odoo_data):
     
     return df_update2
 
-def find_column(df, column_name):
-    """
-    Cari kolom dalam DataFrame dengan pencocokan case-insensitive
-    
-    Args:
-        df (pd.DataFrame): DataFrame untuk dicari
-        column_name (str): Nama kolom yang dicari
-        
-    Returns:
-        str: Nama kolom asli jika ditemukan, None jika tidak
-    """
-    # Print columns we're searching through - helpful for debugging
-    print(f"Searching for column '{column_name}' in columns: {list(df.columns)}")
-    
-    # 1. Exact match
-    if column_name in df.columns:
-        print(f"Found exact match for '{column_name}'")
-        return column_name
-    
-    # 2. Case-insensitive exact match
-    for col in df.columns:
-        if col.lower() == column_name.lower():
-            print(f"Found case-insensitive match: '{col}' for '{column_name}'")
-            return col
-    
-    # 3. Substring match (untuk kolom dengan awalan/akhiran tambahan)
-    for col in df.columns:
-        if column_name.lower() in col.lower():
-            print(f"Found substring match: '{col}' for '{column_name}'")
-            return col
-        # Also check if column is in the search term (reversed check)
-        elif col.lower() in column_name.lower() and len(col) > 3:  # Minimum 4 chars to avoid short matches
-            print(f"Found reverse substring match: '{col}' in '{column_name}'")
-            return col
-    
-    # 4. Match dengan spasi fleksibel (misalnya "ModalUnit" untuk "Modal Unit")
-    no_space_name = column_name.lower().replace(" ", "")
-    for col in df.columns:
-        no_space_col = col.lower().replace(" ", "")
-        if no_space_name == no_space_col:
-            print(f"Found no-space match: '{col}' for '{column_name}'")
-            return col
-        # Partial match without space (at least 70% of the characters)
-        elif (no_space_name in no_space_col and len(no_space_name) >= 0.7 * len(no_space_col)) or \
-             (no_space_col in no_space_name and len(no_space_col) >= 0.7 * len(no_space_name)):
-            print(f"Found partial no-space match: '{col}' for '{column_name}'")
-            return col
-    
-    # 5. Try fuzzy matching for similar column names with high similarity
-    try:
-        import difflib
-        matches = difflib.get_close_matches(column_name.lower(), [c.lower() for c in df.columns], n=1, cutoff=0.7)
-        if matches:
-            for col in df.columns:
-                if col.lower() == matches[0]:
-                    print(f"Found fuzzy match: '{col}' for '{column_name}'")
-                    return col
-    except ImportError:
-        pass  # Skip fuzzy matching if difflib is not available
-    
-    print(f"No match found for '{column_name}'")
-    return None
-
 def save_to_excel_second_table(df=None):
     """
     Save df_update2 to Excel file.
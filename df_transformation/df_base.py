@@ -1,12 +1,22 @@
 import pandas as pd
-import pickle
-import os
-from config import DF_BASE_PATH, BOQ_VALIDATION_COL, SO_VALIDATION_COL
-from ETL_library.transform import EmptyspaceCleaner, DuplicateRestorer, SectionExtractor, DataFrameJoiner
+import numpy as np
+from config import BOQ_VALIDATION_COL, SO_VALIDATION_COL
+from ETL_library.transform import EmptyspaceCleaner, DuplicateRestorer, SectionExtractor, DataFrameJoiner, NormalizedKeyIndex, empty_mask
+from ETL_library.utility import ColumnResolver
+from df_transformation.artifact_store import ArtifactStore
+from df_transformation.transform_memo import memoized
 
-# Definisi path untuk menyimpan df_base.pkl
-DF_BASE_ONLY_PATH = os.path.join(os.path.dirname(DF_BASE_PATH), "df_base.pkl")
+# Nama artifact hasil transform_and_save di ArtifactStore
+BOQ_ARTIFACT = "boq_df"
+SO_ARTIFACT = "so_df"
 
+# Input yang sama (isi kedua file + kolom validasi) tidak ditransformasi ulang;
+# artifact boq_df/so_df dipulihkan dari memo jika sudah ditimpa run lain
+@memoized(
+    "df_base",
+    settings=lambda: {"boq_col": BOQ_VALIDATION_COL, "so_col": SO_VALIDATION_COL},
+    output_artifacts={BOQ_ARTIFACT: 0, SO_ARTIFACT: 1}
+)
 def transform_and_save(boq_df, so_df):
     """
     Transform dan simpan data dari kedua file input
@@ -22,40 +32,31 @@ def transform_and_save(boq_df, so_df):
     if boq_df is None or so_df is None:
         raise ValueError("Both DataFrames must be provided")
     
-    # Buat copy dari dataframe asli
+    # Buat copy dari dataframe asli; langkah-langkah di bawah bekerja langsung pada salinan ini (copy=False)
     boq_df = boq_df.copy()
     so_df = so_df.copy()
     
     # Langkah 2: Bersihkan baris yang tidak perlu dengan EmptyspaceCleaner - hanya untuk df-BoQ
     
+    # Index nama kolom (case-insensitive) dibangun sekali per frame; kolom so_df tidak berubah
+    # sampai langkah 7, kolom boq_df dicari ulang setelah di-rename/join
+    boq_columns = ColumnResolver(boq_df)
+    so_columns = ColumnResolver(so_df)
+    
     # Validasi keberadaan kolom BOQ_VALIDATION_COL di boq_df
-    boq_column = None
-    for col in boq_df.columns:
-        if col.lower() == BOQ_VALIDATION_COL.lower():
-            boq_column = col
-            break
+    boq_column = boq_columns.get(BOQ_VALIDATION_COL)
     
     if boq_column:
         boq_cleaner = EmptyspaceCleaner(header_names=boq_column)
-        boq_df = boq_cleaner.clean(boq_df)
+        boq_df = boq_cleaner.clean(boq_df, copy=False)
     
     # Validasi keberadaan kolom SO_VALIDATION_COL di so_df
-    so_column = None
-    for col in so_df.columns:
-        if col.lower() == SO_VALIDATION_COL.lower():
-            so_column = col
-            break
+    so_column = so_columns.get(SO_VALIDATION_COL)
     
     # Langkah 3: Rename header di sebelah kanan header "Qty." pada "df-BoQ" menjadi "UoM"
     # Cari indeks kolom "Qty."
-    qty_column = None
-    qty_index = -1
-    
-    for i, col in enumerate(boq_df.columns):
-        if col.lower() == "qty.":
-            qty_column = col
-            qty_index = i
-            break
+    qty_column = boq_columns.get("qty.")
+    qty_index = list(boq_df.columns).index(qty_column) if qty_column is not None else -1
     
     # Jika menemukan kolom "Qty." dan ada kolom di sebelah kanannya
     if qty_index >= 0 and qty_index + 1 < len(boq_df.columns):
@@ -70,49 +71,29 @@ def transform_and_save(boq_df, so_df):
     
     # Langkah 4: Gunakan DuplicateRestorer untuk kolom "Product" pada so_df
     # Validasi keberadaan kolom "Product" di so_df
-    product_column = None
-    for col in so_df.columns:
-        if col.lower() == "product":
-            product_column = col
-            break
+    product_column = so_columns.get("product")
 
     # Validasi keberadaan kolom "Unit of Measure" di so_df
-    uom_column = None
-    for col in so_df.columns:
-        if col.lower() == "unit of measure":
-            uom_column = col
-            break
+    uom_column = so_columns.get("unit of measure")
 
     if product_column:
         product_restorer = DuplicateRestorer(columns_to_restore=product_column)
-        so_df = product_restorer.transform(so_df)
+        so_df = product_restorer.transform(so_df, copy=False)
 
     # Kondisi khusus untuk DuplicateRestorer pada Unit of Measure
     if uom_column and so_column:
         # Identifikasi rows di mana BOM Line kosong tapi Product berisi data
         # Untuk rows tersebut, jangan restore UoM
-        mask_skip_restore = pd.Series(False, index=so_df.index)
-        
-        for idx, row in so_df.iterrows():
-            product_val = row.get(product_column, None) if product_column else None
-            bom_val = row.get(so_column, None)
-            
-            # Check if Product has value but BOM Line is empty
-            if (pd.notna(product_val) and (not isinstance(product_val, str) or product_val.strip() != "")) and \
-            (pd.isna(bom_val) or (isinstance(bom_val, str) and bom_val.strip() == "")):
-                mask_skip_restore[idx] = True
+        mask_skip_restore = empty_mask(so_df[[so_column]])[:, 0]
+        if product_column:
+            mask_skip_restore &= ~empty_mask(so_df[[product_column]])[:, 0]
+        else:
+            mask_skip_restore[:] = False
         
-        # Jalankan DuplicateRestorer pada rows yang tidak di-skip
+        # Jalankan DuplicateRestorer hanya pada rows yang tidak di-skip (rows yang di-skip tetap menjadi sumber nilai)
         if not mask_skip_restore.all():
-            # Simpan nilai-nilai original untuk rows yang di-skip
-            original_uom_values = so_df.loc[mask_skip_restore, uom_column].copy()
-            
-            # Jalankan DuplicateRestorer pada seluruh dataframe
             uom_restorer = DuplicateRestorer(columns_to_restore=uom_column)
-            so_df = uom_restorer.transform(so_df)
-            
-            # Kembalikan nilai original untuk rows yang di-skip
-            so_df.loc[mask_skip_restore, uom_column] = original_uom_values
+            so_df = uom_restorer.transform(so_df, copy=False, rows=~mask_skip_restore)
     
     # Langkah 5: Gunakan SectionExtractor untuk df-BoQ
     if boq_column:
@@ -121,25 +102,15 @@ def transform_and_save(boq_df, so_df):
             target_section_col="Item",
             remove_section_rows=True
         )
-        boq_df = section_extractor.extract(boq_df)
+        boq_df = section_extractor.extract(boq_df, copy=False)
     
     # Langkah 6: Gunakan DataFrameJoiner untuk menggabungkan df-SO ke df-BoQ
     if boq_column and so_column:
         # Validasi keberadaan kolom "Product", "VN", dan "Unit of Measure" di so_df
-        product_exists = any(col.lower() == "product" for col in so_df.columns)
-        vn_exists = any(col.lower() == "vn" for col in so_df.columns)
-        uom_exists = any(col.lower() == "unit of measure" for col in so_df.columns)
+        vn_column = so_columns.get("vn")
+        uom_exists = uom_column is not None
         
-        columns_to_add = []
-        
-        if product_exists:
-            columns_to_add.append(next(col for col in so_df.columns if col.lower() == "product"))
-        
-        if vn_exists:
-            columns_to_add.append(next(col for col in so_df.columns if col.lower() == "vn"))
-        
-        if uom_exists:
-            columns_to_add.append(next(col for col in so_df.columns if col.lower() == "unit of measure"))
+        columns_to_add = [col for col in (product_column, vn_column, uom_column) if col is not None]
         
         if columns_to_add:
             joiner = DataFrameJoiner(
@@ -149,16 +120,18 @@ def transform_and_save(boq_df, so_df):
                 columns_to_add=columns_to_add,
                 match_case=False
             )
-            boq_df = joiner.join(boq_df, so_df)
+            # Kunci BOM Line (astype(str) + lower) dihitung sekali tanpa menyalin so_df
+            prepared_so = joiner.prepare(so_df)
+            boq_df = joiner.join(boq_df, prepared_so)
             
             # Pastikan kolom "Unit of Measure" ada di paling kanan
             if uom_exists and "Unit of Measure" in boq_df.columns:
                 # Simpan Unit of Measure
-                uom_column = next(col for col in boq_df.columns if col.lower() == "unit of measure")
-                uom_values = boq_df[uom_column].copy()
+                boq_uom_column = ColumnResolver(boq_df).get("unit of measure")
+                uom_values = boq_df[boq_uom_column].copy()
                 
                 # Hapus kolom asli
-                boq_df = boq_df.drop(columns=[uom_column])
+                boq_df = boq_df.drop(columns=[boq_uom_column])
                 
                 # Tambahkan kembali di posisi terakhir
                 boq_df["Unit of Measure"] = uom_values
@@ -168,77 +141,85 @@ def transform_and_save(boq_df, so_df):
     boq_df["Single Product"] = None
     
     # Dapatkan kolom Product dari df-SO
-    product_column_name = next((col for col in so_df.columns if col.lower() == "product"), None)
+    product_column_name = so_columns.get("product")
     
     if boq_column and so_column and product_column_name:
-        # Cari sel kosong di kolom "BOM Line" di df-SO
-        for idx, row in so_df.iterrows():
-            bom_line_value = row[so_column]
+        # Baris SO dengan BOM Line kosong dan Product berisi teks adalah single product
+        products = so_df[product_column_name]
+        is_single = (
+            empty_mask(so_df[[so_column]])[:, 0]
+            & ~empty_mask(so_df[[product_column_name]])[:, 0]
+            & np.fromiter((isinstance(value, str) for value in products), dtype=bool, count=len(products))
+        )
+        
+        if is_single.any():
+            # Index deskripsi BoQ dibangun sekali, hanya dari cell teks; kunci lower + strip
+            # sama dengan perbandingan desc.lower().strip() == product.lower().strip() sebelumnya
+            descriptions = boq_df[boq_column]
+            text_rows = np.flatnonzero(np.fromiter((isinstance(value, str) for value in descriptions), dtype=bool, count=len(descriptions)))
+            boq_keys = NormalizedKeyIndex(descriptions.iloc[text_rows], strip=True)
             
-            # Jika BOM Line kosong, ambil nilai Product sebagai single product
-            if pd.isna(bom_line_value) or (isinstance(bom_line_value, str) and bom_line_value.strip() == ""):
-                temp_single_product = row[product_column_name]
-                
-                # Jika temp_single_product tidak kosong
-                if pd.notna(temp_single_product) and (not isinstance(temp_single_product, str) or temp_single_product.strip() != ""):
-                    # Cari di df-BoQ, di kolom description mana yang nilainya sama dengan temp_single_product
-                    for boq_idx, boq_row in boq_df.iterrows():
-                        boq_desc_value = boq_row[boq_column]
-                        
-                        # Bandingkan nilai (case insensitive)
-                        if (pd.notna(boq_desc_value) and 
-                            isinstance(boq_desc_value, str) and 
-                            isinstance(temp_single_product, str) and
-                            boq_desc_value.lower().strip() == temp_single_product.lower().strip()):
-                            
-                            # Jika ketemu, isi nilai "Single Product"
-                            boq_df.at[boq_idx, "Single Product"] = temp_single_product
-    
-    # Pastikan direktori temp ada
-    os.makedirs(os.path.dirname(DF_BASE_PATH), exist_ok=True)
-    
-    # Simpan kedua DataFrame ke pickle file
-    with open(DF_BASE_PATH, 'wb') as f:
-        pickle.dump({
-            'boq_df': boq_df,
-            'so_df': so_df
-        }, f)
-    
-    # Simpan hanya boq_df sebagai df_base.pkl untuk digunakan oleh modul transformasi lainnya
-    with open(DF_BASE_ONLY_PATH, 'wb') as f:
-        pickle.dump(boq_df, f)
+            # Lookup semua single product sekaligus; jika beberapa baris SO cocok dengan deskripsi yang sama,
+            # baris SO terakhir yang dipakai (sama seperti pengisian berulang sebelumnya)
+            single_products = products.iloc[np.flatnonzero(is_single)]
+            codes = boq_keys.lookup(single_products)
+            found = codes >= 0
+            by_code = pd.Series(single_products.to_numpy(dtype=object)[found], index=codes[found])
+            by_code = by_code[~by_code.index.duplicated(keep="last")]
+            
+            # Isi "Single Product" untuk setiap baris teks BoQ yang kodenya punya pasangan di SO
+            matched = np.isin(boq_keys.codes, by_code.index.to_numpy())
+            single_product = np.full(len(boq_df), None, dtype=object)
+            single_product[text_rows[matched]] = by_code.reindex(boq_keys.codes[matched]).to_numpy(dtype=object)
+            boq_df["Single Product"] = single_product
+    
+    # Simpan masing-masing DataFrame sekali sebagai artifact (df_base = boq_df)
+    save_data(boq_df, so_df)
     
     return boq_df, so_df
 
+def save_data(boq_df, so_df):
+    """
+    Simpan boq_df dan so_df ke ArtifactStore
+    
+    Args:
+        boq_df (pd.DataFrame): DataFrame BoQ (df_base) hasil transformasi
+        so_df (pd.DataFrame): DataFrame Convert to SO hasil transformasi
+    """
+    store = ArtifactStore()
+    store.write(BOQ_ARTIFACT, boq_df)
+    store.write(SO_ARTIFACT, so_df)
+
 def load_data():
     """
-    Load data dari pickle file
+    Load boq_df dan so_df dari ArtifactStore
     
     Returns:
-        tuple: (boq_df, so_df) atau (None, None) jika file tidak ada
+        tuple: (boq_df, so_df) atau (None, None) jika artifact tidak ada
     """
     try:
-        if os.path.exists(DF_BASE_PATH):
-            with open(DF_BASE_PATH, 'rb') as f:
-                data = pickle.load(f)
-                return data['boq_df'], data['so_df']
-        return None, None
+        store = ArtifactStore()
+        boq_df = store.read(BOQ_ARTIFACT)
+        so_df = store.read(SO_ARTIFACT)
+        if boq_df is None or so_df is None:
+            return None, None
+        return boq_df, so_df
     except Exception as e:
         print(f"Error loading data: {str(e)}")
         return None, None
 
-def load_df_base():
+def load_df_base(columns=None):
     """
-    Load hanya df_base dari pickle file
+    Load hanya df_base (boq_df) dari ArtifactStore
+    
+    Args:
+        columns (list, optional): Kolom yang dibaca; kolom yang tidak ada diabaikan. None = semua kolom
     
     Returns:
-        DataFrame: df_base atau None jika file tidak ada
+        DataFrame: df_base atau None jika artifact tidak ada
     """
     try:
-        if os.path.exists(DF_BASE_ONLY_PATH):
-            with open(DF_BASE_ONLY_PATH, 'rb') as f:
-                return pickle.load(f)
-        return None
+        return ArtifactStore().read(BOQ_ARTIFACT, columns=columns)
     except Exception as e:
         print(f"Error loading df_base: {str(e)}")
         return None
@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
 from ETL_library.validate import CrossFileValidator
+from ETL_library.transform import NormalizedKeyIndex
+from ETL_library.utility import ColumnResolver
 
 def validate(boq_df, so_df, boq_validation_col, so_validation_col):
     """
@@ -61,6 +63,10 @@ def validate(boq_df, so_df, boq_validation_col, so_validation_col):
     # Simpan potential_mismatch awal
     result["potential_mismatch"] = potential_mismatch.copy()
     
+    # Index kunci ternormalisasi (astype(str) + lower) dibangun sekali untuk semua pencarian nilai di bawah
+    boq_keys = NormalizedKeyIndex(boq_df[boq_validation_col])
+    so_products = NormalizedKeyIndex(so_df['Product']) if 'Product' in so_df.columns else None
+    
     # 3. Identifikasi Items (kategori) dari potential_mismatch yang berasal dari BoQ
     items_to_remove = []
     for i, item in enumerate(potential_mismatch):
@@ -68,7 +74,7 @@ def validate(boq_df, so_df, boq_validation_col, so_validation_col):
             value = item['value']
             
             # Cari row di boq_df yang memiliki nilai tersebut
-            rows = boq_df.index[boq_df[boq_validation_col].astype(str).str.lower() == value.lower()].tolist()
+            rows = boq_df.index[boq_keys.positions(value)].tolist()
             
             if rows:
                 row_index = rows[0]
@@ -120,7 +126,7 @@ def validate(boq_df, so_df, boq_validation_col, so_validation_col):
             value = item['value']
             
             # Cari row di boq_df yang memiliki nilai tersebut
-            rows = boq_df.index[boq_df[boq_validation_col].astype(str).str.lower() == value.lower()].tolist()
+            rows = boq_df.index[boq_keys.positions(value)].tolist()
             
             if rows:
                 row_index = rows[0]
@@ -150,9 +156,8 @@ def validate(boq_df, so_df, boq_validation_col, so_validation_col):
                 # Jika kiri ATAU kanan tidak kosong
                 if not (left_empty and right_empty):
                     # Cek keberadaan di kolom "Product" di so_df
-                    if 'Product' in so_df.columns:
-                        product_match = so_df['Product'].astype(str).str.lower() == value.lower()
-                        if product_match.any():
+                    if so_products is not None:
+                        if so_products.contains(value):
                             result["single_product"].append({
                                 'source': 'BoQ',
                                 'value': value,
@@ -178,8 +183,7 @@ def validate(boq_df, so_df, boq_validation_col, so_validation_col):
                 (pd.isna(bom_line_val) or (isinstance(bom_line_val, str) and bom_line_val.strip() == ''))):
                 
                 # Cek keberadaan di BoQ
-                match_in_boq = boq_df[boq_validation_col].astype(str).str.lower() == product_val.lower()
-                if match_in_boq.any():
+                if boq_keys.contains(product_val):
                     # Cari di potential_mismatch
                     found = False
                     for i, item in enumerate(potential_mismatch):
@@ -246,7 +250,7 @@ def validate(boq_df, so_df, boq_validation_col, so_validation_col):
     
     if "Unit of Measure" in processed_so_df.columns:
         # Cek kolom Product dan BOM Line
-        product_col = next((col for col in processed_so_df.columns if col.lower() == "product"), None)
+        product_col = ColumnResolver(processed_so_df).get("product")
         bom_line_col = so_validation_col
         
         for idx, row in processed_so_df.iterrows():
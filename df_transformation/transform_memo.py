@@ -0,0 +1,232 @@
+import functools
+import hashlib
+import io
+import json
+import os
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from df_transformation.artifact_store import ArtifactStore
+
+
+_type_of = np.frompyfunc(type, 1, 1)
+
+
+def frame_digest(df: pd.DataFrame) -> str:
+    """
+    Content hash sebuah DataFrame: header, dtype, index dan nilai setiap kolom.
+
+    Nilai di-hash sekali untuk seluruh frame dengan hash_pandas_object(index=True).
+    Hash itu menyamakan nilai object yang string-nya sama (mis. 1 dan "1") dan semua jenis NA
+    (None dan NaN), sehingga kolom object yang tidak berisi string saja ikut di-hash dengan
+    kode tipe per cell (type() dijalankan di loop numpy, tanpa fungsi Python per cell).
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps([str(column) for column in df.columns]).encode("utf-8"))
+    digest.update(json.dumps([repr(dtype) for dtype in df.dtypes]).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    for position, dtype in enumerate(df.dtypes):
+        if dtype != object:
+            continue
+        values = df.iloc[:, position].to_numpy()
+        if pd.api.types.infer_dtype(values, skipna=False) == "string":
+            continue
+        codes, types = pd.factorize(_type_of(values))
+        digest.update(json.dumps([position] + [value_type.__name__ for value_type in types]).encode("utf-8"))
+        digest.update(codes.tobytes())
+    return digest.hexdigest()
+
+
+def _copy_result(result: Any) -> Any:
+    """Salin DataFrame di hasil agar entry memo tidak ikut berubah saat hasil diedit pemanggil."""
+    if isinstance(result, pd.DataFrame):
+        return result.copy()
+    if isinstance(result, tuple):
+        return tuple(_copy_result(item) for item in result)
+    return result
+
+
+class TransformMemo:
+    """
+    Memo hasil transformasi di memori, dengan key content hash input + setting.
+
+    Entry menyimpan hasil (DataFrame), bytes file Excel output, dan content hash artifact
+    yang ditulis. Saat hit, file Excel atau artifact di disk yang sudah ditimpa oleh run
+    lain dipulihkan dari entry, sehingga modul pembaca tetap melihat data yang sesuai.
+    Entry paling lama tidak dipakai dibuang jika jumlahnya melebihi max_entries.
+    """
+
+    def __init__(self, max_entries: int = 16):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._excel = OrderedDict()
+        # (key, mtime, ukuran) file output Excel saat terakhir ditulis lewat memo ini;
+        # berbeda berarti file sudah ditimpa run lain (juga dari sesi lain)
+        self._written = {}
+
+    @staticmethod
+    def make_key(name: str, inputs: List[str], settings: Optional[Dict[str, Any]] = None) -> str:
+        payload = json.dumps({"name": name, "inputs": inputs, "settings": settings or {}}, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _file_state(key: str, path: str) -> Tuple[str, int, int]:
+        stat = os.stat(path)
+        return key, stat.st_mtime_ns, stat.st_size
+
+    def _remember(self, store: OrderedDict, key: str, value: Any):
+        store[key] = value
+        store.move_to_end(key)
+        while len(store) > self.max_entries:
+            store.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+        self._excel.clear()
+        self._written.clear()
+
+    def run(
+        self,
+        key: str,
+        func: Callable[[], Any],
+        output_path: Optional[str] = None,
+        output_artifacts: Optional[Dict[str, Optional[int]]] = None
+    ) -> Any:
+        """
+        Jalankan func() atau kembalikan hasil memo untuk key yang sama.
+
+        Args:
+            key: Key dari make_key
+            func: Fungsi transformasi tanpa argumen
+            output_path: File Excel yang ditulis func (bytes-nya ikut disimpan)
+            output_artifacts: Artifact yang ditulis func -> posisi DataFrame di hasil tuple
+                (None jika hasilnya sendiri DataFrame)
+
+        Returns:
+            Salinan hasil func
+        """
+        output_artifacts = output_artifacts or {}
+        store = ArtifactStore()
+        entry = self._entries.get(key)
+
+        if entry is not None:
+            self._entries.move_to_end(key)
+            result = entry["result"]
+            # Pulihkan artifact yang sudah ditimpa run dengan input lain
+            for name, position in output_artifacts.items():
+                manifest = store.manifest(name)
+                if manifest is None or manifest["content_hash"] != entry["artifacts"].get(name):
+                    frame = result if position is None else result[position]
+                    entry["artifacts"][name] = store.write(name, frame)["content_hash"]
+            # Pulihkan file Excel jika sudah hilang atau ditimpa sejak terakhir ditulis untuk key ini
+            if output_path and entry["excel"] is not None:
+                if not os.path.exists(output_path) or self._written.get(output_path) != self._file_state(key, output_path):
+                    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+                    with open(output_path, "wb") as f:
+                        f.write(entry["excel"])
+                    self._written[output_path] = self._file_state(key, output_path)
+            return _copy_result(result)
+
+        result = func()
+        if result is None:
+            # Transformasi gagal/tanpa data: tidak di-memo
+            return result
+        excel = None
+        if output_path and os.path.exists(output_path):
+            with open(output_path, "rb") as f:
+                excel = f.read()
+            self._written[output_path] = self._file_state(key, output_path)
+        artifacts = {}
+        for name, position in output_artifacts.items():
+            manifest = store.manifest(name)
+            if manifest is not None:
+                artifacts[name] = manifest["content_hash"]
+        self._remember(self._entries, key, {"result": _copy_result(result), "excel": excel, "artifacts": artifacts})
+        return result
+
+    def excel_bytes(self, df: pd.DataFrame, sheet_name: str = "Sheet1", engine: str = "xlsxwriter") -> bytes:
+        """Bytes file Excel untuk DataFrame; dibuat ulang hanya jika isi DataFrame berubah."""
+        key = self.make_key("excel", [frame_digest(df)], {"sheet_name": sheet_name, "engine": engine})
+        data = self._excel.get(key)
+        if data is None:
+            output = io.BytesIO()
+            with pd.ExcelWriter(output, engine=engine) as writer:
+                df.to_excel(writer, index=False, sheet_name=sheet_name)
+            data = output.getvalue()
+        self._remember(self._excel, key, data)
+        return data
+
+
+# Memo untuk pemakaian di luar Streamlit (script, test); sesi Streamlit memakai memo sendiri
+MEMO = TransformMemo()
+
+
+def get_memo() -> TransformMemo:
+    """
+    Memo untuk pemanggil saat ini.
+
+    Di dalam aplikasi Streamlit, setiap sesi punya TransformMemo sendiri di st.session_state
+    (bertahan antar rerun), sehingga hasil, artifact dan file Excel yang dipulihkan saat hit
+    selalu berasal dari run sesi itu sendiri, bukan dari upload pengguna lain.
+    Di luar Streamlit dipakai MEMO milik proses.
+    """
+    try:
+        import streamlit as st
+    except ImportError:
+        return MEMO
+    if not st.runtime.exists():
+        return MEMO
+    if "transform_memo" not in st.session_state:
+        st.session_state.transform_memo = TransformMemo()
+    return st.session_state.transform_memo
+
+
+def memoized(
+    name: str,
+    input_artifacts: Tuple[str, ...] = (),
+    settings: Optional[Callable[[], Dict[str, Any]]] = None,
+    output_path: Optional[str] = None,
+    output_artifacts: Optional[Dict[str, Optional[int]]] = None
+):
+    """
+    Decorator memo untuk fungsi transformasi di df_transformation.
+
+    Key dihitung dari nama, content hash setiap argumen DataFrame, content hash artifact
+    input (dari manifest ArtifactStore) dan setting yang relevan. Jika artifact input belum
+    ada, fungsi dijalankan tanpa memo.
+
+    Args:
+        name: Nama transformasi
+        input_artifacts: Artifact yang dibaca fungsi (mis. ("boq_df",))
+        settings: Fungsi yang mengembalikan dict setting yang memengaruhi hasil (mis. company)
+        output_path: File Excel yang ditulis fungsi
+        output_artifacts: Artifact yang ditulis fungsi (lihat TransformMemo.run)
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            inputs = [
+                frame_digest(value) if isinstance(value, pd.DataFrame) else repr(value)
+                for value in args
+            ] + [
+                f"{k}={frame_digest(value) if isinstance(value, pd.DataFrame) else repr(value)}"
+                for k, value in sorted(kwargs.items())
+            ]
+            store = ArtifactStore()
+            for artifact in input_artifacts:
+                manifest = store.manifest(artifact)
+                if manifest is None:
+                    return func(*args, **kwargs)
+                inputs.append(manifest["content_hash"])
+            memo = get_memo()
+            key = memo.make_key(name, inputs, settings() if settings else None)
+            return memo.run(
+                key,
+                lambda: func(*args, **kwargs),
+                output_path=output_path,
+                output_artifacts=output_artifacts
+            )
+        return wrapper
+    return decorator
@@ -0,0 +1,31 @@
+import os
+
+import pytest
+
+# Root repository (folder induk tests/), dipakai untuk path file contoh di docs/ dan ETL_library/
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SAMPLE_WORKBOOKS = [
+    os.path.join(REPO_ROOT, "docs", "BoQ.xlsx"),
+    os.path.join(REPO_ROOT, "docs", "convert to SO.xlsx"),
+    os.path.join(REPO_ROOT, "docs", "convert to SO - UoM error.xlsx"),
+    os.path.join(REPO_ROOT, "docs", "convert to SO - UoM fix.xlsx"),
+    os.path.join(REPO_ROOT, "ETL_library", "Book1.xlsx"),
+    os.path.join(REPO_ROOT, "ETL_library", "Book2.xlsx"),
+]
+
+
+def assert_frame_identical(left, right):
+    """DataFrame sama persis: nilai (DataFrame.equals), header, dtype, index dan tipe Python setiap cell."""
+    assert list(left.columns) == list(right.columns)
+    assert list(left.dtypes) == list(right.dtypes)
+    assert left.index.equals(right.index)
+    assert left.equals(right)
+    for position in range(left.shape[1]):
+        if left.dtypes.iloc[position] == object:
+            assert [type(value) for value in left.iloc[:, position]] == [type(value) for value in right.iloc[:, position]]
+
+
+@pytest.fixture
+def repo_root():
+    return REPO_ROOT
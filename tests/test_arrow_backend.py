@@ -0,0 +1,179 @@
+import contextlib
+import io
+import os
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from config import BOQ_VALIDATION_COL, DEFAULT_SETTINGS, EXTRACT_OPTIONS, SO_VALIDATION_COL
+from df_transformation import df_base, df_BillOfMaterial, df_ProductVariant, df_SalesOrder, df_validation
+from df_transformation.transform_memo import MEMO
+from ETL_library.extract import apply_dtype_backend, create_extractor, to_object_backend
+from ETL_library.transform import (
+    DataFrameJoiner,
+    DuplicateRestorer,
+    DuplicateSuppressor,
+    EmptyspaceCleaner,
+    FieldMapper,
+    SectionExtractor,
+    TextPrefixFormatter,
+    WhitespaceCleaner,
+    is_string_dtype,
+)
+from tests.conftest import REPO_ROOT, assert_frame_identical
+
+ENGINES = {
+    "openpyxl": {},
+    "streaming": {"streaming": True},
+    "xml": {"engine": "xml"},
+}
+SO = os.path.join(REPO_ROOT, "docs", "convert to SO.xlsx")
+BOQ = os.path.join(REPO_ROOT, "docs", "BoQ.xlsx")
+STRING_DTYPE = pd.StringDtype("pyarrow")
+
+
+def plain(df):
+    """Nilai frame sebagai list Python dengan semua jenis NA menjadi None."""
+    values = df.astype(object)
+    return values.where(values.notna(), None).values.tolist()
+
+
+def extract_both(path, header_row, **options):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        window = {"header_row": header_row, "data_start_row": header_row + 1}
+        object_df, object_info = create_extractor(path, **window, **options).extract()
+        arrow_df, arrow_info = create_extractor(path, **window, dtype_backend="pyarrow", **options).extract()
+    return object_df, object_info, arrow_df, arrow_info
+
+
+def assert_arrow_matches_object(object_df, arrow_df):
+    assert list(arrow_df.columns) == list(object_df.columns)
+    for position in range(object_df.shape[1]):
+        column = object_df.iloc[:, position]
+        text_only = column.dtype == object and pd.api.types.infer_dtype(column, skipna=True) == "string"
+        expected_dtype = STRING_DTYPE if text_only else column.dtype
+        assert arrow_df.dtypes.iloc[position] == expected_dtype
+    assert plain(arrow_df) == plain(object_df)
+
+
+@pytest.mark.parametrize("engine", list(ENGINES))
+@pytest.mark.parametrize("path, header_row", [(SO, 1), (BOQ, 12)])
+def test_extraction_with_pyarrow_backend_keeps_values(engine, path, header_row):
+    if path == BOQ and engine == "openpyxl":
+        pytest.skip("BoQ dibaca dengan engine streaming/xml saja agar test tetap cepat")
+    object_df, object_info, arrow_df, arrow_info = extract_both(path, header_row, **ENGINES[engine])
+    assert arrow_info == object_info
+    assert any(is_string_dtype(dtype) for dtype in arrow_df.dtypes)
+    assert_arrow_matches_object(object_df, arrow_df)
+
+
+def test_csv_with_pyarrow_backend_keeps_values(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("kode,nama,qty\nA-1,Kabel,10\nA-2,,\nA-3,Pipa,5\n", encoding="utf-8")
+    object_df = create_extractor(str(path)).extract()
+    arrow_df = create_extractor(str(path), dtype_backend="pyarrow").extract()
+    assert all(is_string_dtype(dtype) for dtype in arrow_df.dtypes)
+    assert plain(arrow_df) == plain(object_df)
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        create_extractor(SO, dtype_backend="polars")
+    with pytest.raises(ValueError):
+        apply_dtype_backend(pd.DataFrame({"a": ["x"]}), "polars")
+
+
+def so_frames():
+    object_df, _, arrow_df, _ = extract_both(SO, 1, engine="xml")
+    return object_df, arrow_df
+
+
+TRANSFORMS = {
+    "whitespace": lambda df: WhitespaceCleaner(threshold=0.6).clean(df),
+    "emptyspace": lambda df: EmptyspaceCleaner(["BOM Line"]).clean(df),
+    "section": lambda df: SectionExtractor("Product", "Section").extract(df),
+    "suppress": lambda df: DuplicateSuppressor(["VN"], group_by=["Product"], replacement_value="").transform(df),
+    "suppress_none": lambda df: DuplicateSuppressor(["BOM Line"], sort_data=False, replacement_value=None).transform(df),
+    "restore": lambda df: DuplicateRestorer(["Product", "VN"]).transform(df),
+    "restore_grouped": lambda df: DuplicateRestorer(["VN"], group_by=["Product"]).transform(df),
+    "prefix": lambda df: TextPrefixFormatter("BOM Line", "V - ", skip_na=False).transform(df),
+    "mapper": lambda df: FieldMapper(
+        {"Product": "Name", "BOM Line": "Line"}, {"Name": ["strip", "upper"], "Line": ["lower", "prefix:V - "]}
+    ).map_fields(df),
+}
+
+
+@pytest.mark.parametrize("name", list(TRANSFORMS))
+def test_transformers_on_arrow_columns_match_object_columns(name):
+    object_df, arrow_df = so_frames()
+    original = arrow_df.copy()
+    object_result = TRANSFORMS[name](object_df)
+    arrow_result = TRANSFORMS[name](arrow_df)
+    assert list(arrow_result.columns) == list(object_result.columns)
+    assert arrow_result.index.equals(object_result.index)
+    assert plain(arrow_result) == plain(object_result)
+    assert arrow_df.equals(original)
+
+
+def test_string_columns_stay_arrow_backed_through_transformers():
+    _, arrow_df = so_frames()
+    result = TextPrefixFormatter("BOM Line", "V - ").transform(DuplicateRestorer(["Product"]).transform(arrow_df))
+    assert result["BOM Line"].dtype == STRING_DTYPE
+    assert result["Product"].dtype == STRING_DTYPE
+
+
+def test_join_on_arrow_keys_matches_object_keys():
+    object_df, arrow_df = so_frames()
+    keys = object_df["BOM Line"].dropna().str.upper().unique()[:20]
+    right = pd.DataFrame({"Deskripsi": pd.Series(keys, dtype=object), "Harga": np.arange(len(keys), dtype=float)})
+    joiner = DataFrameJoiner("BOM Line", "Deskripsi", columns_to_add=["Harga"])
+    object_result = joiner.join(object_df, right)
+    arrow_result = joiner.join(arrow_df, apply_dtype_backend(right.copy(), "pyarrow"))
+    assert list(arrow_result.columns) == list(object_result.columns)
+    assert plain(arrow_result) == plain(object_result)
+
+
+def test_to_object_backend_restores_extraction_frame():
+    object_df, _, arrow_df, _ = extract_both(SO, 1, streaming=True)
+    result = to_object_backend(arrow_df)
+    assert result is arrow_df
+    assert_frame_identical(result, object_df)
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Artifact dan output df_* ditulis ke folder sementara."""
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("temp", exist_ok=True)
+    MEMO.clear()
+    yield tmp_path
+    MEMO.clear()
+
+
+def run_app(dtype_backend):
+    """Alur Upload -> Validasi -> df_base -> BoM/SO/PV seperti di main.py."""
+    frames = []
+    for name, key in [("BoQ.xlsx", "boq"), ("convert to SO.xlsx", "so")]:
+        settings = DEFAULT_SETTINGS[key]
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            df, _ = create_extractor(
+                os.path.join(REPO_ROOT, "docs", name), 0, settings["header_row"], settings["data_start_row"],
+                settings["data_end_row"], **dict(EXTRACT_OPTIONS, dtype_backend=dtype_backend)
+            ).extract()
+        frames.append(to_object_backend(WhitespaceCleaner(threshold=1).clean(df)))
+    with contextlib.redirect_stdout(io.StringIO()):
+        validated = df_validation.validate(frames[0], frames[1], BOQ_VALIDATION_COL, SO_VALIDATION_COL)
+        df_base.transform_and_save.__wrapped__(validated["boq_df"], validated["so_df"])
+        return [module.transform.__wrapped__() for module in (df_BillOfMaterial, df_SalesOrder, df_ProductVariant)]
+
+
+def test_app_outputs_are_the_same_under_both_backends(workdir):
+    object_outputs = run_app(None)
+    arrow_outputs = run_app("pyarrow")
+    for object_output, arrow_output in zip(object_outputs, arrow_outputs):
+        assert not object_output.empty
+        assert_frame_identical(arrow_output, object_output)
@@ -0,0 +1,156 @@
+import json
+import os
+import pickle
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from df_transformation import df_base
+from df_transformation.artifact_store import ArtifactStore
+from df_transformation.transform_memo import MEMO
+from tests.conftest import REPO_ROOT, assert_frame_identical
+from tests.test_transformer_parity import random_frame
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ArtifactStore(str(tmp_path / "artifacts"))
+
+
+def mixed_frame():
+    """Frame dengan semua jenis kolom yang muncul di df_base: Arrow, teks ber-NA, dan object campuran."""
+    return pd.DataFrame({
+        "No": pd.Series([1, 2, 3, 4], dtype="int64"),
+        "Harga": [1.5, np.nan, 2.0, 3.25],
+        "Aktif": [True, False, True, True],
+        "Tanggal": pd.to_datetime(["2025-01-01", None, "2025-03-01", "2025-04-01"]),
+        "Deskripsi": pd.Series(["Kabel", None, "Panel", "Baut"], dtype=object),
+        "Catatan": pd.Series(["a", np.nan, np.nan, "b"], dtype=object),
+        "Kosong": pd.Series([None] * 4, dtype=object),
+        "Campuran": pd.Series([1, "dua", None, 3.5], dtype=object),
+        "NA Campuran": pd.Series(["x", None, np.nan, "y"], dtype=object),
+        "Single Product": pd.Series(["Set A", None, None, None], dtype=object),
+        "Teks Arrow": pd.Series(["m", None, "pcs", "m"], dtype="string[pyarrow]"),
+        "Teks Python": pd.Series(["m", None, "pcs", "m"], dtype="string[python]"),
+    })
+
+
+def pickle_round_trip(df):
+    """Penyimpanan versi lama (pickle seluruh frame) sebagai acuan."""
+    return pickle.loads(pickle.dumps(df))
+
+
+def test_round_trip_matches_pickle(store):
+    df = mixed_frame()
+    manifest = store.write("boq_df", df)
+    assert_frame_identical(store.read("boq_df"), pickle_round_trip(df))
+    assert_frame_identical(store.read("boq_df", memory_map=False, verify=True), df)
+    storage = {field["name"]: field["storage"] for field in manifest["schema"]}
+    assert storage["Campuran"] == "pickle" and storage["NA Campuran"] == "pickle"
+    assert storage["Deskripsi"] == "arrow" and storage["Catatan"] == "arrow" and storage["Teks Arrow"] == "arrow"
+    assert manifest["rows"] == len(df) and manifest["default_index"]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_object_frames_round_trip(store, seed):
+    df = random_frame(seed)
+    store.write("so_df", df)
+    assert_frame_identical(store.read("so_df"), pickle_round_trip(df))
+
+
+def test_duplicate_headers_and_index_round_trip(store):
+    df = mixed_frame().iloc[[3, 1, 0]]
+    df.columns = ["No", "No"] + list(df.columns[2:])
+    store.write("boq_df", df)
+    assert_frame_identical(store.read("boq_df"), df)
+
+
+def test_empty_frame_round_trip(store):
+    df = mixed_frame().iloc[:0]
+    store.write("boq_df", df)
+    result = store.read("boq_df")
+    assert list(result.columns) == list(df.columns) and len(result) == 0
+
+
+def test_read_selected_columns_in_requested_order(store):
+    df = mixed_frame()
+    store.write("boq_df", df)
+    columns = ["Campuran", "Deskripsi", "Tidak Ada", "Harga"]
+    assert_frame_identical(store.read("boq_df", columns=columns), df[["Campuran", "Deskripsi", "Harga"]])
+
+
+def test_new_version_replaces_old_files(store):
+    first = store.write("boq_df", mixed_frame())
+    second = store.write("boq_df", mixed_frame().head(2))
+    assert (first["version"], second["version"]) == (1, 2)
+    assert first["content_hash"] != second["content_hash"]
+    assert sorted(os.listdir(store.root)) == sorted(["boq_df.json"] + list(second["files"].values()))
+    assert_frame_identical(store.read("boq_df"), mixed_frame().head(2))
+
+
+def test_same_content_same_hash(store):
+    first = store.write("boq_df", mixed_frame())
+    second = store.write("boq_df", mixed_frame())
+    assert first["content_hash"] == second["content_hash"]
+
+
+def test_missing_corrupt_and_tampered_artifacts(store):
+    assert store.read("boq_df") is None and not store.exists("boq_df")
+    manifest = store.write("boq_df", mixed_frame())
+    with open(os.path.join(store.root, manifest["files"]["arrow"]), "ab") as f:
+        f.write(b"0")
+    with pytest.raises(ValueError):
+        store.read("boq_df", verify=True)
+    with open(os.path.join(store.root, "boq_df.json"), "w", encoding="utf-8") as f:
+        json.dump(dict(manifest, format_version=ArtifactStore.FORMAT_VERSION + 1), f)
+    with pytest.raises(ValueError):
+        store.read("boq_df")
+    with open(os.path.join(store.root, "boq_df.json"), "w", encoding="utf-8") as f:
+        f.write("{")
+    assert store.read("boq_df") is None
+
+
+def test_concurrent_writes_get_distinct_versions(store):
+    frames = [mixed_frame().head(n) for n in range(1, 5)] * 4
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        manifests = list(pool.map(lambda df: store.write("boq_df", df), frames))
+    versions = sorted(manifest["version"] for manifest in manifests)
+    assert versions == list(range(1, len(frames) + 1))
+    latest = max(manifests, key=lambda manifest: manifest["version"])
+    assert store.manifest("boq_df") == latest
+    assert sorted(os.listdir(store.root)) == sorted(["boq_df.json"] + list(latest["files"].values()))
+    assert_frame_identical(store.read("boq_df", verify=True), frames[manifests.index(latest)])
+
+
+def test_stale_lock_is_taken_over(store):
+    os.makedirs(store.root)
+    lock_path = os.path.join(store.root, "boq_df.lock")
+    with open(lock_path, "w") as f:
+        f.write("0")
+    stale = time.time() - ArtifactStore.LOCK_STALE_SECONDS - 1
+    os.utime(lock_path, (stale, stale))
+    assert store.write("boq_df", mixed_frame())["version"] == 1
+    assert not os.path.exists(lock_path)
+
+
+def test_df_base_save_and_load_round_trip(tmp_path, monkeypatch):
+    from ETL_library.extract import create_extractor
+
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("temp", exist_ok=True)
+    MEMO.clear()
+    try:
+        boq_df, _ = create_extractor(os.path.join(REPO_ROOT, "docs", "BoQ.xlsx"), 0, 12, 13).extract()
+        so_df, _ = create_extractor(os.path.join(REPO_ROOT, "docs", "convert to SO - UoM fix.xlsx"), 0, 1, 2).extract()
+        boq_df, so_df = df_base.transform_and_save.__wrapped__(boq_df, so_df)
+        df_base.save_data(boq_df, so_df)
+        loaded_boq, loaded_so = df_base.load_data()
+        assert_frame_identical(loaded_boq, pickle_round_trip(boq_df))
+        assert_frame_identical(loaded_so, pickle_round_trip(so_df))
+        columns = ["Single Product", "Unit of Measure"]
+        assert_frame_identical(df_base.load_df_base(columns), boq_df[columns])
+    finally:
+        MEMO.clear()
@@ -0,0 +1,129 @@
+import re
+import warnings
+import zipfile
+
+import openpyxl
+import pytest
+from openpyxl.styles import Border, Side
+
+from ETL_library.extract import _XlsxPackage, create_extractor
+from tests.conftest import SAMPLE_WORKBOOKS
+
+ENGINES = {
+    "openpyxl": {},
+    "streaming": {"streaming": True},
+    "xml": {"engine": "xml"},
+}
+THIN = Border(bottom=Side(style="thin"))
+
+
+def reference_bottom_borders(path, sheet=0):
+    """Scan border versi lama: cell.border.bottom.style untuk setiap sel di grid max_row x max_col."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        workbook = openpyxl.load_workbook(path, data_only=True)
+    worksheet = workbook.worksheets[sheet]
+    max_row, max_col = worksheet.max_row, worksheet.max_column
+    rows_with_bottom_border = {}
+    for row in range(1, max_row + 1):
+        cols = []
+        for col in range(1, max_col + 1):
+            border = worksheet.cell(row=row, column=col).border
+            if border and border.bottom and border.bottom.style:
+                cols.append(col)
+        if cols:
+            rows_with_bottom_border[row] = cols
+    return rows_with_bottom_border, (max_row, max_col)
+
+
+def border_info(path, engine, **window):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        _, info = create_extractor(path, **window, **ENGINES[engine]).extract()
+    return info
+
+
+def build_bordered_workbook(path):
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(["No", "Deskripsi", "Qty", "Satuan", "Harga", "Total", "Catatan"])
+    for row in range(2, 12):
+        sheet.append([row - 1, f"Item {row - 1}", row, "pcs", 1000, row * 1000, None])
+    for col in range(1, 8):
+        sheet.cell(row=1, column=col).border = THIN
+        sheet.cell(row=11, column=col).border = THIN
+    # Merged range: border di sel kiri atas -> seluruh baris terbawah range ber-border
+    sheet.merge_cells("A4:C5")
+    sheet["A4"].border = THIN
+    # Border hanya di sel kanan bawah -> dipakai openpyxl untuk sel kiri atas
+    sheet["G5"].border = THIN
+    sheet.merge_cells("E4:G5")
+    # Border di sel tengah range merged (bukan kiri atas/kanan bawah) hilang
+    sheet["B8"].border = THIN
+    sheet.merge_cells("A8:D8")
+    # Range merged di luar data memperluas max_row/max_col
+    sheet["I14"].border = THIN
+    sheet.merge_cells("H13:I14")
+    # Border di sel kosong jauh di bawah data
+    for col in range(1, 6):
+        sheet.cell(row=20, column=col).border = THIN
+    workbook.save(path)
+    return path
+
+
+def with_bordered_default_style(source, target):
+    """Salin workbook dengan border default (borderId 0) diberi bottom style: semua sel ber-border."""
+    with zipfile.ZipFile(source) as src, zipfile.ZipFile(target, "w") as dst:
+        for item in src.infolist():
+            data = src.read(item.filename)
+            if item.filename == "xl/styles.xml":
+                text = data.decode("utf-8")
+                first = re.search(r"<border>.*?</border>", text, flags=re.S)
+                patched = re.sub(r"<bottom\s*/>", '<bottom style="thin"/>', first.group(0), count=1)
+                data = (text[:first.start()] + patched + text[first.end():]).encode("utf-8")
+            dst.writestr(item, data)
+    return target
+
+
+@pytest.mark.parametrize("engine", list(ENGINES))
+@pytest.mark.parametrize("path", SAMPLE_WORKBOOKS)
+def test_style_index_scan_matches_cell_border_scan(engine, path):
+    expected_borders, (max_row, max_col) = reference_bottom_borders(path)
+    info = border_info(path, engine, header_row=1, data_start_row=2)
+    assert info["rows_with_bottom_border"] == expected_borders
+    assert (info["max_row"], info["max_col"]) == (max_row, max_col)
+
+
+@pytest.mark.parametrize("engine", list(ENGINES))
+def test_merged_cell_bottom_borders_follow_openpyxl(tmp_path, engine):
+    path = build_bordered_workbook(str(tmp_path / "merged.xlsx"))
+    expected_borders, (max_row, max_col) = reference_bottom_borders(path)
+    assert expected_borders[5] == [1, 2, 3, 5, 6, 7]
+    assert 8 not in expected_borders
+    assert (max_row, max_col) == (20, 9)
+
+    info = border_info(path, engine, header_row=1, data_start_row=2)
+    assert info["rows_with_bottom_border"] == expected_borders
+    assert (info["max_row"], info["max_col"]) == (max_row, max_col)
+    # Baris ber-border > 3 kolom terakhir setelah header menentukan data_end_row
+    assert info["border_ranges"] == [1, 5, 11, 20]
+    assert info["data_end_row"] == 20
+
+
+@pytest.mark.parametrize("engine", list(ENGINES))
+def test_default_border_with_bottom_style_marks_every_cell(tmp_path, engine):
+    source = build_bordered_workbook(str(tmp_path / "merged.xlsx"))
+    path = with_bordered_default_style(source, str(tmp_path / "default_border.xlsx"))
+    expected_borders, (max_row, max_col) = reference_bottom_borders(path)
+    assert len(expected_borders) == max_row
+    info = border_info(path, engine, header_row=1, data_start_row=2)
+    assert info["rows_with_bottom_border"] == expected_borders
+
+
+def test_apply_merged_borders_rule():
+    borders = {4: [1], 5: [2, 7, 9], 8: [2]}
+    merged = ["A4:C5", "E4:G5", "A8:D8", "K1", None]
+    assert _XlsxPackage.apply_merged_borders(borders, merged) == {
+        4: [1, 5],
+        5: [1, 2, 3, 5, 6, 7, 9],
+    }
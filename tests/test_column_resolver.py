@@ -0,0 +1,206 @@
+import contextlib
+import io
+import random
+
+import pandas as pd
+import pytest
+
+from ETL_library.utility import ColumnResolver
+
+
+# find_column versi lama di df_ProductVariant sebagai acuan
+def reference_find_column(df, column_name):
+    """
+    Cari kolom dalam DataFrame dengan pencocokan case-insensitive
+    
+    Args:
+        df (pd.DataFrame): DataFrame untuk dicari
+        column_name (str): Nama kolom yang dicari
+        
+    Returns:
+        str: Nama kolom asli jika ditemukan, None jika tidak
+    """
+    # 1. Exact match
+    if column_name in df.columns:
+        return column_name
+    
+    # 2. Case-insensitive exact match
+    for col in df.columns:
+        if col.lower() == column_name.lower():
+            return col
+    
+    # 3. Substring match (untuk kolom dengan awalan/akhiran tambahan)
+    for col in df.columns:
+        if column_name.lower() in col.lower():
+            return col
+    
+    # 4. Match dengan spasi fleksibel (misalnya "ModalUnit" untuk "Modal Unit")
+    no_space_name = column_name.lower().replace(" ", "")
+    for col in df.columns:
+        no_space_col = col.lower().replace(" ", "")
+        if no_space_name == no_space_col:
+            return col
+    
+    return None
+
+
+# find_column versi lama di df_UpdateProduct/df_UpdateProduct2 (fuzzy, dengan print debug) sebagai acuan
+def reference_find_column_fuzzy(df, column_name):
+    """
+    Cari kolom dalam DataFrame dengan pencocokan case-insensitive
+    
+    Args:
+        df (pd.DataFrame): DataFrame untuk dicari
+        column_name (str): Nama kolom yang dicari
+        
+    Returns:
+        str: Nama kolom asli jika ditemukan, None jika tidak
+    """
+    # Print columns we're searching through - helpful for debugging
+    print(f"Searching for column '{column_name}' in columns: {list(df.columns)}")
+    
+    # 1. Exact match
+    if column_name in df.columns:
+        print(f"Found exact match for '{column_name}'")
+        return column_name
+    
+    # 2. Case-insensitive exact match
+    for col in df.columns:
+        if col.lower() == column_name.lower():
+            print(f"Found case-insensitive match: '{col}' for '{column_name}'")
+            return col
+    
+    # 3. Substring match (untuk kolom dengan awalan/akhiran tambahan)
+    for col in df.columns:
+        if column_name.lower() in col.lower():
+            print(f"Found substring match: '{col}' for '{column_name}'")
+            return col
+        # Also check if column is in the search term (reversed check)
+        elif col.lower() in column_name.lower() and len(col) > 3:  # Minimum 4 chars to avoid short matches
+            print(f"Found reverse substring match: '{col}' in '{column_name}'")
+            return col
+    
+    # 4. Match dengan spasi fleksibel (misalnya "ModalUnit" untuk "Modal Unit")
+    no_space_name = column_name.lower().replace(" ", "")
+    for col in df.columns:
+        no_space_col = col.lower().replace(" ", "")
+        if no_space_name == no_space_col:
+            print(f"Found no-space match: '{col}' for '{column_name}'")
+            return col
+        # Partial match without space (at least 70% of the characters)
+        elif (no_space_name in no_space_col and len(no_space_name) >= 0.7 * len(no_space_col)) or \
+             (no_space_col in no_space_name and len(no_space_col) >= 0.7 * len(no_space_name)):
+            print(f"Found partial no-space match: '{col}' for '{column_name}'")
+            return col
+    
+    # 5. Try fuzzy matching for similar column names with high similarity
+    try:
+        import difflib
+        matches = difflib.get_close_matches(column_name.lower(), [c.lower() for c in df.columns], n=1, cutoff=0.7)
+        if matches:
+            for col in df.columns:
+                if col.lower() == matches[0]:
+                    print(f"Found fuzzy match: '{col}' for '{column_name}'")
+                    return col
+    except ImportError:
+        pass  # Skip fuzzy matching if difflib is not available
+    
+    print(f"No match found for '{column_name}'")
+    return None
+
+
+WORDS = ["Modal", "Unit", "Item", "Qty.", "UoM", "Supplier", "VN", "Price", "Internal", "References",
+         "Description", "modal", "unit", "ITEM", "cost", "Product", "x"]
+
+
+def random_name(rng):
+    name = "".join(rng.choice([" ", ""]) + rng.choice(WORDS) for _ in range(rng.randint(1, 3))).strip()
+    return name or "x"
+
+
+def random_case(seed):
+    rng = random.Random(seed)
+    columns = list(dict.fromkeys(random_name(rng) for _ in range(rng.randint(1, 8))))
+    return pd.DataFrame(columns=columns), [random_name(rng) for _ in range(20)] + columns[:2]
+
+
+def quietly(func, *args):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func(*args)
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_resolution_matches_old_find_column(seed):
+    df, queries = random_case(seed)
+    resolver = ColumnResolver(df)
+    fuzzy_resolver = ColumnResolver(df, fuzzy=True)
+    for query in queries:
+        assert resolver.resolve(query) == reference_find_column(df, query)
+        assert fuzzy_resolver.resolve(query) == quietly(reference_find_column_fuzzy, df, query)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_verbose_prints_same_debug_lines(seed):
+    df, queries = random_case(seed)
+    resolver = ColumnResolver(df, fuzzy=True, verbose=True)
+    for query in dict.fromkeys(queries):
+        expected_output = io.StringIO()
+        with contextlib.redirect_stdout(expected_output):
+            reference_find_column_fuzzy(df, query)
+        actual_output = io.StringIO()
+        with contextlib.redirect_stdout(actual_output):
+            resolver.resolve(query)
+        assert actual_output.getvalue() == expected_output.getvalue()
+
+
+COLUMNS = ["Qty", "qty.", "Modal Unit Price", "modal unit", "Internal  References", "VN", "Deskripsi Barang"]
+
+
+@pytest.mark.parametrize("query, expected, expected_fuzzy", [
+    # 1. Nama persis menang atas kolom case-insensitive sebelumnya
+    ("qty.", "qty.", "qty."),
+    # 2. Case-insensitive: kolom pertama yang cocok
+    ("QTY", "Qty", "Qty"),
+    ("vn", "VN", "VN"),
+    # Case-insensitive menang atas substring di kolom sebelumnya
+    ("Modal Unit", "modal unit", "modal unit"),
+    # 3. Substring: kolom pertama yang mengandung nama dicari
+    ("unit price", "Modal Unit Price", "Modal Unit Price"),
+    ("barang", "Deskripsi Barang", "Deskripsi Barang"),
+    # 3b. Reverse substring (fuzzy): nama kolom > 3 karakter di dalam nama dicari
+    ("Qty. Total", None, "qty."),
+    # 4. Tanpa whitespace
+    ("InternalReferences", "Internal  References", "Internal  References"),
+    # 4b. Partial tanpa whitespace (fuzzy, minimal 70%)
+    ("Internal Reference", None, "Internal  References"),
+    ("DeskripsiBarangs", None, "Deskripsi Barang"),
+    # 5. difflib (fuzzy)
+    ("Deskripsi Barong", None, "Deskripsi Barang"),
+    ("Supplier", None, None),
+])
+def test_resolution_order(query, expected, expected_fuzzy):
+    df = pd.DataFrame(columns=COLUMNS)
+    assert ColumnResolver(df).resolve(query) == expected == reference_find_column(df, query)
+    assert ColumnResolver(COLUMNS, fuzzy=True).resolve(query) == expected_fuzzy == \
+        quietly(reference_find_column_fuzzy, df, query)
+
+
+def test_no_space_stage_ignores_all_whitespace():
+    columns = ["No", "Modal\nUnit", "Harga\tSatuan"]
+    resolver = ColumnResolver(columns)
+    assert resolver.resolve("ModalUnit") == "Modal\nUnit"
+    assert resolver.resolve("harga satuan") == "Harga\tSatuan"
+
+
+def test_get_is_case_insensitive_only():
+    resolver = ColumnResolver(pd.DataFrame(columns=["Product", "PRODUCT", "Unit of Measure"]))
+    assert resolver.get("product") == "Product"
+    assert resolver.get("unit of measure") == "Unit of Measure"
+    assert resolver.get("unit") is None and resolver.get("UnitofMeasure") is None
+
+
+def test_resolve_any_uses_alias_priority_and_cache():
+    resolver = ColumnResolver(["Harga Satuan", "Supplier Name", "Qty"])
+    assert resolver.resolve_any(["Vendor", "supplier", "Qty"]) == "Supplier Name"
+    assert resolver.resolve_any(["Vendor", "Tidak Ada"]) is None
+    assert resolver._cache == {"Vendor": None, "supplier": "Supplier Name", "Tidak Ada": None}
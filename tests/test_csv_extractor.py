@@ -0,0 +1,149 @@
+import io
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ETL_library.extract import CSVExtractor, create_extractor
+from tests.conftest import assert_frame_identical
+
+CSV_BYTES = (
+    "Kode,Nama,,Qty\n"
+    "A-01,Kabel NYY,x,10\n"
+    "A-02,Pipa conduit,,5\n"
+    "A-03,,y,\n"
+    "A-04,MCB 6A,z,2\n"
+    "A-05,Panel,,1\n"
+).encode("utf-8")
+
+# Baris kosong, baris berisi whitespace saja, field ber-quote dengan newline, dan kolom angka tanpa header
+CSV_WITH_BLANK_LINES = (
+    "Laporan BoQ,,,\n"
+    "\n"
+    "Kode,Nama,,Qty\n"
+    "A-01,Kabel NYY,1.5,10\n"
+    "\n"
+    "A-02,\"Pipa\nconduit\",2,5\n"
+    "   \n"
+    "A-03,,,\n"
+    "A-04,MCB 6A,4,2\n"
+    "\n"
+    "\n"
+    "A-05,Panel,5.25,1\n"
+).encode("utf-8")
+
+# Semua header kosong: kolom angka tetap float seperti pembacaan lama
+NUMERIC_CSV = b",\n1,2.5\n\n3,4\n5,\n"
+
+
+def reference_extract(data, header_row=0, data_start_row=1, data_end_row=None):
+    """CSVExtractor.extract versi lama (read_csv seluruh file lalu iloc) sebagai acuan."""
+    df = pd.read_csv(io.BytesIO(data), encoding="utf-8", header=None)
+    headers = [
+        f"Column_{i}" if pd.isna(h) or str(h).strip() == "" else str(h)
+        for i, h in enumerate(df.iloc[header_row])
+    ]
+    data_rows = df.iloc[data_start_row:(data_end_row if data_end_row is not None else None)].values
+    return pd.DataFrame(data_rows, columns=headers)
+
+
+def test_blank_headers_are_named_by_position():
+    df = CSVExtractor(CSV_BYTES).extract()
+    assert list(df.columns) == ["Kode", "Nama", "Column_2", "Qty"]
+    assert df.shape == (5, 4)
+    assert all(dtype == object for dtype in df.dtypes)
+
+
+@pytest.mark.parametrize("data_start_row, data_end_row, chunk_rows", list(itertools.product(
+    [1, 2, 5, 6, 9], [None, 0, 1, 3, 6, 20], [1, 2, 10]
+)))
+def test_iter_chunks_concat_equals_extract(data_start_row, data_end_row, chunk_rows):
+    extractor = CSVExtractor(CSV_BYTES, data_start_row=data_start_row, data_end_row=data_end_row)
+    expected = extractor.extract()
+    chunks = list(extractor.iter_chunks(chunk_rows))
+    assert chunks
+    assert all(list(chunk.columns) == list(expected.columns) for chunk in chunks)
+    assert all(len(chunk) <= chunk_rows for chunk in chunks)
+    assert_frame_identical(pd.concat(chunks), expected)
+
+
+@pytest.mark.parametrize("data_start_row, data_end_row", [(3, 2), (3, 3), (1, 0), (6, None), (50, None), (50, 60)])
+def test_iter_chunks_yields_one_empty_chunk_for_empty_range(data_start_row, data_end_row):
+    extractor = CSVExtractor(CSV_BYTES, data_start_row=data_start_row, data_end_row=data_end_row)
+    chunks = list(extractor.iter_chunks(2))
+    assert len(chunks) == 1
+    assert list(chunks[0].columns) == ["Kode", "Nama", "Column_2", "Qty"]
+    assert chunks[0].empty
+    assert_frame_identical(chunks[0], extractor.extract())
+
+
+def test_iter_chunks_rejects_non_positive_chunk_size():
+    with pytest.raises(ValueError):
+        next(CSVExtractor(CSV_BYTES).iter_chunks(0))
+
+
+def test_path_bytes_and_file_like_sources_match(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_bytes(CSV_BYTES)
+    expected = create_extractor(str(path), header_row=0, data_start_row=1).extract()
+    from_bytes = create_extractor(CSV_BYTES, file_name="data.csv").extract()
+    from_file = create_extractor(io.BytesIO(CSV_BYTES), file_name="data.CSV").extract()
+    assert_frame_identical(from_bytes, expected)
+    assert_frame_identical(from_file, expected)
+
+
+def test_pyarrow_backend_only_converts_pure_text_columns():
+    pytest.importorskip("pyarrow")
+    df = CSVExtractor(CSV_BYTES, dtype_backend="pyarrow").extract()
+    plain = CSVExtractor(CSV_BYTES).extract()
+    for column in df.columns:
+        assert str(df[column].dtype) == "string"
+        assert df[column].astype(object).where(df[column].notna(), None).tolist() == \
+            plain[column].where(plain[column].notna(), None).tolist()
+    chunks = list(CSVExtractor(CSV_BYTES, dtype_backend="pyarrow", data_start_row=40).iter_chunks())
+    assert len(chunks) == 1 and chunks[0].empty
+
+
+@pytest.mark.parametrize("data, header_row, data_start_row, data_end_row", [
+    (CSV_BYTES, 0, 1, None),
+    (CSV_BYTES, 1, 2, 4),
+    (CSV_WITH_BLANK_LINES, 1, 2, None),
+    (CSV_WITH_BLANK_LINES, 1, 3, 5),
+    (CSV_WITH_BLANK_LINES, 1, 5, None),
+    (CSV_WITH_BLANK_LINES, 1, 6, None),
+    (CSV_WITH_BLANK_LINES, 1, 9, None),
+    (NUMERIC_CSV, 0, 1, None),
+    (NUMERIC_CSV, 0, 2, 3),
+])
+def test_window_and_values_match_old_full_read(data, header_row, data_start_row, data_end_row):
+    """header_row/data_start_row adalah baris logis (baris kosong tidak dihitung), seperti versi lama."""
+    extractor = CSVExtractor(data, header_row=header_row, data_start_row=data_start_row, data_end_row=data_end_row)
+    expected = reference_extract(data, header_row, data_start_row, data_end_row)
+    assert_frame_identical(extractor.extract(), expected)
+    for chunk_rows in (1, 2, 100):
+        assert_frame_identical(pd.concat(list(extractor.iter_chunks(chunk_rows))), expected)
+
+
+def test_blank_lines_do_not_shift_window():
+    df = CSVExtractor(CSV_WITH_BLANK_LINES, header_row=1, data_start_row=2, data_end_row=4).extract()
+    assert list(df.columns) == ["Kode", "Nama", "Column_2", "Qty"]
+    assert df["Kode"].tolist() == ["A-01", "A-02"]
+    assert df["Nama"].tolist() == ["Kabel NYY", "Pipa\nconduit"]
+
+
+def test_headerless_numeric_columns_keep_numbers():
+    df = CSVExtractor(CSV_WITH_BLANK_LINES, header_row=1, data_start_row=2).extract()
+    assert [type(value) for value in df["Column_2"]] == [float] * 5
+    assert df["Qty"].tolist()[:2] == ["10", "5"]
+    numeric = CSVExtractor(NUMERIC_CSV).extract()
+    assert list(numeric.dtypes) == [np.float64, np.float64]
+
+
+def test_headerless_columns_are_inferred_from_the_rows_read():
+    """Kolom tanpa header di-infer dari baris yang dibaca saja; teks di luar rentang tidak mengubah tipe."""
+    df = CSVExtractor(CSV_WITH_BLANK_LINES, header_row=1, data_start_row=2).extract()
+    expected = reference_extract(CSV_WITH_BLANK_LINES, 1, 2)
+    data = CSV_WITH_BLANK_LINES.replace(b"Laporan BoQ,,,", b"Laporan BoQ,,catatan,")
+    assert_frame_identical(CSVExtractor(data, header_row=1, data_start_row=2).extract(), expected)
+    assert reference_extract(data, 1, 2)["Column_2"].tolist()[:2] == ["1.5", "2"]
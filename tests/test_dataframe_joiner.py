@@ -0,0 +1,121 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ETL_library.transform import DataFrameJoiner, NormalizedKeyIndex, PreparedJoin
+from tests.conftest import assert_frame_identical
+
+KEY_POOL = ["Abc", "abc", " abc", "ABC ", "Straße", "STRASSE", "nan", "None", np.nan, None, 1, 1.0, "1", "x", "X", "y"]
+
+
+def reference_join(left_df, right_df, left_key, right_key, join_type="left", columns_to_add=None, match_case=False):
+    """DataFrameJoiner.join versi lama (salinan penuh + kolom kunci lower) sebagai acuan hasil."""
+    right_df_subset = right_df[[right_key] + columns_to_add].copy() if columns_to_add else right_df.copy()
+    left_df_copy = left_df.copy()
+    right_df_copy = right_df_subset.copy()
+    if not match_case:
+        left_df_copy[f'__{left_key}_lower'] = left_df_copy[left_key].astype(str).str.lower()
+        right_df_copy[f'__{right_key}_lower'] = right_df_copy[right_key].astype(str).str.lower()
+        join_key_left, join_key_right = f'__{left_key}_lower', f'__{right_key}_lower'
+    else:
+        join_key_left, join_key_right = left_key, right_key
+    result_df = pd.merge(left_df_copy, right_df_copy, how=join_type, left_on=join_key_left,
+                         right_on=join_key_right, suffixes=('', '_right'))
+    if not match_case:
+        result_df = result_df.drop(columns=[join_key_left, join_key_right])
+    if f'{right_key}_right' in result_df.columns:
+        result_df = result_df.drop(columns=[f'{right_key}_right'])
+    elif right_key != left_key and right_key in result_df.columns:
+        result_df = result_df.drop(columns=[right_key])
+    return result_df
+
+
+def random_frames(seed, same_key):
+    rng = np.random.default_rng(seed)
+    n_left, n_right = rng.integers(0, 12), rng.integers(0, 8)
+    left = pd.DataFrame({
+        "Key": pd.Series([KEY_POOL[i] for i in rng.integers(0, len(KEY_POOL), n_left)], dtype=object),
+        "Value": np.arange(n_left),
+    })
+    right = pd.DataFrame({
+        "Key" if same_key else "Code": pd.Series([KEY_POOL[i] for i in rng.integers(0, len(KEY_POOL), n_right)], dtype=object),
+        "Price": np.arange(n_right) * 10,
+        "Value": np.arange(n_right),
+    })
+    return left, right
+
+
+@pytest.mark.parametrize("join_type, match_case, same_key", itertools.product(
+    ["left", "inner", "right", "outer"], [False, True], [False, True]
+))
+def test_join_matches_reference_merge(join_type, match_case, same_key):
+    right_key = "Key" if same_key else "Code"
+    for seed in range(40):
+        left, right = random_frames(seed, same_key)
+        columns_to_add = ["Price", "Value"] if seed % 2 else None
+        joiner = DataFrameJoiner("Key", right_key, join_type=join_type, columns_to_add=columns_to_add, match_case=match_case)
+        expected = reference_join(left, right, "Key", right_key, join_type, columns_to_add, match_case)
+        assert_frame_identical(joiner.join(left, right), expected)
+
+
+def test_inner_join_follows_merge_order_and_nan_keys_match():
+    left = pd.DataFrame({"Key": ["b", np.nan, "a", "B"], "Value": [1, 2, 3, 4]})
+    right = pd.DataFrame({"Key": ["A", "b", None], "Price": [10, 20, 30]})
+    joiner = DataFrameJoiner("Key", "Key", join_type="inner")
+    result = joiner.join(left, right)
+    assert_frame_identical(result, reference_join(left, right, "Key", "Key", "inner"))
+    # NaN kiri cocok dengan "nan" hasil astype(str), bukan dengan None ("none")
+    assert result["Value"].tolist() == [1, 3, 4]
+    assert DataFrameJoiner("Key", "Key", join_type="inner", match_case=True).join(left, right)["Value"].tolist() == [1, 2]
+
+
+def test_prepared_join_is_reusable_and_leaves_inputs_untouched():
+    left_a, right = random_frames(1, same_key=False)
+    left_b, _ = random_frames(2, same_key=False)
+    originals = [frame.copy() for frame in (left_a, left_b, right)]
+    joiner = DataFrameJoiner("Key", "Code", columns_to_add=["Price"], target_column_names={"Price": "Harga"})
+    prepared = joiner.prepare(right)
+    assert isinstance(prepared, PreparedJoin)
+    for left in (left_a, left_b):
+        assert_frame_identical(joiner.join(left, prepared), joiner.join(left, right))
+    for frame, original in zip((left_a, left_b, right), originals):
+        assert_frame_identical(frame, original)
+    assert "Harga" in joiner.join(left_a, prepared).columns
+
+
+def test_join_validates_columns():
+    left = pd.DataFrame({"Key": ["a"]})
+    right = pd.DataFrame({"Code": ["a"], "Price": [1]})
+    with pytest.raises(ValueError):
+        DataFrameJoiner("Missing", "Code").join(left, right)
+    with pytest.raises(ValueError):
+        DataFrameJoiner("Key", "Missing").prepare(right)
+    with pytest.raises(ValueError):
+        DataFrameJoiner("Key", "Code", columns_to_add=["Missing"]).prepare(right)
+
+
+def test_normalized_key_index_matches_lowercase_comparison():
+    keys = pd.Series(KEY_POOL * 2, dtype=object)
+    index = NormalizedKeyIndex(keys)
+    for value in ["abc", "ABC", " abc", "nan", "none", "1", "1.0", "strasse", "missing"]:
+        expected = np.flatnonzero((keys.astype(str).str.lower() == value.lower()).to_numpy())
+        assert index.positions(value).tolist() == expected.tolist()
+        assert index.contains(value) == bool(len(expected))
+
+
+def test_normalized_key_index_strip_and_match_case():
+    keys = pd.Series(["Abc", " abc ", "ABC", None], dtype=object)
+    assert NormalizedKeyIndex(keys).positions("abc").tolist() == [0, 2]
+    assert NormalizedKeyIndex(keys, strip=True).positions(" ABC").tolist() == [0, 1, 2]
+    assert NormalizedKeyIndex(keys, match_case=True).positions("Abc").tolist() == [0]
+    assert NormalizedKeyIndex(keys, match_case=True).lookup(["abc"]).tolist() == [NormalizedKeyIndex.MISSING]
+
+
+def test_normalized_key_index_arrow_column_matches_object_column():
+    values = ["Abc", None, "x", "ABC", "<NA>"]
+    object_index = NormalizedKeyIndex(pd.Series([pd.NA if v is None else v for v in values], dtype=object))
+    arrow_index = NormalizedKeyIndex(pd.Series(values, dtype="string[pyarrow]"))
+    assert arrow_index.codes.tolist() == object_index.codes.tolist()
+    assert arrow_index.lookup(["abc", "<na>", "y"]).tolist() == object_index.lookup(["abc", "<na>", "y"]).tolist()
@@ -0,0 +1,73 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from config import BOQ_VALIDATION_COL, SO_VALIDATION_COL
+from df_transformation import df_base
+from df_transformation.transform_memo import MEMO
+from tests.conftest import REPO_ROOT
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Artifact df_base ditulis ke temp/artifacts/ relatif terhadap folder sementara."""
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("temp", exist_ok=True)
+    MEMO.clear()
+    yield tmp_path
+    MEMO.clear()
+
+
+def reference_single_product(boq_df, so_df, product_col):
+    """Pencocokan Single Product versi lama (iterrows BoQ untuk setiap baris SO) sebagai acuan."""
+    expected = [None] * len(boq_df)
+    for _, row in so_df.iterrows():
+        bom_line_value = row[SO_VALIDATION_COL]
+        if pd.isna(bom_line_value) or (isinstance(bom_line_value, str) and bom_line_value.strip() == ""):
+            product = row[product_col]
+            if pd.notna(product) and (not isinstance(product, str) or product.strip() != ""):
+                for position, description in enumerate(boq_df[BOQ_VALIDATION_COL]):
+                    if (pd.notna(description) and isinstance(description, str) and isinstance(product, str)
+                            and description.lower().strip() == product.lower().strip()):
+                        expected[position] = product
+    return expected
+
+
+def synthetic_frames():
+    descriptions = ["Kabel NYY", " kabel nyy ", "STRASSE", "Straße", "nan", 123, "Panel LVMDP", "ǅ item", "Panel lvmdp"]
+    boq_df = pd.DataFrame({
+        "No": list(range(1, len(descriptions) + 1)),
+        BOQ_VALIDATION_COL: pd.Series(descriptions, dtype=object),
+        "Qty.": [1] * len(descriptions),
+        "Satuan": ["m"] * len(descriptions),
+    })
+    so_df = pd.DataFrame({
+        "Product": pd.Series(["KABEL nyy", "straße", "nan", "123", "panel lvmdp ", "ǆ ITEM", "Panel LVMDP", "Set A", None], dtype=object),
+        SO_VALIDATION_COL: pd.Series([None, "", None, np.nan, None, None, "  ", "Kabel NYY", None], dtype=object),
+        "Unit of Measure": ["m", "m", "pcs", "pcs", "set", "set", "set", "m", None],
+    })
+    return boq_df, so_df
+
+
+def test_single_product_matches_reference_on_tricky_keys(workdir):
+    boq_df, so_df = df_base.transform_and_save.__wrapped__(*synthetic_frames())
+    actual = boq_df["Single Product"].tolist()
+    assert actual == reference_single_product(boq_df, so_df, "Product")
+    # lower + strip (bukan casefold): "STRASSE" tidak cocok dengan "straße"; cell angka 123 tidak pernah cocok
+    # (juga tidak dengan product "nan"), teks "nan" cocok dengan product "nan"
+    assert dict(zip(boq_df[BOQ_VALIDATION_COL], actual)) == {
+        "Kabel NYY": "KABEL nyy", " kabel nyy ": "KABEL nyy", "STRASSE": None, "Straße": "straße",
+        "nan": "nan", 123: None, "Panel LVMDP": "Panel LVMDP", "ǅ item": "ǆ ITEM", "Panel lvmdp": "Panel LVMDP",
+    }
+
+
+@pytest.mark.parametrize("so_name", ["convert to SO.xlsx", "convert to SO - UoM error.xlsx", "convert to SO - UoM fix.xlsx"])
+def test_single_product_matches_reference_on_sample_workbooks(workdir, so_name):
+    from ETL_library.extract import create_extractor
+
+    boq_df, _ = create_extractor(os.path.join(REPO_ROOT, "docs", "BoQ.xlsx"), 0, 12, 13).extract()
+    so_df, _ = create_extractor(os.path.join(REPO_ROOT, "docs", so_name), 0, 1, 2).extract()
+    result_boq, result_so = df_base.transform_and_save.__wrapped__(boq_df, so_df)
+    assert result_boq["Single Product"].tolist() == reference_single_product(result_boq, result_so, "Product")
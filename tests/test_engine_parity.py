@@ -0,0 +1,89 @@
+import os
+import warnings
+from functools import lru_cache
+
+import openpyxl
+import pytest
+
+from ETL_library.extract import create_extractor
+from tests.conftest import REPO_ROOT, SAMPLE_WORKBOOKS, assert_frame_identical
+
+# Setiap mode dibandingkan dengan ExcelExtractor openpyxl biasa (load penuh) sebagai acuan
+ENGINES = {
+    "streaming": {"streaming": True},
+    "xml": {"engine": "xml"},
+}
+
+WINDOWS = [
+    {},
+    {"header_row": 1, "data_start_row": 2},
+    {"header_row": 12, "data_start_row": 13},
+    {"header_row": 12, "data_start_row": 13, "header_start_col": 2, "header_end_col": 4},
+    {"header_row": 1, "data_start_row": 2, "data_end_row": 20, "auto_detect_range": False},
+    {"auto_detect_range": False},
+    # Jendela kosong (data_start_row melewati data); baris di bawah 1 diuji terpisah
+    {"header_row": 12, "data_start_row": 5000},
+]
+
+BOOK1 = os.path.join(REPO_ROOT, "ETL_library", "Book1.xlsx")
+
+
+def sheet_cases():
+    cases = []
+    for path in SAMPLE_WORKBOOKS:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            workbook = openpyxl.load_workbook(path, read_only=True)
+        cases += [(path, sheet) for sheet in range(len(workbook.sheetnames))]
+        workbook.close()
+    return cases
+
+
+def extract_outcome(source, sheet, window, **options):
+    """Hasil extract() (df, border_info) atau tipe exception-nya."""
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            return create_extractor(source, sheet_name=sheet, **window, **options).extract()
+    except Exception as exc:
+        return type(exc)
+
+
+@lru_cache(maxsize=None)
+def reference_outcome(path, sheet, window_index):
+    """Acuan openpyxl dihitung sekali per jendela dan dipakai bersama oleh semua engine."""
+    return extract_outcome(path, sheet, WINDOWS[window_index])
+
+
+def assert_same_outcome(actual, expected):
+    if isinstance(expected, type) or isinstance(actual, type):
+        assert actual == expected
+        return
+    assert_frame_identical(actual[0], expected[0])
+    assert actual[1] == expected[1]
+
+
+@pytest.mark.parametrize("engine", list(ENGINES))
+@pytest.mark.parametrize("path, sheet", sheet_cases())
+def test_engine_matches_openpyxl(engine, path, sheet):
+    for window_index, window in enumerate(WINDOWS):
+        expected = reference_outcome(path, sheet, window_index)
+        assert_same_outcome(extract_outcome(path, sheet, window, **ENGINES[engine]), expected)
+
+
+@pytest.mark.parametrize("engine", list(ENGINES))
+def test_rows_below_one_raise_like_openpyxl(engine):
+    for window in ({"header_row": 0, "data_start_row": 1}, {"header_row": 1, "data_start_row": 0}):
+        assert extract_outcome(BOOK1, 0, window) is ValueError
+        assert extract_outcome(BOOK1, 0, window, **ENGINES[engine]) is ValueError
+
+
+@pytest.mark.parametrize("engine", list(ENGINES))
+def test_empty_window_keeps_headers(engine):
+    window = {"header_row": 1, "data_start_row": 30, "data_end_row": 20}
+    expected = extract_outcome(BOOK1, 0, window)
+    df, border_info = extract_outcome(BOOK1, 0, window, **ENGINES[engine])
+    assert_same_outcome((df, border_info), expected)
+    assert df.empty
+    assert len(df.columns) > 0
+    assert all(dtype == object for dtype in df.dtypes)
@@ -0,0 +1,90 @@
+import itertools
+import os
+import warnings
+
+import openpyxl
+import pandas as pd
+import pytest
+
+from ETL_library.extract import create_extractor
+from tests.conftest import REPO_ROOT, assert_frame_identical
+
+ENGINES = {
+    "openpyxl": {},
+    "streaming": {"streaming": True},
+    "xml": {"engine": "xml"},
+}
+SO = os.path.join(REPO_ROOT, "docs", "convert to SO.xlsx")
+BOOK1 = os.path.join(REPO_ROOT, "ETL_library", "Book1.xlsx")
+
+
+def make_extractor(source, engine, **window):
+    return create_extractor(source, **window, **ENGINES[engine])
+
+
+def extract_and_chunks(source, engine, chunk_rows, **window):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        expected = make_extractor(source, engine, **window).extract()
+        extractor = make_extractor(source, engine, **window)
+        chunks = list(extractor.iter_chunks(chunk_rows))
+    return expected, extractor, chunks
+
+
+def build_mixed_types_workbook(path):
+    """Kolom yang tipenya berbeda antar chunk: int lalu None, int lalu float, angka lalu teks."""
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(["Qty", "Harga", "Kode", "Catatan"])
+    for row in range(1, 8):
+        sheet.append([row if row < 5 else None, row if row < 4 else row + 0.5, row if row < 6 else f"K-{row}", None])
+    workbook.save(path)
+    return path
+
+
+def assert_same_values(actual, expected):
+    """Nilai per sel sama; NaN/None dianggap sama karena dtype di-infer per chunk."""
+    assert list(actual.columns) == list(expected.columns)
+    assert actual.index.equals(expected.index)
+    assert actual.isna().equals(expected.isna())
+    assert actual.astype(object).where(actual.notna(), None).values.tolist() == \
+        expected.astype(object).where(expected.notna(), None).values.tolist()
+
+
+@pytest.mark.parametrize("engine, chunk_rows", list(itertools.product(ENGINES, [1, 7, 100000])))
+@pytest.mark.parametrize("path, window", [
+    (SO, {"header_row": 1, "data_start_row": 2}),
+    (BOOK1, {"header_row": 1, "data_start_row": 2, "auto_detect_range": False}),
+])
+def test_concat_of_chunks_equals_extract(path, window, engine, chunk_rows):
+    (expected_df, expected_info), extractor, chunks = extract_and_chunks(path, engine, chunk_rows, **window)
+    assert all(list(chunk.columns) == list(expected_df.columns) for chunk in chunks)
+    assert all(len(chunk) <= chunk_rows for chunk in chunks)
+    assert_same_values(pd.concat(chunk.astype(object) for chunk in chunks), expected_df)
+    assert extractor.border_info == expected_info
+    if len(chunks) == 1:
+        assert_frame_identical(chunks[0], expected_df)
+
+
+@pytest.mark.parametrize("engine", list(ENGINES))
+def test_chunks_with_different_inferred_dtypes(tmp_path, engine):
+    path = build_mixed_types_workbook(str(tmp_path / "mixed.xlsx"))
+    window = {"header_row": 1, "data_start_row": 2, "auto_detect_range": False}
+    (expected_df, _), _, chunks = extract_and_chunks(path, engine, 3, **window)
+    assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+    assert_same_values(pd.concat(chunk.astype(object) for chunk in chunks), expected_df)
+
+
+@pytest.mark.parametrize("engine", list(ENGINES))
+def test_empty_window_yields_one_headered_chunk(engine):
+    window = {"header_row": 1, "data_start_row": 30, "data_end_row": 20}
+    (expected_df, _), _, chunks = extract_and_chunks(BOOK1, engine, 5, **window)
+    assert len(chunks) == 1
+    assert chunks[0].empty and len(chunks[0].columns) > 0
+    assert_frame_identical(chunks[0], expected_df)
+
+
+@pytest.mark.parametrize("engine", list(ENGINES))
+def test_chunk_rows_must_be_positive(engine):
+    with pytest.raises(ValueError):
+        next(make_extractor(BOOK1, engine, header_row=1, data_start_row=2).iter_chunks(0))
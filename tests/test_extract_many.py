@@ -0,0 +1,83 @@
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ETL_library.extract import ExtractionCache, create_extractor, extract_many
+from tests.conftest import REPO_ROOT, SAMPLE_WORKBOOKS, assert_frame_identical
+
+SETTINGS = {"header_row": 1, "data_start_row": 2, "engine": "openpyxl"}
+BOQ_SETTINGS = {"header_row": 12, "data_start_row": 13, "streaming": True}
+BOQ = os.path.join(REPO_ROOT, "docs", "BoQ.xlsx")
+SO = os.path.join(REPO_ROOT, "docs", "convert to SO.xlsx")
+
+
+def expected_results(jobs):
+    return [create_extractor(path, sheet_name=sheet, **settings).extract() for path, sheet, settings in jobs]
+
+
+def assert_results_equal(results, expected):
+    assert len(results) == len(expected)
+    for (df, border_info, *_), (expected_df, expected_info) in zip(results, expected):
+        assert_frame_identical(df, expected_df)
+        assert border_info == expected_info
+
+
+def test_serial_results_keep_job_order():
+    jobs = [(path, 0, SETTINGS) for path in reversed(SAMPLE_WORKBOOKS)]
+    assert_results_equal(extract_many(jobs, max_workers=1), expected_results(jobs))
+
+
+def test_thread_pool_executor_with_cache_matches_direct_extraction(tmp_path):
+    jobs = [(BOQ, 0, BOQ_SETTINGS), (SO, 0, {"header_row": 1, "data_start_row": 2, "streaming": True})]
+    expected = expected_results(jobs)
+    cache = ExtractionCache(str(tmp_path / "cache"))
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        miss = extract_many(jobs, cache=cache, with_timing=True, executor=executor)
+        hit = extract_many(jobs, cache=cache, with_timing=True, executor=executor)
+        # executor dari pemanggil tidak di-shutdown oleh extract_many
+        assert executor.submit(lambda: 1).result() == 1
+    assert_results_equal(miss, expected)
+    assert_results_equal(hit, expected)
+    assert all(len(result) == 3 and result[2] >= 0 for result in miss + hit)
+
+
+def test_concurrent_threads_writing_the_same_cache_entry(tmp_path):
+    cache_dir = tmp_path / "cache"
+    cache = ExtractionCache(str(cache_dir))
+    with open(BOQ, "rb") as f:
+        data = f.read()
+    jobs = [(data, 0, dict(BOQ_SETTINGS, file_name="BoQ.xlsx"))] * 6
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        results = extract_many(jobs, cache=cache, executor=executor)
+    assert_results_equal(results, expected_results([(BOQ, 0, BOQ_SETTINGS)]) * 6)
+    assert not [name for name in os.listdir(cache_dir) if name.endswith(".tmp")]
+
+
+def test_file_like_uploads_are_sent_as_bytes_with_their_name():
+    with open(SO, "rb") as f:
+        upload = io.BytesIO(f.read())
+    upload.name = "convert to SO.xlsx"
+    jobs = [(upload, 0, {"header_row": 1, "data_start_row": 2})]
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        results = extract_many(jobs, executor=executor)
+    assert_results_equal(results, expected_results([(SO, 0, {"header_row": 1, "data_start_row": 2})]))
+
+
+def test_process_pool_without_executor(tmp_path):
+    jobs = [(BOQ, 0, BOQ_SETTINGS), (SO, 0, SETTINGS)]
+    assert_results_equal(extract_many(jobs, max_workers=2), expected_results(jobs))
+
+
+def test_csv_jobs_return_empty_border_info(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("a,b\n1,2\n")
+    (df, border_info), = extract_many([(str(path), 0, {})], max_workers=1)
+    assert border_info == {}
+    assert list(df.columns) == ["a", "b"]
+
+
+def test_errors_in_a_job_propagate():
+    with pytest.raises(ValueError):
+        extract_many([(BOQ, 0, {"engine": "missing"})], max_workers=1)
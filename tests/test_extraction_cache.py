@@ -0,0 +1,72 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ETL_library.extract import ExtractionCache, create_extractor
+from tests.conftest import SAMPLE_WORKBOOKS, assert_frame_identical
+
+
+def mixed_frame():
+    """Kolom object campuran/NA yang berubah dtype jika ditulis apa adanya ke Parquet."""
+    columns = {
+        "int_none": [1, None, 2],
+        "float_none": [1.5, None, 2.0],
+        "datetime_none": [datetime.datetime(2024, 1, 1), None, datetime.datetime(2024, 1, 2)],
+        "bool_none": [True, None, False],
+        "text_none": ["a", None, "b"],
+        "text_nan": ["a", np.nan, "b"],
+        "text_mixed_na": ["a", None, np.nan],
+        "text_pd_na": ["a", pd.NA, "b"],
+        "number_text": [1, "Rp -", 2.5],
+        "all_none": [None, None, None],
+    }
+    df = pd.DataFrame({name: pd.Series(values, dtype=object) for name, values in columns.items()})
+    df["float64"] = [1.0, np.nan, 3.0]
+    df["int64"] = [1, 2, 3]
+    df["string"] = pd.Series(["x", None, "z"], dtype="string[pyarrow]")
+    df["datetime64"] = pd.to_datetime(["2024-01-01", None, "2024-01-03"])
+    # Header duplikat harus tetap terjaga
+    df.columns = list(df.columns[:-1]) + ["int64"]
+    return df
+
+
+def test_round_trip_keeps_dtypes_and_values(tmp_path):
+    cache = ExtractionCache(str(tmp_path))
+    df = mixed_frame()
+    border_info = {"rows_with_bottom_border": {3: [1, 2, 3, 4]}, "border_ranges": [3]}
+    cache.put("key", df, border_info)
+    
+    cached_df, cached_info = cache.get("key")
+    assert_frame_identical(cached_df, df)
+    assert cached_info == border_info
+
+
+@pytest.mark.parametrize("column", list(mixed_frame().columns.unique()))
+def test_round_trip_single_column(tmp_path, column):
+    cache = ExtractionCache(str(tmp_path))
+    df = mixed_frame().loc[:, [column]]
+    cache.put("key", df, None)
+    assert_frame_identical(cache.get("key"), df)
+
+
+def test_round_trip_empty_frame(tmp_path):
+    cache = ExtractionCache(str(tmp_path))
+    df = pd.DataFrame(columns=["A", "B"])
+    cache.put("key", df, {})
+    cached_df, _ = cache.get("key")
+    assert_frame_identical(cached_df, df)
+
+
+@pytest.mark.parametrize("path", SAMPLE_WORKBOOKS)
+def test_cache_hit_equals_cache_miss(tmp_path, path):
+    cache = ExtractionCache(str(tmp_path))
+    settings = {"sheet_name": 0, "header_row": 1, "data_start_row": 2}
+    expected_df, expected_info = create_extractor(path, **settings).extract()
+    
+    miss_df, miss_info = cache.extract(path, **settings)
+    hit_df, hit_info = cache.extract(path, **settings)
+    assert_frame_identical(miss_df, expected_df)
+    assert_frame_identical(hit_df, expected_df)
+    assert hit_info == miss_info == expected_info
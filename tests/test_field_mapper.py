@@ -0,0 +1,144 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ETL_library.transform import COLUMN_TRANSFORMS, FieldMapper, register_column_transform
+from ETL_library.utility import ConfigManager
+from tests.conftest import assert_frame_identical
+
+MAPPING = {
+    "Description": "Name",
+    "Qty": "Quantity",
+    "UoM": "Unit of Measure",
+    "Vendor": "Vendors/Display Name",
+}
+
+
+def source_frame():
+    return pd.DataFrame({
+        "Description": [" Kabel NYY ", "V - Pipa", None, "panel lvmdp", 15],
+        "Qty": ["10", "2,5", None, "x", 3],
+        "UoM": ["pcs", "m", "Set", None, "pcs"],
+        "Vendor": [None, "PT A", np.nan, "PT B", None],
+        "Tidak Dipetakan": range(5),
+    }, index=[4, 3, 2, 1, 0])
+
+
+def reference_map_fields(df, mapping, transform_functions=None, default_values=None):
+    """FieldMapper.map_fields versi lama (kolom ditambahkan satu per satu, apply per elemen) sebagai acuan."""
+    transform_functions = transform_functions or {}
+    default_values = default_values or {}
+    result_df = pd.DataFrame()
+    for source_col, target_col in mapping.items():
+        if source_col in df.columns:
+            result_df[target_col] = df[source_col].copy()
+        elif target_col in default_values:
+            result_df[target_col] = default_values[target_col]
+        else:
+            result_df[target_col] = np.nan
+    for target_col, transform_func in transform_functions.items():
+        if target_col in result_df.columns:
+            result_df[target_col] = result_df[target_col].apply(transform_func)
+    for target_col, default_value in default_values.items():
+        if target_col not in result_df.columns:
+            result_df[target_col] = default_value
+    return result_df
+
+
+def strip_cell(value):
+    return value.strip() if isinstance(value, str) else value
+
+
+def upper_cell(value):
+    return value.upper() if isinstance(value, str) else value
+
+
+def test_callables_match_reference_and_are_reported():
+    df = source_frame()
+    transform_functions = {"Name": strip_cell, "Quantity": str, "Tidak Ada": str}
+    default_values = {"Company": "PT. Visiniaga Mitra Kreasindo", "Quantity": 0}
+    mapper = FieldMapper(dict(MAPPING, Missing="Catatan"), transform_functions, default_values)
+    expected = reference_map_fields(df, dict(MAPPING, Missing="Catatan"), transform_functions, default_values)
+    assert_frame_identical(mapper.map_fields(df), expected)
+    assert mapper.fallback_columns == ["Name", "Quantity", "Tidak Ada"]
+
+
+@pytest.mark.parametrize("spec, cell_func", [
+    ("strip", strip_cell),
+    ("upper", upper_cell),
+    ("lower", lambda value: value.lower() if isinstance(value, str) else value),
+    ("title", lambda value: value.title() if isinstance(value, str) else value),
+    ("prefix:V - ", lambda value: value if pd.isna(value) or str(value).startswith("V - ") else f"V - {value}"),
+    (("map", {"pcs": "Units", "m": "Meter"}), lambda value: {"pcs": "Units", "m": "Meter"}.get(value, value)),
+    (("map", '{"pcs": "Units"}'), lambda value: {"pcs": "Units"}.get(value, value)),
+    (("default", "-"), lambda value: "-" if pd.isna(value) else value),
+])
+def test_named_transforms_match_element_wise_callables(spec, cell_func):
+    df = source_frame()
+    for target in MAPPING.values():
+        named = FieldMapper(MAPPING, {target: spec})
+        expected = FieldMapper(MAPPING, {target: cell_func}).map_fields(df)
+        result = named.map_fields(df)
+        assert named.fallback_columns == []
+        assert result[target].astype(object).where(result[target].notna(), None).tolist() == \
+            expected[target].astype(object).where(expected[target].notna(), None).tolist()
+        assert result.index.equals(df.index)
+
+
+def test_numeric_coerces_like_to_numeric_per_cell():
+    result = FieldMapper(MAPPING, {"Quantity": "numeric"}).map_fields(source_frame())
+    expected = pd.Series([pd.to_numeric(value, errors="coerce") for value in source_frame()["Qty"]], dtype=np.float64)
+    assert result["Quantity"].dtype == np.float64
+    assert np.array_equal(result["Quantity"].to_numpy(), expected.to_numpy(), equal_nan=True)
+
+
+def test_step_lists_run_in_order_and_mix_with_callables():
+    df = source_frame()
+    mapper = FieldMapper(MAPPING, {"Name": ["strip", "prefix:V - ", upper_cell], "Unit of Measure": ("map", {"Set": "Units"})})
+    result = mapper.map_fields(df)
+    assert result["Name"].tolist()[:2] == ["V - KABEL NYY", "V - PIPA"]
+    assert mapper.fallback_columns == ["Name"]
+    assert result["Unit of Measure"].tolist() == ["pcs", "m", "Units", None, "pcs"]
+
+
+def test_invalid_specs_raise_value_error():
+    with pytest.raises(ValueError):
+        FieldMapper(MAPPING, {"Name": "tidak_ada"}).map_fields(source_frame())
+    with pytest.raises(ValueError):
+        FieldMapper(MAPPING, {"Name": 42}).compile()
+
+
+def test_registered_transform_is_available_by_name():
+    register_column_transform("suffix", lambda suffix: lambda values: values + suffix)
+    try:
+        result = FieldMapper({"UoM": "Unit"}, {"Unit": "suffix:/unit"}).map_fields(source_frame().dropna(subset=["UoM"]))
+        assert result["Unit"].tolist() == ["pcs/unit", "m/unit", "Set/unit", "pcs/unit"]
+    finally:
+        COLUMN_TRANSFORMS.pop("suffix")
+
+
+def test_scalar_defaults_are_broadcast_when_first_source_is_missing():
+    mapper = FieldMapper({"Missing": "Company", "Qty": "Quantity"}, default_values={"Company": "PT A"})
+    result = mapper.map_fields(source_frame())
+    assert list(result.columns) == ["Company", "Quantity"]
+    assert result["Company"].tolist() == ["PT A"] * 5
+    assert result.index.equals(source_frame().index)
+
+
+def test_mapping_spec_from_csv_compiles_to_named_transforms(tmp_path):
+    path = tmp_path / "mapping.csv"
+    path.write_text(
+        "source_field,target_field,default_value,transform\n"
+        "Description,Name,,strip|prefix:V - \n"
+        "Qty,Quantity,,numeric\n"
+        "Company,Company,PT A,\n",
+        encoding="utf-8"
+    )
+    mapping, default_values, transform_functions = ConfigManager.load_mapping_spec(str(path))
+    assert transform_functions == {"Name": ["strip", "prefix:V - "], "Quantity": ["numeric"]}
+    assert ConfigManager.load_mapping(str(path)) == (mapping, default_values)
+    mapper = FieldMapper(mapping, transform_functions, default_values)
+    result = mapper.map_fields(source_frame())
+    assert mapper.fallback_columns == []
+    assert result["Name"].tolist() == ["V - Kabel NYY", "V - Pipa", None, "V - panel lvmdp", "V - 15"]
+    assert result["Company"].tolist() == ["PT A"] * 5
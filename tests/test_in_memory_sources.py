@@ -0,0 +1,92 @@
+import io
+import os
+import warnings
+
+import pytest
+
+from ETL_library.extract import create_extractor
+from tests.conftest import REPO_ROOT, assert_frame_identical
+
+ENGINES = {
+    "openpyxl": {},
+    "streaming": {"streaming": True},
+    "xml": {"engine": "xml"},
+}
+SO = os.path.join(REPO_ROOT, "docs", "convert to SO.xlsx")
+BOOK1 = os.path.join(REPO_ROOT, "ETL_library", "Book1.xlsx")
+WINDOW = {"header_row": 1, "data_start_row": 2}
+
+
+def read_bytes(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def extract(source, engine, **options):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return create_extractor(source, **WINDOW, **options, **ENGINES[engine]).extract()
+
+
+def uploaded(path):
+    """File-like seperti UploadedFile Streamlit: punya .name dan posisi baca sudah di akhir."""
+    upload = io.BytesIO(read_bytes(path))
+    upload.name = os.path.basename(path)
+    upload.read()
+    return upload
+
+
+@pytest.mark.parametrize("engine", list(ENGINES))
+@pytest.mark.parametrize("path", [SO, BOOK1])
+def test_bytes_and_file_like_match_path(engine, path):
+    expected_df, expected_info = extract(path, engine)
+    name = os.path.basename(path)
+    for source, options in [
+        (read_bytes(path), {"file_name": name}),
+        (bytearray(read_bytes(path)), {"file_name": name}),
+        (uploaded(path), {}),
+    ]:
+        df, border_info = extract(source, engine, **options)
+        assert_frame_identical(df, expected_df)
+        assert border_info == expected_info
+
+
+@pytest.mark.parametrize("engine", list(ENGINES))
+def test_same_upload_can_be_extracted_twice(engine):
+    upload = uploaded(SO)
+    first, _ = extract(upload, engine)
+    second, _ = extract(upload, engine)
+    assert_frame_identical(first, second)
+
+
+def test_bytes_without_file_name_raise_value_error():
+    with pytest.raises(ValueError):
+        create_extractor(read_bytes(SO))
+
+
+@pytest.mark.parametrize("engine", list(ENGINES))
+def test_sheet_listing_reuses_the_extraction_handle(engine):
+    upload = uploaded(BOOK1)
+    extractor = create_extractor(upload, sheet_name=0, **WINDOW, **ENGINES[engine])
+    names = extractor.list_sheets()
+    extractor._load_workbook()
+    workbook = extractor.workbook
+    assert extractor.list_sheets() == names
+    if engine != "xml":
+        # Workbook openpyxl yang sudah dibuka dipakai ulang, bukan dibaca ulang dari upload
+        # (engine xml melepas paket zip setelah scan)
+        assert extractor.workbook is workbook
+    df, _ = extractor.extract()
+    assert_frame_identical(df, extract(BOOK1, engine)[0])
+
+
+def test_csv_bytes_and_file_like_match_path(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("kode,nama,qty\nA-1,Kabel,10\nA-2,Pipa,\n", encoding="utf-8")
+    expected = create_extractor(str(path)).extract()
+    upload = io.BytesIO(path.read_bytes())
+    upload.name = "data.csv"
+    assert_frame_identical(create_extractor(path.read_bytes(), file_name="data.csv").extract(), expected)
+    assert_frame_identical(create_extractor(upload).extract(), expected)
+    # Header dan data dibaca dari upload yang sama; posisi baca di-reset setiap kali
+    assert_frame_identical(create_extractor(upload).extract(), expected)
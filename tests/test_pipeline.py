@@ -0,0 +1,92 @@
+import tracemalloc
+
+import pandas as pd
+import pytest
+
+from ETL_library.transform import (
+    ColumnReorderer,
+    DuplicateRestorer,
+    EmptyspaceCleaner,
+    Pipeline,
+    SectionExtractor,
+    StaticFieldAdder,
+    WhitespaceCleaner,
+)
+from tests.conftest import assert_frame_identical
+
+
+def section_frame():
+    return pd.DataFrame({
+        "Product": ["A. CCTV", "Kamera", None, "B. Data", "Kabel", None, None],
+        "Description": ["A. CCTV", "Kamera 2MP", "Kamera 4MP", "B. Data", "UTP Cat6", "Patch cord", "   "],
+        "Qty": [None, 2, 3, None, 10, 5, None],
+        "Empty": [None] * 7,
+    })
+
+
+def make_steps():
+    return [
+        WhitespaceCleaner(threshold=0.9),
+        SectionExtractor("Description", "Section"),
+        EmptyspaceCleaner("Description"),
+        DuplicateRestorer("Product"),
+        StaticFieldAdder({"Company": "PT Contoh"}),
+        ColumnReorderer(["Section", "Product"]),
+    ]
+
+
+def run_chained(df):
+    for step in make_steps():
+        df = getattr(step, Pipeline._step_method_name(step))(df)
+    return df
+
+
+def test_pipeline_matches_chained_transformers():
+    df = section_frame()
+    original = df.copy()
+    result = Pipeline(make_steps()).run(df)
+    assert_frame_identical(result, run_chained(section_frame()))
+    # copy=True (default): input tidak berubah
+    assert_frame_identical(df, original)
+
+
+def test_pipeline_does_not_trace_memory_by_default():
+    pipeline = Pipeline(make_steps())
+    assert pipeline.track_memory is False
+    pipeline.run(section_frame())
+    assert not tracemalloc.is_tracing()
+    assert [entry["peak_bytes"] for entry in pipeline.report] == [None] * len(make_steps())
+    assert "MB peak" not in pipeline.format_report()
+
+
+def test_pipeline_track_memory_reports_peaks_and_stops_tracing():
+    pipeline = Pipeline(make_steps(), track_memory=True)
+    pipeline.run(section_frame())
+    assert not tracemalloc.is_tracing()
+    assert all(isinstance(entry["peak_bytes"], int) for entry in pipeline.report)
+    assert "MB peak" in pipeline.format_report()
+
+
+def test_pipeline_leaves_outer_tracing_running():
+    tracemalloc.start()
+    try:
+        Pipeline(make_steps(), track_memory=True).run(section_frame())
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
+def test_pipeline_report_names_steps_and_plain_functions():
+    def drop_qty(df):
+        return df.drop(columns=["Qty"])
+
+    pipeline = Pipeline([WhitespaceCleaner(), drop_qty])
+    result = pipeline.run(section_frame())
+    assert "Qty" not in result.columns
+    assert [entry["step"] for entry in pipeline.report] == ["WhitespaceCleaner", "drop_qty"]
+    assert pipeline.report[-1]["columns"] == len(result.columns)
+
+
+def test_pipeline_rejects_step_without_transform_method():
+    with pytest.raises(ValueError):
+        Pipeline([object()])
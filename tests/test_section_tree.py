@@ -0,0 +1,110 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ETL_library.transform import SectionExtractor, SectionTreeBuilder
+from tests.conftest import assert_frame_identical
+from tests.test_transformer_parity import random_frame
+
+LEVELS = ["Section Level 1", "Section Level 2", "Section Level 3"]
+
+
+def boq_frame():
+    return pd.DataFrame({
+        "No": ["A", "A.1", 1, 2, "A.2", 1, "B", "B.1", "B.1.1", 1, 2, None],
+        "Deskripsi": [
+            "CCTV", "Cabling", "Kabel UTP", "Konektor", "Kamera", "Kamera dome",
+            "DATA", "Tray", "Tray 100", "Tray lurus", "Tray siku", "Catatan",
+        ],
+        "Qty": [None, None, 100, 20, None, 4, None, None, None, 10, 5, None],
+        "Satuan": [None, None, "m", "pcs", None, "unit", None, None, None, "m", "pcs", None],
+        "Harga": [None, None, 1.5, 2.0, None, 3.0, None, None, None, 4.0, 5.0, None],
+        "Total": [None, None, 150.0, 40.0, None, 12.0, None, None, None, 40.0, 25.0, None],
+        "Keterangan": [None] * 12,
+    })
+
+
+def test_levels_from_numbering_column():
+    builder = SectionTreeBuilder("Deskripsi")
+    result = builder.build(boq_frame())
+    assert result["Deskripsi"].tolist() == ["Kabel UTP", "Konektor", "Kamera dome", "Tray lurus", "Tray siku"]
+    assert result[LEVELS].values.tolist() == [
+        ["CCTV", "Cabling", None],
+        ["CCTV", "Cabling", None],
+        ["CCTV", "Kamera", None],
+        ["DATA", "Tray", "Tray 100"],
+        ["DATA", "Tray", "Tray 100"],
+    ]
+    assert builder.section_index == {
+        ("CCTV",): [(0, 3)],
+        ("CCTV", "Cabling"): [(0, 2)],
+        ("CCTV", "Kamera"): [(2, 3)],
+        ("DATA",): [(3, 5)],
+        ("DATA", "Tray"): [(3, 5)],
+        ("DATA", "Tray", "Tray 100"): [(3, 5)],
+    }
+    assert builder.get_rows(result, ("CCTV",))["Deskripsi"].tolist() == ["Kabel UTP", "Konektor", "Kamera dome"]
+    assert builder.get_rows(result, ("DATA", "Tray"))["Deskripsi"].tolist() == ["Tray lurus", "Tray siku"]
+    assert builder.get_rows(result, ("Tidak Ada",)).empty
+
+
+def test_higher_level_section_resets_lower_levels():
+    df = boq_frame()
+    result = SectionTreeBuilder("Deskripsi", remove_section_rows=False).build(df)
+    assert len(result) == len(df)
+    # Baris section "DATA" (level 1) mengosongkan level 2 dan 3 dari section sebelumnya
+    assert result.loc[6, LEVELS].tolist() == ["DATA", None, None]
+    # Baris tanpa nomor dengan sekitar kosong adalah section level 1 baru
+    assert result.loc[10, LEVELS].tolist() == ["DATA", "Tray", "Tray 100"]
+    assert result.loc[11, LEVELS].tolist() == ["Catatan", None, None]
+
+
+def test_levels_from_label_prefix_and_excel_numbers():
+    df = pd.DataFrame({
+        "No": [None, None, 1, 1.0, 1.1, 7, None],
+        "Deskripsi": ["A. CCTV", "A.1 Cabling", "Kabel", "Pekerjaan", "Sub pekerjaan", "Item", "B.2.1. Rak"],
+        "Qty": [None, None, 10, None, None, 3, None],
+        "Satuan": [None, None, "m", None, None, "unit", None],
+        "Harga": [None, None, 2.0, None, None, 5.0, None],
+        "Keterangan": [None] * 7,
+    })
+    builder = SectionTreeBuilder("Deskripsi", remove_section_rows=False)
+    result = builder.build(df)
+    # "A. CCTV" tidak bertitik-segmen -> level 1; "A.1 Cabling" -> level 2; angka 1.1 -> level 2;
+    # section level 3 hanya mengganti level 3, level di atasnya tetap
+    assert result[LEVELS].values.tolist() == [
+        ["A. CCTV", None, None],
+        ["A. CCTV", "A.1 Cabling", None],
+        ["A. CCTV", "A.1 Cabling", None],
+        ["Pekerjaan", None, None],
+        ["Pekerjaan", "Sub pekerjaan", None],
+        ["Pekerjaan", "Sub pekerjaan", None],
+        ["Pekerjaan", "Sub pekerjaan", "B.2.1. Rak"],
+    ]
+
+
+@pytest.mark.parametrize("remove_section_rows", [True, False])
+@pytest.mark.parametrize("seed", range(30))
+def test_single_level_matches_section_extractor(seed, remove_section_rows):
+    """Tanpa penomoran bertingkat, level 1 sama dengan kolom section SectionExtractor."""
+    pool = [None, np.nan, "", "  ", "\t", "A", "Kabel NYY", " item ", 0, 1, True]
+    df = random_frame(seed, pool=pool, weights=[0.12] * 5 + [0.4 / 6] * 6)
+    expected = SectionExtractor(df.columns[0], "Section", remove_section_rows).extract(df)
+    builder = SectionTreeBuilder(df.columns[0], level_col_prefix="Section", remove_section_rows=remove_section_rows)
+    result = builder.build(df)
+    if "Section1" in result.columns:
+        result = result.rename(columns={"Section1": "Section"})
+    else:
+        result["Section"] = None
+    assert_frame_identical(result, expected)
+
+
+def test_input_untouched_and_missing_columns_rejected():
+    df = boq_frame()
+    original = df.copy()
+    SectionTreeBuilder("Deskripsi").build(df)
+    assert_frame_identical(df, original)
+    with pytest.raises(ValueError):
+        SectionTreeBuilder("Uraian").build(df)
+    with pytest.raises(ValueError):
+        SectionTreeBuilder("Deskripsi", numbering_col="Nomor").build(df)
@@ -0,0 +1,67 @@
+import io
+import warnings
+
+import openpyxl
+import pytest
+from openpyxl.chart import BarChart, Reference
+
+from ETL_library.extract import _XlsxPackage, list_sheet_names
+from tests.conftest import SAMPLE_WORKBOOKS
+
+
+def openpyxl_sheet_names(source):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        workbook = openpyxl.load_workbook(source, read_only=True)
+    try:
+        return workbook.sheetnames
+    finally:
+        workbook.close()
+
+
+def build_mixed_workbook(path):
+    """Worksheet, chartsheet, sheet tersembunyi, dan urutan sheet berbeda dari urutan pembuatan."""
+    workbook = openpyxl.Workbook()
+    workbook.active.title = "Data"
+    workbook.create_sheet("Ringkasan & Total")
+    # openpyxl gagal membaca chartsheet tanpa drawing, jadi chartsheet diberi grafik
+    chart = BarChart()
+    chart.add_data(Reference(workbook.active, min_col=1, min_row=1, max_row=3))
+    workbook.create_chartsheet("Grafik").add_chart(chart)
+    hidden = workbook.create_sheet("Tersembunyi")
+    hidden.sheet_state = "hidden"
+    workbook.create_sheet("Lampiran 'A'")
+    workbook.move_sheet("Lampiran 'A'", offset=-3)
+    workbook.save(path)
+    return path
+
+
+@pytest.mark.parametrize("path", SAMPLE_WORKBOOKS)
+def test_sample_workbooks_match_openpyxl(path):
+    assert list_sheet_names(path) == openpyxl_sheet_names(path)
+
+
+def test_chartsheets_hidden_and_reordered_sheets(tmp_path):
+    path = build_mixed_workbook(str(tmp_path / "mixed.xlsx"))
+    expected = openpyxl_sheet_names(path)
+    assert expected == ["Data", "Lampiran 'A'", "Ringkasan & Total", "Grafik", "Tersembunyi"]
+    assert list_sheet_names(path) == expected
+
+
+def test_bytes_and_file_like_sources(tmp_path):
+    path = build_mixed_workbook(str(tmp_path / "mixed.xlsx"))
+    with open(path, "rb") as f:
+        data = f.read()
+    upload = io.BytesIO(data)
+    upload.read()
+    assert list_sheet_names(data) == list_sheet_names(upload) == list_sheet_names(path)
+
+
+def test_listing_does_not_read_styles_or_shared_strings(tmp_path):
+    path = build_mixed_workbook(str(tmp_path / "mixed.xlsx"))
+    package = _XlsxPackage(path)
+    try:
+        assert package.sheet_names == openpyxl_sheet_names(path)
+        assert package._styles is None and package._shared_strings is None
+    finally:
+        package.close()
@@ -0,0 +1,126 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ETL_library.transform import TextPrefixFormatter, normalize_text_prefix
+
+PREFIX = "V - "
+CELL_POOL = [None, np.nan, "", "  ", "Kabel", " Kabel NYY ", "V - Pipa", "V -Pipa", "v - pipa", "Panel V - A", 12, 3.5, True]
+
+
+def random_column(seed, dtype=object):
+    rng = np.random.default_rng(seed)
+    values = [CELL_POOL[i] for i in rng.integers(0, len(CELL_POOL), int(rng.integers(0, 30)))]
+    if dtype != object:
+        values = [value if isinstance(value, str) or pd.isna(value) else str(value) for value in values]
+    return pd.Series(values, dtype=dtype, index=rng.permutation(len(values)) * 10)
+
+
+def assert_same_cells(actual, expected):
+    """Index dan isi sama per cell (tipe Python ikut dicek); semua jenis NA dianggap sama."""
+    assert actual.index.equals(expected.index)
+    for left, right in zip(actual.tolist(), expected.tolist()):
+        if pd.isna(left) and not isinstance(left, str):
+            assert pd.isna(right) and not isinstance(right, str)
+        else:
+            assert type(left) is type(right) and left == right
+
+
+# Aturan per-element lama di setiap call site, sebagai acuan
+def old_text_prefix_formatter(value, skip_na=True):
+    if pd.isna(value):
+        return value if skip_na else PREFIX
+    text = str(value).strip()
+    return text if text.startswith(PREFIX) else PREFIX + text
+
+
+def old_bill_of_material(value):
+    if not pd.isna(value) and not str(value).startswith(PREFIX):
+        return f"{PREFIX}{value}"
+    return value
+
+
+def old_sales_order(value):
+    if not pd.isna(value) and not str(value).strip().startswith(PREFIX):
+        return PREFIX + str(value).strip()
+    return value
+
+
+def old_product_variant(value):
+    if pd.notna(value) and isinstance(value, str) and not value.startswith(PREFIX):
+        return f"{PREFIX}{value}"
+    return value
+
+
+@pytest.mark.parametrize("skip_na", [True, False])
+@pytest.mark.parametrize("seed", range(30))
+def test_text_prefix_formatter_matches_apply(seed, skip_na):
+    df = pd.DataFrame({"skills": random_column(seed)})
+    df["level"] = range(len(df))
+    result = TextPrefixFormatter("skills", PREFIX, skip_na=skip_na).transform(df)
+    assert_same_cells(result["skills"], df["skills"].map(lambda value: old_text_prefix_formatter(value, skip_na)))
+    assert result["level"].tolist() == df["level"].tolist()
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_call_site_rules_match_old_loops(seed):
+    values = random_column(seed)
+    assert_same_cells(normalize_text_prefix(values, PREFIX), values.map(old_bill_of_material))
+    assert_same_cells(normalize_text_prefix(values, PREFIX, strings_only=True), values.map(old_product_variant))
+    # SO: deskripsi ber-prefix dengan whitespace di sekitarnya kini di-strip (dicek terpisah di bawah)
+    prefixed_with_padding = values.map(lambda value: isinstance(value, str) and value != value.strip() and value.strip().startswith(PREFIX))
+    kept = values[~prefixed_with_padding.astype(bool)]
+    assert_same_cells(normalize_text_prefix(kept, PREFIX, strip=True), kept.map(old_sales_order))
+
+
+def test_sales_order_strips_prefixed_descriptions():
+    values = pd.Series(["  V - Pipa ", "Kabel ", None])
+    assert normalize_text_prefix(values, PREFIX, strip=True).tolist() == ["V - Pipa", "V - Kabel", None]
+
+
+@pytest.mark.parametrize("dtype", ["string", "string[pyarrow]"])
+@pytest.mark.parametrize("seed", range(10))
+def test_string_columns_keep_dtype_and_match_object_columns(seed, dtype):
+    values = random_column(seed, dtype)
+    as_object = values.astype(object).where(values.notna(), None)
+    for options in [{}, {"strip": True}, {"skip_na": False}, {"strip": True, "skip_na": False}]:
+        result = normalize_text_prefix(values, PREFIX, **options)
+        assert result.dtype == values.dtype
+        expected = normalize_text_prefix(as_object, PREFIX, **options)
+        assert_same_cells(result.astype(object).where(result.notna(), None), expected)
+
+
+def test_input_is_not_modified():
+    values = pd.Series(["Kabel", None, "V - Pipa", 5], dtype=object)
+    original = values.copy()
+    normalize_text_prefix(values, PREFIX, strip=True, skip_na=False)
+    assert values.equals(original) and values.tolist()[3] == 5
+
+
+def test_sales_order_transform_strips_prefixed_descriptions(tmp_path, monkeypatch):
+    import contextlib
+    import io
+    import os
+
+    from df_transformation import df_base, df_SalesOrder
+    from df_transformation.transform_memo import MEMO
+
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("temp", exist_ok=True)
+    MEMO.clear()
+    boq_df = pd.DataFrame({
+        "Product": ["Set A", "Set A"],
+        "Line Total": [10.0, 20.0],
+        "Description - Item yang Ditawarkan": ["  V - Pipa ", "Kabel "],
+        "Single Product": ["Pipa", "Kabel"],
+        "Qty.": [1, 2],
+        "Unit Price": [10.0, 10.0],
+    })
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            df_base.save_data(boq_df, boq_df.iloc[:0])
+            df_so = df_SalesOrder.transform.__wrapped__()
+    finally:
+        MEMO.clear()
+    # Versi lama membiarkan "  V - Pipa " apa adanya karena prefix sudah ada; sekarang ikut di-strip
+    assert df_so["Description"].tolist()[1:] == ["V - Pipa", "V - Kabel"]
@@ -0,0 +1,193 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from df_transformation.artifact_store import ArtifactStore
+from df_transformation.transform_memo import MEMO, TransformMemo, frame_digest, get_memo, memoized
+from tests.conftest import REPO_ROOT, assert_frame_identical
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Path relatif config (temp/, temp/artifacts/) diarahkan ke folder sementara."""
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("temp", exist_ok=True)
+    MEMO.clear()
+    yield tmp_path
+    MEMO.clear()
+
+
+def object_frame(values):
+    return pd.DataFrame({"a": pd.Series(values, dtype=object)})
+
+
+def test_frame_digest_same_content_same_digest():
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", None]})
+    assert frame_digest(df) == frame_digest(df.copy())
+
+
+@pytest.mark.parametrize("left, right", [
+    (object_frame([1, "x"]), object_frame(["1", "x"])),
+    (object_frame([None, "x"]), object_frame([np.nan, "x"])),
+    (object_frame([1, None]), object_frame([1.0, None])),
+    (pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"a": [1.0, 2.0]})),
+    (pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"b": [1, 2]})),
+    (pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"a": [1, 2]}, index=[1, 2])),
+    (pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"a": [2, 1]})),
+])
+def test_frame_digest_distinguishes(left, right):
+    assert frame_digest(left) != frame_digest(right)
+
+
+def test_run_hit_returns_copy_without_recompute():
+    memo = TransformMemo()
+    calls = []
+    
+    def func():
+        calls.append(1)
+        return pd.DataFrame({"a": [1, 2]})
+    
+    first = memo.run("key", func)
+    first.loc[0, "a"] = 99
+    second = memo.run("key", func)
+    assert len(calls) == 1
+    assert second["a"].tolist() == [1, 2]
+    
+    memo.run("other", func)
+    assert len(calls) == 2
+
+
+def test_run_does_not_memoize_none():
+    memo = TransformMemo()
+    calls = []
+    
+    def func():
+        calls.append(1)
+    
+    memo.run("key", func)
+    memo.run("key", func)
+    assert len(calls) == 2
+
+
+def test_run_evicts_least_recently_used():
+    memo = TransformMemo(max_entries=2)
+    for key in ("a", "b", "a", "c"):
+        memo.run(key, lambda: pd.DataFrame({"x": [1]}))
+    assert list(memo._entries) == ["a", "c"]
+
+
+def test_run_restores_overwritten_excel_and_artifact(workdir):
+    memo = TransformMemo()
+    store = ArtifactStore()
+    
+    def make(value):
+        def func():
+            df = pd.DataFrame({"a": [value]})
+            df.to_excel("temp/out.xlsx", index=False)
+            store.write("frame", df)
+            return df
+        return func
+    
+    memo.run("one", make(1), output_path="temp/out.xlsx", output_artifacts={"frame": None})
+    memo.run("two", make(2), output_path="temp/out.xlsx", output_artifacts={"frame": None})
+    assert pd.read_excel("temp/out.xlsx")["a"].tolist() == [2]
+    
+    # Hit untuk "one" memulihkan file Excel dan artifact milik run tersebut
+    memo.run("one", make(1), output_path="temp/out.xlsx", output_artifacts={"frame": None})
+    assert pd.read_excel("temp/out.xlsx")["a"].tolist() == [1]
+    assert store.read("frame")["a"].tolist() == [1]
+
+
+def test_run_restores_excel_written_by_another_memo(workdir):
+    # Dua sesi Streamlit: masing-masing punya memo sendiri tetapi berbagi folder temp/
+    session_a, session_b = TransformMemo(), TransformMemo()
+    
+    def make(value):
+        def func():
+            df = pd.DataFrame({"a": [value]})
+            df.to_excel("temp/out.xlsx", index=False)
+            return df
+        return func
+    
+    session_a.run("a", make(1), output_path="temp/out.xlsx")
+    session_b.run("b", make(2), output_path="temp/out.xlsx")
+    session_a.run("a", make(1), output_path="temp/out.xlsx")
+    assert pd.read_excel("temp/out.xlsx")["a"].tolist() == [1]
+
+
+def test_memoized_keys_on_arguments_settings_and_input_artifacts(workdir):
+    calls = []
+    setting = {"company": "A"}
+    
+    @memoized("test", input_artifacts=("source",), settings=lambda: dict(setting))
+    def transform(df):
+        calls.append(1)
+        return df.assign(total=df["a"] * 2)
+    
+    df = pd.DataFrame({"a": [1, 2]})
+    # Artifact input belum ada: fungsi dijalankan tanpa memo
+    transform(df)
+    transform(df)
+    assert len(calls) == 2
+    
+    ArtifactStore().write("source", pd.DataFrame({"x": [1]}))
+    transform(df)
+    transform(df.copy())
+    assert len(calls) == 3
+    
+    transform(pd.DataFrame({"a": [1, 3]}))
+    assert len(calls) == 4
+    
+    setting["company"] = "B"
+    transform(df)
+    assert len(calls) == 5
+    
+    ArtifactStore().write("source", pd.DataFrame({"x": [2]}))
+    transform(df)
+    assert len(calls) == 6
+
+
+def test_get_memo_outside_streamlit_is_process_memo():
+    assert get_memo() is MEMO
+
+
+def test_excel_bytes_reused_until_frame_changes():
+    memo = TransformMemo()
+    df = pd.DataFrame({"a": [1, 2]})
+    data = memo.excel_bytes(df, engine="openpyxl")
+    assert memo.excel_bytes(df.copy(), engine="openpyxl") is data
+    assert memo.excel_bytes(pd.DataFrame({"a": [1, 3]}), engine="openpyxl") is not data
+
+
+def test_memoized_transforms_match_direct_run(workdir):
+    from ETL_library.extract import create_extractor
+    from df_transformation import df_base, df_BillOfMaterial, df_SalesOrder, df_ProductVariant
+    
+    boq_df, _ = create_extractor(os.path.join(REPO_ROOT, "docs", "BoQ.xlsx"), 0, 12, 13).extract()
+    so_df, _ = create_extractor(os.path.join(REPO_ROOT, "docs", "convert to SO.xlsx"), 0, 1, 2).extract()
+    modules = (df_BillOfMaterial, df_SalesOrder, df_ProductVariant)
+    
+    # Fungsi asli (tanpa memo) sebagai pembanding
+    expected_base = df_base.transform_and_save.__wrapped__(boq_df, so_df)
+    expected = [module.transform.__wrapped__() for module in modules]
+    
+    for _ in range(2):
+        base = df_base.transform_and_save(boq_df, so_df)
+        results = [module.transform() for module in modules]
+        for frame, expected_frame in zip(base, expected_base):
+            assert_frame_identical(frame, expected_frame)
+        for frame, expected_frame in zip(results, expected):
+            assert_frame_identical(frame, expected_frame)
+    assert len(MEMO._entries) == 4
+
+
+def test_bom_company_defaults_without_streamlit(monkeypatch):
+    from config import DEFAULT_SETTINGS
+    from df_transformation import df_BillOfMaterial
+
+    # None di sys.modules membuat import streamlit gagal dengan ImportError
+    monkeypatch.setitem(sys.modules, "streamlit", None)
+    assert df_BillOfMaterial.get_company() == DEFAULT_SETTINGS["company"]
@@ -0,0 +1,323 @@
+import itertools
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ETL_library.transform import DuplicateRestorer, DuplicateSuppressor, SectionExtractor, WhitespaceCleaner, empty_mask
+from tests.conftest import assert_frame_identical
+
+# Nilai acak untuk cell object: NA, string kosong/whitespace, teks, dan angka
+CELL_POOL = [None, np.nan, "", "  ", "\t\n", "A", "Kabel NYY", " item ", 0, 1, 2.5, True]
+
+
+def random_frame(seed, n_rows=None, n_cols=None, pool=CELL_POOL, weights=None):
+    rng = np.random.default_rng(seed)
+    n_rows = int(rng.integers(0, 25)) if n_rows is None else n_rows
+    n_cols = int(rng.integers(1, 7)) if n_cols is None else n_cols
+    # Sebagian frame didominasi cell kosong agar threshold baris/kolom ikut teruji
+    if weights is None:
+        empty_weight = rng.uniform(0.1, 0.9)
+        weights = [empty_weight / 5] * 5 + [(1 - empty_weight) / (len(pool) - 5)] * (len(pool) - 5)
+    data = {
+        f"Kolom {col}": pd.Series(
+            [pool[i] for i in rng.choice(len(pool), size=n_rows, p=weights)], dtype=object
+        )
+        for col in range(n_cols)
+    }
+    return pd.DataFrame(data)
+
+
+SEEDS = range(40)
+
+
+def reference_whitespace_clean(df, clean_rows=True, clean_cols=True, threshold=0.9):
+    """WhitespaceCleaner.clean versi lama (apply per baris dan per kolom) sebagai acuan."""
+    result_df = df.copy()
+    if clean_rows:
+        row_null_count = result_df.apply(
+            lambda row: row.isna().sum() + sum(1 for x in row if isinstance(x, str) and not x.strip()),
+            axis=1
+        )
+        row_null_percent = row_null_count / len(result_df.columns)
+        result_df = result_df[row_null_percent < threshold]
+    if clean_cols:
+        col_null_count = result_df.apply(
+            lambda col: col.isna().sum() + sum(1 for x in col if isinstance(x, str) and not x.strip()),
+            axis=0
+        )
+        col_null_percent = col_null_count / len(result_df)
+        result_df = result_df.loc[:, col_null_percent < threshold]
+    return result_df.reset_index(drop=True)
+
+
+def test_empty_mask_matches_cell_rule():
+    df = random_frame(0, n_rows=30, n_cols=5)
+    df["Teks"] = pd.Series(["", " ", None, "x"] * 7 + ["y", None], dtype="string")
+    expected = np.array([
+        [pd.isna(x) or (isinstance(x, str) and not x.strip()) for x in row]
+        for row in df.itertuples(index=False)
+    ], dtype=bool)
+    assert np.array_equal(empty_mask(df), expected)
+
+
+@pytest.mark.parametrize("clean_rows, clean_cols, threshold", list(itertools.product([True, False], [True, False], [0.5, 0.9])))
+@pytest.mark.parametrize("seed", SEEDS)
+def test_whitespace_cleaner_matches_reference(seed, clean_rows, clean_cols, threshold):
+    df = random_frame(seed)
+    original = df.copy()
+    cleaner = WhitespaceCleaner(clean_rows=clean_rows, clean_cols=clean_cols, threshold=threshold)
+    expected = reference_whitespace_clean(df, clean_rows, clean_cols, threshold)
+    assert_frame_identical(cleaner.clean(df), expected)
+    assert_frame_identical(df, original)
+    assert_frame_identical(cleaner.clean(df.copy(), copy=False), expected)
+
+
+def test_whitespace_cleaner_string_and_numeric_columns():
+    df = pd.DataFrame({
+        "Nama": pd.Series(["Kabel", "  ", None, "Pipa", ""], dtype="string"),
+        "Qty": [1.0, np.nan, np.nan, 3.0, np.nan],
+        "Kosong": [None] * 5,
+    }, index=[10, 11, 12, 13, 14])
+    assert_frame_identical(WhitespaceCleaner(threshold=0.6).clean(df), reference_whitespace_clean(df, threshold=0.6))
+
+
+def reference_section_extract(df, indicator_col, target_col, remove_section_rows=True):
+    """SectionExtractor.extract versi lama (iterrows) sebagai acuan."""
+    result_df = df.copy()
+    result_df[target_col] = None
+    indicator_idx = df.columns.get_loc(indicator_col)
+    current_section = None
+    section_rows = []
+    for idx, row in result_df.iterrows():
+        value = row[indicator_col]
+        is_value_present = isinstance(value, str) and value.strip() != "" or (not pd.isna(value) and value is not None)
+        has_empty_surroundings = True
+        if indicator_idx > 0:
+            left_value = row.iloc[indicator_idx - 1]
+            if isinstance(left_value, str) and left_value.strip() != "" or (not pd.isna(left_value) and left_value is not None):
+                has_empty_surroundings = False
+        if indicator_idx < len(row) - 1:
+            right_value = row.iloc[indicator_idx + 1]
+            if isinstance(right_value, str) and right_value.strip() != "" or (not pd.isna(right_value) and right_value is not None):
+                has_empty_surroundings = False
+        empty_cell_count = sum(1 for x in row if pd.isna(x) or (isinstance(x, str) and not x.strip()))
+        mostly_empty = empty_cell_count >= len(row) * 0.7
+        if is_value_present and has_empty_surroundings and mostly_empty:
+            current_section = value
+            section_rows.append(idx)
+        result_df.at[idx, target_col] = current_section
+    if remove_section_rows and section_rows:
+        result_df = result_df.drop(section_rows)
+    return result_df.reset_index(drop=True)
+
+
+@pytest.mark.parametrize("remove_section_rows", [True, False])
+@pytest.mark.parametrize("seed", SEEDS)
+def test_section_extractor_matches_reference(seed, remove_section_rows):
+    df = random_frame(seed + 1000)
+    indicator_col = df.columns[seed % len(df.columns)]
+    original = df.copy()
+    extractor = SectionExtractor(indicator_col, "Section", remove_section_rows=remove_section_rows)
+    expected = reference_section_extract(df, indicator_col, "Section", remove_section_rows)
+    assert_frame_identical(extractor.extract(df), expected)
+    assert_frame_identical(df, original)
+    assert_frame_identical(extractor.extract(df.copy(), copy=False), expected)
+
+
+def test_section_extractor_boq_layout():
+    df = pd.DataFrame({
+        "No": [None, 1, 2, None, None, 3, None],
+        "Deskripsi": ["A. CCTV", "Kamera", "Kabel", "B. DATA", "  ", "Switch", "C. Kosong"],
+        "Qty": [None, 4, 100, None, None, 2, None],
+        "Satuan": [None, "unit", "m", None, "", "unit", None],
+        "Harga": [None, 1.5, 2.0, None, None, 3.0, None],
+    })
+    expected = reference_section_extract(df, "Deskripsi", "Section")
+    result = SectionExtractor("Deskripsi", "Section").extract(df)
+    assert_frame_identical(result, expected)
+    # Baris berisi whitespace saja juga terdeteksi sebagai section (nilai notna), sama dengan versi lama
+    assert result["Deskripsi"].tolist() == ["Kamera", "Kabel", "Switch"]
+    assert result["Section"].tolist() == ["A. CCTV", "A. CCTV", "  "]
+
+
+def reference_duplicate_suppress(df, columns, group_by, sort_data=True, replacement_value="", compare_suppressed=False):
+    """
+    DuplicateSuppressor.transform versi lama (iloc per baris) sebagai acuan.
+    
+    Versi lama membandingkan dengan baris sebelumnya yang sudah di-suppress sehingga duplikat hanya
+    dikosongkan selang-seling; versi vektor membandingkan nilai asli (compare_suppressed=False).
+    """
+    if len(df) <= 1:
+        return df.copy()
+    result_df = df.copy()
+    if sort_data:
+        result_df = result_df.sort_values(by=group_by).reset_index(drop=True)
+    source = result_df if compare_suppressed else result_df.copy()
+    original_dtypes = {col: result_df[col].dtype for col in columns}
+    for idx in range(1, len(result_df)):
+        same_group = True
+        for col in group_by:
+            current_val = source.iloc[idx][col]
+            prev_val = source.iloc[idx - 1][col]
+            if pd.isna(current_val) and pd.isna(prev_val):
+                continue
+            elif pd.isna(current_val) or pd.isna(prev_val):
+                same_group = False
+                break
+            elif current_val != prev_val:
+                same_group = False
+                break
+        if same_group:
+            for col in columns:
+                current_val = source.iloc[idx][col]
+                prev_val = source.iloc[idx - 1][col]
+                if pd.isna(current_val) or pd.isna(prev_val) or current_val != prev_val:
+                    continue
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore", FutureWarning)
+                    result_df.iloc[idx, result_df.columns.get_loc(col)] = replacement_value
+    if replacement_value == "":
+        for col, dtype in original_dtypes.items():
+            if pd.api.types.is_numeric_dtype(dtype):
+                mask = result_df[col] == ""
+                if mask.any():
+                    result_df.loc[mask, col] = np.nan
+            try:
+                result_df[col] = result_df[col].astype(dtype)
+            except (TypeError, ValueError):
+                pass
+    return result_df
+
+
+def bom_frame(seed):
+    """Frame BoM acak dengan run produk berulang; tipe setiap kolom konsisten agar bisa diurutkan."""
+    rng = np.random.default_rng(seed)
+    n_rows = int(rng.integers(0, 30))
+    pick = lambda values: [values[i] for i in rng.integers(0, len(values), n_rows)]
+    return pd.DataFrame({
+        "Product": pd.Series(pick(["Panel A", "Panel B", "Kabel", None]), dtype=object),
+        "Qty": pd.Series(pick([1, 2]), dtype="int64"),
+        "Harga": pd.Series(pick([1.5, 2.0, np.nan]), dtype="float64"),
+        "Company": pd.Series(pick(["PT A", "PT A", None]), dtype=object),
+        "Komponen": pd.Series(pick(["Baut", "Mur", "", None]), dtype=object),
+    })
+
+
+SUPPRESS_CASES = [
+    (["Product"], None),
+    (["Product", "Qty"], None),
+    (["Qty", "Harga", "Company"], ["Product"]),
+    (["Komponen", "Harga"], ["Product", "Company"]),
+]
+
+
+@pytest.mark.parametrize("replacement_value", ["", None, "-"])
+@pytest.mark.parametrize("sort_data", [True, False])
+@pytest.mark.parametrize("columns, group_by", SUPPRESS_CASES)
+@pytest.mark.parametrize("seed", range(15))
+def test_duplicate_suppressor_matches_reference(seed, columns, group_by, sort_data, replacement_value):
+    df = bom_frame(seed)
+    original = df.copy()
+    suppressor = DuplicateSuppressor(columns, sort_data=sort_data, group_by=group_by, replacement_value=replacement_value)
+    expected = reference_duplicate_suppress(df, columns, group_by or columns, sort_data, replacement_value)
+    assert_frame_identical(suppressor.transform(df), expected)
+    assert_frame_identical(df, original)
+    assert_frame_identical(suppressor.transform(df.copy(), copy=False), expected)
+
+
+def test_duplicate_suppressor_blanks_every_consecutive_duplicate():
+    df = pd.DataFrame({"name": ["alex"] * 3 + ["bob"] * 2, "age": [23] * 3 + [30] * 2, "skills": ["sword", "judo", "knit", "a", "b"]})
+    result = DuplicateSuppressor(["name", "age"]).transform(df)
+    # Sesuai contoh di docstring: semua duplikat berurutan dikosongkan
+    assert result["name"].tolist() == ["alex", "", "", "bob", ""]
+    assert result["age"].isna().tolist() == [False, True, True, False, True]
+    # Versi lama membandingkan dengan baris yang sudah dikosongkan sehingga duplikat ketiga tetap tampil
+    legacy = reference_duplicate_suppress(df, ["name", "age"], ["name", "age"], compare_suppressed=True)
+    assert legacy["name"].tolist() == ["alex", "", "alex", "bob", ""]
+
+
+def reference_duplicate_restore(df, columns, group_by=None, sort_data=True, consider_empty_as_null=True):
+    """DuplicateRestorer.transform versi lama (at/iloc per cell) sebagai acuan."""
+    if len(df) == 0:
+        return df.copy()
+    result_df = df.copy()
+    if sort_data and group_by:
+        result_df = result_df.sort_values(by=group_by).reset_index(drop=True)
+    
+    def is_empty(val):
+        if pd.isna(val):
+            return True
+        return consider_empty_as_null and isinstance(val, str) and val.strip() == ""
+    
+    if group_by:
+        for _, group_df in result_df.groupby(group_by):
+            for col in columns:
+                last_value = next((result_df.at[idx, col] for idx in group_df.index if not is_empty(result_df.at[idx, col])), None)
+                if last_value is None:
+                    continue
+                for idx in group_df.index:
+                    val = result_df.at[idx, col]
+                    if is_empty(val):
+                        result_df.at[idx, col] = last_value
+                    else:
+                        last_value = val
+        return result_df
+    
+    for col in columns:
+        last_value = None
+        change_indices = []
+        prev_non_null = None
+        for idx in range(len(result_df)):
+            val = result_df.iloc[idx][col]
+            if not is_empty(val):
+                if last_value is None:
+                    last_value = val
+                if prev_non_null is not None and val != prev_non_null:
+                    change_indices.append(idx)
+                prev_non_null = val
+        if last_value is None:
+            continue
+        if 0 not in change_indices:
+            change_indices.insert(0, 0)
+        change_indices.append(len(result_df))
+        for start_idx, end_idx in zip(change_indices, change_indices[1:]):
+            first_value = next(
+                (result_df.iloc[idx][col] for idx in range(start_idx, end_idx) if not is_empty(result_df.iloc[idx][col])),
+                None
+            )
+            if first_value is None:
+                continue
+            for idx in range(start_idx, end_idx):
+                if is_empty(result_df.iloc[idx][col]):
+                    result_df.iloc[idx, result_df.columns.get_loc(col)] = first_value
+    return result_df
+
+
+RESTORE_CASES = [
+    (["Product"], None),
+    (["Product", "Harga", "Komponen"], None),
+    (["Harga", "Komponen"], ["Product"]),
+    (["Product", "Komponen"], ["Company", "Qty"]),
+]
+
+
+@pytest.mark.parametrize("consider_empty_as_null", [True, False])
+@pytest.mark.parametrize("sort_data", [True, False])
+@pytest.mark.parametrize("columns, group_by", RESTORE_CASES)
+@pytest.mark.parametrize("seed", range(15))
+def test_duplicate_restorer_matches_reference(seed, columns, group_by, sort_data, consider_empty_as_null):
+    df = bom_frame(seed + 500)
+    original = df.copy()
+    restorer = DuplicateRestorer(columns, sort_data=sort_data, group_by=group_by, consider_empty_as_null=consider_empty_as_null)
+    expected = reference_duplicate_restore(df, columns, group_by, sort_data, consider_empty_as_null)
+    assert_frame_identical(restorer.transform(df), expected)
+    assert_frame_identical(df, original)
+    assert_frame_identical(restorer.transform(df.copy(), copy=False), expected)
+
+
+def test_duplicate_restorer_round_trips_suppressed_frame():
+    df = pd.DataFrame({"name": ["alex"] * 3 + ["bob"] * 2, "age": [23.0] * 3 + [30.0] * 2, "skills": ["sword", "judo", "knit", "a", "b"]})
+    suppressed = DuplicateSuppressor(["name", "age"]).transform(df)
+    assert_frame_identical(DuplicateRestorer(["name", "age"]).transform(suppressed), df)
@@ -0,0 +1,122 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from config import BOQ_VALIDATION_COL, SO_VALIDATION_COL
+from df_transformation import df_base
+from df_transformation.transform_memo import MEMO
+from ETL_library.transform import DuplicateRestorer
+from tests.conftest import REPO_ROOT, assert_frame_identical
+from tests.test_transformer_parity import RESTORE_CASES, bom_frame, reference_duplicate_restore
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Artifact df_base ditulis ke temp/artifacts/ relatif terhadap folder sementara."""
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("temp", exist_ok=True)
+    MEMO.clear()
+    yield tmp_path
+    MEMO.clear()
+
+
+def reference_restore_except(df, columns, skip, group_by=None, sort_data=True):
+    """Restore seluruh frame lalu kembalikan nilai asli baris yang di-skip (cara lama df_base) sebagai acuan."""
+    marked = df.assign(__skip=skip)
+    restored = reference_duplicate_restore(marked, columns, group_by, sort_data)
+    original = reference_duplicate_restore(marked, [], group_by, sort_data) if sort_data and group_by else marked
+    restored.loc[restored["__skip"], columns] = original.loc[original["__skip"], columns]
+    return restored.drop(columns="__skip")
+
+
+def reference_so_restore(so_df, product_column="Product", uom_column="Unit of Measure"):
+    """Langkah 4 df_base versi lama (iterrows untuk mask skip-restore UoM) sebagai acuan."""
+    so_df = reference_duplicate_restore(so_df.copy(), [product_column])
+    if uom_column not in so_df.columns:
+        return so_df
+    mask_skip_restore = pd.Series(False, index=so_df.index)
+    for idx, row in so_df.iterrows():
+        product_val = row.get(product_column, None)
+        bom_val = row.get(SO_VALIDATION_COL, None)
+        if (pd.notna(product_val) and (not isinstance(product_val, str) or product_val.strip() != "")) and \
+        (pd.isna(bom_val) or (isinstance(bom_val, str) and bom_val.strip() == "")):
+            mask_skip_restore[idx] = True
+    if not mask_skip_restore.all():
+        original_uom_values = so_df.loc[mask_skip_restore, uom_column].copy()
+        so_df = reference_duplicate_restore(so_df, [uom_column])
+        so_df.loc[mask_skip_restore, uom_column] = original_uom_values
+    return so_df
+
+
+def plain(df):
+    values = df.astype(object)
+    return values.where(values.notna(), None).values.tolist()
+
+
+@pytest.mark.parametrize("sort_data", [True, False])
+@pytest.mark.parametrize("columns, group_by", RESTORE_CASES)
+@pytest.mark.parametrize("seed", range(15))
+def test_rows_mask_matches_restore_then_put_back(seed, columns, group_by, sort_data):
+    df = bom_frame(seed + 900)
+    skip = np.random.default_rng(seed).random(len(df)) < 0.4
+    original = df.copy()
+    result = DuplicateRestorer(columns, sort_data=sort_data, group_by=group_by).transform(df, rows=~skip)
+    expected = reference_restore_except(df, columns, skip, group_by, sort_data)
+    assert list(result.columns) == list(expected.columns)
+    assert result.index.equals(expected.index)
+    assert plain(result) == plain(expected)
+    assert_frame_identical(df, original)
+
+
+@pytest.mark.parametrize("rows", [np.ones(6, dtype=bool), np.zeros(6, dtype=bool)])
+def test_all_or_no_rows(rows):
+    df = pd.DataFrame({"UoM": ["m", None, " ", "pcs", None, np.nan]})
+    result = DuplicateRestorer(["UoM"]).transform(df, rows=rows)
+    if rows.all():
+        assert_frame_identical(result, DuplicateRestorer(["UoM"]).transform(df))
+    else:
+        assert_frame_identical(result, df)
+
+
+def test_rows_mask_must_match_frame_length():
+    with pytest.raises(ValueError):
+        DuplicateRestorer(["UoM"]).transform(pd.DataFrame({"UoM": ["m", None]}), rows=[True])
+
+
+def so_frame(seed):
+    rng = np.random.default_rng(seed)
+    n_rows = int(rng.integers(1, 30))
+    pick = lambda values: pd.Series([values[i] for i in rng.integers(0, len(values), n_rows)], dtype=object)
+    return pd.DataFrame({
+        "Product": pick(["Panel A", "Set B", " ", None, 7]),
+        SO_VALIDATION_COL: pick(["Kabel", "Baut", "", "  ", None, np.nan]),
+        "Unit of Measure": pick(["m", "pcs", "", None]),
+        "VN": pick(["VN-1", None]),
+    })
+
+
+def boq_frame():
+    return pd.DataFrame({
+        "No": [1, 2, 3],
+        BOQ_VALIDATION_COL: ["Kabel", "Panel A", "Baut"],
+        "Qty.": [1, 2, 3],
+        "Satuan": ["m", "unit", "pcs"],
+    })
+
+
+@pytest.mark.parametrize("seed", range(25))
+def test_so_restore_matches_old_loop(workdir, seed):
+    so_df = so_frame(seed)
+    _, result_so = df_base.transform_and_save.__wrapped__(boq_frame(), so_df)
+    assert plain(result_so) == plain(reference_so_restore(so_df))
+
+
+@pytest.mark.parametrize("so_name", ["convert to SO.xlsx", "convert to SO - UoM error.xlsx", "convert to SO - UoM fix.xlsx"])
+def test_so_restore_matches_old_loop_on_sample_workbooks(workdir, so_name):
+    from ETL_library.extract import create_extractor
+
+    so_df, _ = create_extractor(os.path.join(REPO_ROOT, "docs", so_name), 0, 1, 2).extract()
+    _, result_so = df_base.transform_and_save.__wrapped__(boq_frame(), so_df)
+    assert plain(result_so) == plain(reference_so_restore(so_df))
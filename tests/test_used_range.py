@@ -0,0 +1,102 @@
+import os
+import warnings
+
+import openpyxl
+import pytest
+from openpyxl.styles import PatternFill
+
+from config import DEFAULT_SETTINGS, EXTRACT_OPTIONS
+from ETL_library.extract import _XlsxPackage, create_extractor
+from ETL_library.transform import WhitespaceCleaner
+from tests.conftest import REPO_ROOT, SAMPLE_WORKBOOKS, assert_frame_identical
+
+ENGINES = {
+    "openpyxl": {},
+    "streaming": {"streaming": True},
+    "xml": {"engine": "xml"},
+}
+WINDOW = {"header_row": 1, "data_start_row": 2}
+
+
+def build_inflated_workbook(path):
+    """Nilai hanya di A1:C5, tetapi format kosong membuat dimensi sheet 400 x 40."""
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(["Kode", "Nama", "Qty"])
+    for row in range(2, 6):
+        sheet.append([f"K-{row}", f"Item {row}", row])
+    sheet["E3"] = ""
+    # Sel berisi spasi saja tidak dihitung sebagai nilai
+    sheet["B300"] = "   "
+    fill = PatternFill("solid", fgColor="FFFF00")
+    sheet["AN400"].fill = fill
+    sheet["D200"].number_format = "0.00"
+    workbook.save(path)
+    return path
+
+
+def extract(path, engine, **options):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return create_extractor(path, **options, **ENGINES[engine]).extract()
+
+
+@pytest.mark.parametrize("engine", list(ENGINES))
+def test_trim_is_opt_in(tmp_path, engine):
+    path = build_inflated_workbook(str(tmp_path / "inflated.xlsx"))
+    df, border_info = extract(path, engine, **WINDOW)
+    assert "used_range" not in border_info
+    assert df.shape == (399, 40)
+    assert_frame_identical(df, extract(path, engine, trim_to_used_range=False, **WINDOW)[0])
+
+
+@pytest.mark.parametrize("engine", list(ENGINES))
+def test_trim_clamps_window_to_used_range(tmp_path, engine):
+    path = build_inflated_workbook(str(tmp_path / "inflated.xlsx"))
+    df, border_info = extract(path, engine, trim_to_used_range=True, **WINDOW)
+    assert border_info["used_range"] == {"max_row": 5, "max_col": 3}
+    # Dimensi sheet tetap dilaporkan apa adanya; hanya window yang dipangkas
+    assert (border_info["max_row"], border_info["max_col"]) == (400, 40)
+    explicit, _ = extract(path, "openpyxl", data_end_row=5, header_end_col=3, **WINDOW)
+    assert_frame_identical(df, explicit)
+    assert df.shape == (4, 3)
+
+
+@pytest.mark.parametrize("engine", list(ENGINES))
+def test_explicit_window_is_not_trimmed(tmp_path, engine):
+    path = build_inflated_workbook(str(tmp_path / "inflated.xlsx"))
+    window = dict(WINDOW, data_end_row=10, header_end_col=6)
+    df, border_info = extract(path, engine, trim_to_used_range=True, **window)
+    assert "used_range" not in border_info
+    assert_frame_identical(df, extract(path, engine, **window)[0])
+    assert df.shape == (9, 6)
+
+
+@pytest.mark.parametrize("path", SAMPLE_WORKBOOKS)
+def test_trim_only_drops_blank_cells_on_sample_workbooks(path):
+    df, _ = extract(path, "openpyxl", auto_detect_range=False, **WINDOW)
+    trimmed, border_info = extract(path, "openpyxl", auto_detect_range=False, trim_to_used_range=True, **WINDOW)
+    rows, cols = trimmed.shape
+    assert rows == max(border_info["used_range"]["max_row"] - 1, 0)
+    assert_frame_identical(trimmed, df.iloc[:rows, :cols])
+    # Baris dan kolom yang dipangkas hanya berisi sel kosong
+    dropped = list(df.iloc[rows:].to_numpy().ravel()) + list(df.iloc[:rows, cols:].to_numpy().ravel())
+    assert not any(_XlsxPackage.has_value(value) for value in dropped)
+
+
+@pytest.mark.parametrize("name, key", [
+    ("BoQ.xlsx", "boq"),
+    ("convert to SO.xlsx", "so"),
+    ("convert to SO - UoM fix.xlsx", "so"),
+])
+def test_app_extract_options_keep_cleaned_frame(name, key):
+    settings = DEFAULT_SETTINGS[key]
+    window = {field: settings[field] for field in ("header_row", "data_start_row", "data_end_row")}
+    path = os.path.join(REPO_ROOT, "docs", name)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        trimmed, info = create_extractor(path, **window, **EXTRACT_OPTIONS).extract()
+        untrimmed, _ = create_extractor(path, **window, **dict(EXTRACT_OPTIONS, trim_to_used_range=False)).extract()
+    assert EXTRACT_OPTIONS["trim_to_used_range"] and "used_range" in info
+    cleaner = WhitespaceCleaner(threshold=1)
+    assert_frame_identical(cleaner.clean(trimmed), cleaner.clean(untrimmed))
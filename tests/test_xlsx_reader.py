@@ -0,0 +1,166 @@
+import warnings
+import zipfile
+from datetime import date, datetime, time, timedelta
+
+import openpyxl
+import pytest
+
+from ETL_library.extract import ExcelExtractor, XlsxXmlExtractor, _XlsxPackage, create_extractor
+from tests.conftest import SAMPLE_WORKBOOKS, assert_frame_identical
+
+WINDOWS = [
+    {"header_row": 1, "data_start_row": 2, "auto_detect_range": False},
+    {"header_row": 1, "data_start_row": 2, "data_end_row": 3, "auto_detect_range": False},
+    {"header_row": 2, "data_start_row": 3, "header_start_col": 2, "header_end_col": 3, "auto_detect_range": False},
+    {"auto_detect_range": False},
+]
+
+
+def build_workbook(path):
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "Data"
+    sheet.append(["Nama", "Qty", "Harga", "Tanggal", "Durasi", "Aktif", "Catatan", "Jam"])
+    sheet.append(["Kabel NYY", 10, 1.5, datetime(2024, 1, 31, 8, 30), timedelta(hours=36), True, "", time(7, 15)])
+    sheet.append(["Pipa", -3, 1e-7, date(2024, 2, 1), None, False, "  ", None])
+    sheet.append([None] * 8)
+    # Formula tanpa nilai cache terbaca None (data_only=True)
+    sheet.append(["=A2", "=1+1", 12345678901234, "2024-03-01", None, None, "Rp -", None])
+    sheet["J9"] = "jauh"
+    workbook.create_sheet("Kosong")
+    second = workbook.create_sheet("Kedua")
+    second.append(["A", "B"])
+    second.append(["x", 1])
+    workbook.save(path)
+    return path
+
+
+def extract_outcome(extractor_class, path, sheet, window):
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            return extractor_class(path, sheet_name=sheet, **window).extract()
+    except Exception as exc:
+        return type(exc)
+
+
+def assert_same_outcome(actual, expected):
+    if isinstance(expected, type) or isinstance(actual, type):
+        assert actual == expected
+        return
+    assert_frame_identical(actual[0], expected[0])
+    assert actual[1] == expected[1]
+
+
+@pytest.mark.parametrize("sheet", ["Data", "Kosong", "Kedua", 0, 2])
+def test_generated_workbook_values_match_openpyxl(tmp_path, sheet):
+    path = build_workbook(str(tmp_path / "values.xlsx"))
+    for window in WINDOWS:
+        expected = extract_outcome(ExcelExtractor, path, sheet, window)
+        assert_same_outcome(extract_outcome(XlsxXmlExtractor, path, sheet, window), expected)
+
+
+def test_unknown_sheet_name_raises_key_error(tmp_path):
+    path = build_workbook(str(tmp_path / "values.xlsx"))
+    assert extract_outcome(XlsxXmlExtractor, path, "Tidak Ada", WINDOWS[0]) is KeyError
+    assert extract_outcome(ExcelExtractor, path, "Tidak Ada", WINDOWS[0]) is KeyError
+
+
+MINIMAL_PARTS = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        '</Types>'
+    ),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    ),
+    "xl/workbook.xml": (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<workbookPr date1904="1"/>'
+        '<sheets><sheet name="Inline" sheetId="1" r:id="rId1"/></sheets>'
+        '</workbook>'
+    ),
+    "xl/_rels/workbook.xml.rels": (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+        '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+        '</Relationships>'
+    ),
+    "xl/styles.xml": (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        '<fonts count="1"><font><sz val="11"/></font></fonts>'
+        '<fills count="1"><fill><patternFill patternType="none"/></fill></fills>'
+        '<borders count="1"><border/></borders>'
+        '<cellXfs count="2"><xf numFmtId="0" borderId="0"/><xf numFmtId="14" borderId="0"/></cellXfs>'
+        '</styleSheet>'
+    ),
+    # Tanpa <dimension>, sebagian sel/baris tanpa atribut r, inline string dan rich text
+    "xl/worksheets/sheet1.xml": (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+        '<row r="1"><c r="A1" t="inlineStr"><is><t>Kode</t></is></c>'
+        '<c t="inlineStr"><is><r><t>Na</t></r><r><t>ma</t></r></is></c>'
+        '<c t="inlineStr"><is><t>Tanggal</t></is></c></row>'
+        '<row><c t="inlineStr"><is><t xml:space="preserve"> A-01 </t></is></c>'
+        '<c t="b"><v>1</v></c><c s="1"><v>100</v></c></row>'
+        '<row r="4"><c r="B4" t="str"><v>teks formula</v></c><c r="C4" t="e"><v>#N/A</v></c></row>'
+        '</sheetData></worksheet>'
+    ),
+}
+
+
+def test_hand_written_package_matches_openpyxl(tmp_path):
+    path = str(tmp_path / "inline.xlsx")
+    with zipfile.ZipFile(path, "w") as archive:
+        for name, content in MINIMAL_PARTS.items():
+            archive.writestr(name, content)
+    for window in WINDOWS:
+        expected = extract_outcome(ExcelExtractor, path, 0, window)
+        assert not isinstance(expected, type)
+        assert_same_outcome(extract_outcome(XlsxXmlExtractor, path, 0, window), expected)
+    df, _ = XlsxXmlExtractor(path, header_row=1, data_start_row=2, auto_detect_range=False).extract()
+    assert list(df.columns) == ["Kode", "Nama", "Tanggal"]
+    # date1904: serial 100 = 1904-04-10
+    assert df.iloc[0].tolist() == [" A-01 ", True, datetime(1904, 4, 10)]
+
+
+def test_package_reads_sheets_styles_and_rows_lazily(tmp_path):
+    path = build_workbook(str(tmp_path / "values.xlsx"))
+    package = _XlsxPackage(path)
+    try:
+        assert package.sheet_names == ["Data", "Kosong", "Kedua"]
+        assert package._shared_strings is None and package._styles is None
+        sheet_path = package.sheet_path("Kedua")
+        assert package.sheet_path(2) == sheet_path
+        rows = list(package.iter_rows(sheet_path))
+        assert [(row, [(col, value) for col, value, _ in cells]) for row, cells in rows] == [
+            (1, [(1, "A"), (2, "B")]),
+            (2, [(1, "x"), (2, 1)]),
+        ]
+        # stop_row menghentikan parsing; values=False tidak mengonversi nilai
+        assert [row for row, _ in package.iter_rows(package.sheet_path("Data"), stop_row=2)] == [1, 2]
+        assert all(value is None for _, cells in package.iter_rows(sheet_path, values=False) for _, value, _ in cells)
+        assert package.dimension(package.sheet_path("Data")) == (9, 10)
+    finally:
+        package.close()
+
+
+@pytest.mark.parametrize("path", SAMPLE_WORKBOOKS)
+def test_window_with_data_end_row_stops_early_but_keeps_sheet_size(path):
+    window = {"header_row": 1, "data_start_row": 2, "data_end_row": 10, "auto_detect_range": False}
+    expected = extract_outcome(ExcelExtractor, path, 0, window)
+    assert_same_outcome(extract_outcome(XlsxXmlExtractor, path, 0, window), expected)
+    assert isinstance(create_extractor(path, engine="xml"), XlsxXmlExtractor)